@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Measure the HTML cleanup of the text plugin, as done on every save of a text item.
+
+Usage: ``python benchmarks/clean_html.py [--number=N] [--sanitize]``
+"""
+import sys
+import timeit
+from optparse import OptionParser
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.realpath(__file__))))
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(DEBUG=False)
+
+from html5lib import treebuilders, treewalkers, HTMLParser
+from html5lib.serializer import HTMLSerializer
+from fluent_contents.utils import html as html_utils
+
+# Output of a WYSIWYG editor, including a few errors to correct.
+TEXTITEM_HTML = u"""
+<h2>Opening hours &amp; directions</h2>
+<p>Our office is open from <strong>Monday</strong> to <strong>Friday<em></strong>,&nbsp;9:00&ndash;17:30.</em>
+We're closed on public holidays.<br>
+Please <a href="/contact/?a=1&b=2" title="Contact us">contact us</a> for an appointment.
+<ul>
+    <li>By train: take the <em>Sprinter</em> to Central Station, then walk 5&nbsp;minutes.
+    <li>By car: use the parking garage at the <a href="https://maps.example.com/">Main&nbsp;Street</a>.</li>
+</ul>
+<p><img src="/media/office.jpg" alt="Office" width="400" height="300" style="float: left;"></p>
+<table>
+    <tr><th>Day</th><th>Open</th><th>Close</th></tr>
+    <tr><td>Mon&ndash;Thu</td><td>9:00</td><td>17:30</td></tr>
+</table>
+""" * 3
+
+
+def old_clean_html(input, sanitize=False):
+    """
+    The previous implementation, which creates new html5lib objects for every call.
+    """
+    serializer_kwargs = {'sanitize': True} if sanitize else {}
+    p = HTMLParser(tree=treebuilders.getTreeBuilder("dom"))
+    dom_tree = p.parseFragment(input)
+    walker = treewalkers.getTreeWalker("dom")
+    stream = walker(dom_tree)
+    s = HTMLSerializer(omit_optional_tags=False, **serializer_kwargs)
+    return "".join(s.serialize(stream))
+
+
+def uncached(backend):
+    def clean(input, sanitize=False):
+        html_utils._cleaned_html.clear()
+        return html_utils.clean_html(input, sanitize=sanitize, backend=backend)
+    return clean
+
+
+def main():
+    parser = OptionParser(usage="%prog [--number=N] [--sanitize]")
+    parser.add_option('-n', '--number', type='int', default=200, help="The number of calls per measurement")
+    parser.add_option('--sanitize', action='store_true', default=False, help="Also sanitize the HTML")
+    options, args = parser.parse_args()
+
+    expected = old_clean_html(TEXTITEM_HTML, sanitize=options.sanitize)
+    sys.stdout.write("TextItem ({0} bytes):\n".format(len(TEXTITEM_HTML)))
+    for label, func in (
+        ('new objects per call', old_clean_html),
+        ('reused objects (dom)', uncached('dom')),
+        ('reused objects (etree)', uncached('etree')),
+        ('memoized', html_utils.clean_html),
+    ):
+        if func(TEXTITEM_HTML, sanitize=options.sanitize) != expected:
+            sys.stdout.write("  {0:<24} different output!\n".format(label))
+            continue
+
+        duration = min(timeit.repeat(lambda: func(TEXTITEM_HTML, sanitize=options.sanitize), number=options.number, repeat=3))
+        sys.stdout.write("  {0:<24} {1:8.1f} us/call\n".format(label, duration / options.number * 1000000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Measure the rendering of the markup plugin, as done for every markup item that is not in the output cache.
+
+Usage: ``python benchmarks/markup.py [--number=N]``
+"""
+import sys
+import timeit
+from optparse import OptionParser
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.realpath(__file__))))
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(DEBUG=False, USE_I18N=False, FLUENT_MARKUP_MARKDOWN_EXTRAS=['markdown.extensions.extra'])
+
+from markdown import markdown
+from fluent_contents.plugins.markup import appsettings, backend
+
+TEXTS = {
+    'markdown': u"""
+Opening hours
+=============
+
+Our office is open from **Monday** to **Friday**, 9:00-17:30.
+Please [contact us](/contact/) for an appointment.
+
+* By train: take the *Sprinter* to Central Station.
+* By car: use the parking garage at the [Main Street](https://maps.example.com/).
+
+Day     | Open | Close
+------- | ---- | -----
+Mon-Thu | 9:00 | 17:30
+""" * 3,
+    'restructuredtext': u"""
+Opening hours
+-------------
+
+Our office is open from **Monday** to **Friday**, 9:00-17:30.
+Please `contact us </contact/>`_ for an appointment.
+
+* By train: take the *Sprinter* to Central Station.
+* By car: use the parking garage at the `Main Street <https://maps.example.com/>`_.
+""" * 3,
+    'textile': u"""
+h2. Opening hours
+
+Our office is open from *Monday* to *Friday*, 9:00-17:30.
+Please "contact us":/contact/ for an appointment.
+
+* By train: take the _Sprinter_ to Central Station.
+* By car: use the parking garage at the "Main Street":https://maps.example.com/.
+""" * 3,
+}
+
+
+def old_render_markdown(text):
+    """
+    The previous implementation, which loads the extensions for every call.
+    """
+    return markdown(text, extensions=appsettings.FLUENT_MARKUP_MARKDOWN_EXTRAS)
+
+
+def uncached(text, language):
+    backend._rendered_texts.clear()
+    return backend.SUPPORTED_LANGUAGES[language](text)
+
+
+def memoized(text, language):
+    return backend.render_text(text, language)
+
+
+def main():
+    parser = OptionParser(usage="%prog [--number=N]")
+    parser.add_option('-n', '--number', type='int', default=200, help="The number of calls per measurement")
+    options, args = parser.parse_args()
+    appsettings.FLUENT_MARKUP_CACHE_TIMEOUT = 0  # Only measure the memory.
+
+    for language, text in sorted(TEXTS.items()):
+        sys.stdout.write("{0} ({1} bytes):\n".format(language, len(text)))
+        measurements = [('uncached', uncached), ('memoized', memoized)]
+        if language == 'markdown':
+            measurements.insert(0, ('new converter per call', lambda text, language: old_render_markdown(text)))
+
+        for label, func in measurements:
+            duration = min(timeit.repeat(lambda: func(text, language), number=options.number, repeat=3))
+            sys.stdout.write("  {0:<24} {1:8.1f} us/call\n".format(label, duration / options.number * 1000000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Compare the search text extraction with Django's ``strip_tags()``.
+
+Usage: ``python benchmarks/search_text.py [--number=N]``
+"""
+import sys
+import timeit
+from optparse import OptionParser
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.realpath(__file__))))
+
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(DEBUG=False)
+
+from django.utils.encoding import force_text
+from django.utils.html import strip_tags
+from fluent_contents.utils.search import get_cleaned_string
+
+
+# Output of the text plugin, as written by a WYSIWYG editor.
+TEXTITEM_HTML = u"""
+<h2>Opening hours &amp; directions</h2>
+<p>Our office is open from <strong>Monday</strong> to <strong>Friday</strong>,&nbsp;9:00&ndash;17:30.
+We&rsquo;re closed on public holidays.<br />
+Please <a href="/contact/" title="Contact us">contact us</a> for an appointment.</p>
+<ul>
+    <li>By train: take the <em>Sprinter</em> to Central Station, then walk 5&nbsp;minutes.</li>
+    <li>By car: use the parking garage at the <a href="https://maps.example.com/?q=garage&amp;z=15">Main&nbsp;Street</a>.</li>
+    <li>By bike: there are racks in front of the building.</li>
+</ul>
+<p><img src="/media/office.jpg" alt="Office" width="400" height="300" /></p>
+<table>
+    <tr><th>Day</th><th>Open</th><th>Close</th></tr>
+    <tr><td>Mon&ndash;Thu</td><td>9:00</td><td>17:30</td></tr>
+    <tr><td>Fri</td><td>9:00</td><td>16:00</td></tr>
+</table>
+""" * 4
+
+# Output of the markup plugin, as generated by reStructuredText / Markdown.
+MARKUP_HTML = u"""
+<div class="document">
+<div class="section" id="installation">
+<h1>Installation</h1>
+<p>Install the package using <tt class="docutils literal">pip</tt>:</p>
+<pre class="literal-block">
+pip install example-package
+</pre>
+<p>Add the app to <tt class="docutils literal">INSTALLED_APPS</tt> &mdash; the order doesn&#8217;t matter.
+See the <a class="reference external" href="https://example.com/docs/">documentation</a> for details.</p>
+<blockquote>
+<p>&#8220;Simple things should be simple, complex things should be possible.&#8221;</p>
+</blockquote>
+<script type="text/javascript">
+  var options = {"selector": "pre", "theme": "<default>"};
+  highlight(options);
+</script>
+<style type="text/css">pre { background: #eee; }</style>
+</div>
+</div>
+""" * 4
+
+PAYLOADS = (
+    ('TextItem', TEXTITEM_HTML),
+    ('Markup', MARKUP_HTML),
+)
+
+
+def old_get_cleaned_string(data):
+    """
+    The previous implementation, for comparison.
+    """
+    return strip_tags(force_text(data))
+
+
+def main():
+    parser = OptionParser(usage="%prog [--number=N]")
+    parser.add_option('-n', '--number', type='int', default=2000, help="The number of calls per measurement")
+    options, args = parser.parse_args()
+
+    for name, html in PAYLOADS:
+        sys.stdout.write("{0} ({1} bytes):\n".format(name, len(html)))
+        for label, func in (('strip_tags', old_get_cleaned_string), ('get_cleaned_string', get_cleaned_string)):
+            duration = min(timeit.repeat(lambda: func(html), number=options.number, repeat=3))
+            sys.stdout.write("  {0:<20} {1:8.1f} us/call\n".format(label, duration / options.number * 1000000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+"""
+Measure the indexing speed and query latency of the search index.
+
+Usage: ``python benchmarks/searchindex.py [--pages=N] [--queries=N]``
+
+This uses an in-memory SQLite database, so the FTS5 backend is measured.
+Pass ``--basic`` to compare it with the ``LIKE`` query that other databases use.
+"""
+import random
+import sys
+import time
+from optparse import OptionParser
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.realpath(__file__))))
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        DEBUG=False,
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:'
+            }
+        },
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+            'django.contrib.sites',
+            'fluent_contents',
+            'fluent_contents.plugins.text',
+            'fluent_contents.searchindex',
+            'django_wysiwyg',
+            'fluent_contents.tests.testapp',
+        ),
+        SITE_ID=1,
+        FLUENT_CONTENTS_SEARCHINDEX_AUTO_UPDATE=False,
+    )
+
+django.setup()
+
+from django.core.management import call_command
+from django.db import connection
+from fluent_contents.models import Placeholder
+from fluent_contents.plugins.text.models import TextItem
+from fluent_contents.searchindex import backends, search
+from fluent_contents.searchindex.models import SearchDocument
+from fluent_contents.tests.testapp.models import TestPage
+
+WORDS = (
+    u"about access account address agenda archive article author available background "
+    u"calendar campaign category change chapter contact content country customer delivery "
+    u"department description design details download editor event example feature gallery "
+    u"history holiday image information language location member message network news office "
+    u"opening order overview page partner payment picture policy price product project "
+    u"question recipe report research review schedule search service shipping software "
+    u"subscription support team technology ticket training travel update video website"
+).split()
+
+
+def make_text(rnd, num_paragraphs):
+    return u"".join(
+        u"<p>{0} <strong>{1}</strong> {2}.</p>\n".format(
+            u" ".join(rnd.choice(WORDS) for i in range(12)),
+            rnd.choice(WORDS),
+            u" ".join(rnd.choice(WORDS) for i in range(20)),
+        )
+        for p in range(num_paragraphs)
+    )
+
+
+def main():
+    parser = OptionParser(usage="%prog [--pages=N] [--queries=N] [--basic]")
+    parser.add_option('--pages', type='int', default=1000, help="The number of pages to index")
+    parser.add_option('--queries', type='int', default=200, help="The number of queries to measure")
+    parser.add_option('--basic', action='store_true', default=False, help="Use the LIKE query instead of FTS5")
+    options, args = parser.parse_args()
+
+    call_command('migrate', run_syncdb=True, verbosity=0)
+    if options.basic:
+        backends._backends[connection.alias] = backends.BasicBackend(connection.alias)
+    sys.stdout.write("Backend: {0}\n".format(backends.get_backend(connection.alias).__class__.__name__))
+
+    rnd = random.Random(1)
+    for pk in range(1, options.pages + 1):
+        page = TestPage.objects.create(pk=pk, contents="Page {0}".format(pk))
+        placeholder = Placeholder.objects.create_for_object(page, 'main')
+        for sort_order in range(3):
+            TextItem.objects.create_for_placeholder(placeholder, text=make_text(rnd, 3), sort_order=sort_order)
+
+    start = time.time()
+    SearchDocument.objects.index_parents(TestPage.objects.order_by('pk').iterator())
+    duration = time.time() - start
+    sys.stdout.write("Indexed {0} pages in {1:.2f} seconds ({2:.0f} pages/s)\n".format(
+        options.pages, duration, options.pages / duration
+    ))
+
+    for num_words in (1, 2, 3):
+        queries = [u" ".join(rnd.choice(WORDS) for i in range(num_words)) for q in range(options.queries)]
+        timings = []
+        for query in queries:
+            start = time.time()
+            search(query, limit=20)
+            timings.append(time.time() - start)
+
+        timings.sort()
+        sys.stdout.write("{0} word queries: median {1:.2f} ms, 95th percentile {2:.2f} ms\n".format(
+            num_words, timings[len(timings) // 2] * 1000, timings[int(len(timings) * 0.95)] * 1000
+        ))
+
+
+if __name__ == '__main__':
+    main()
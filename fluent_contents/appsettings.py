@@ -16,6 +16,16 @@ FLUENT_CONTENTS_CACHE_OUTPUT = getattr(settings, 'FLUENT_CONTENTS_CACHE_OUTPUT',
 # Hence, this will not automatically toggle on in production, so configuration stays explicit.
 FLUENT_CONTENTS_CACHE_PLACEHOLDER_OUTPUT = getattr(settings, 'FLUENT_CONTENTS_CACHE_PLACEHOLDER_OUTPUT', False)
 
+# Clear the cache when the transaction commits, so concurrent requests can't cache the old data again.
+# Disable this for tests that run in a transaction that is never committed, like Django's TestCase.
+FLUENT_CONTENTS_CACHE_CLEAR_ON_COMMIT = getattr(settings, 'FLUENT_CONTENTS_CACHE_CLEAR_ON_COMMIT', True)
+
+# Record which parent objects changed, so search indexes can be updated incrementally.
+FLUENT_CONTENTS_TRACK_CHANGES = getattr(settings, 'FLUENT_CONTENTS_TRACK_CHANGES', False)
+
+# Store the search text of placeholders, so indexers don't have to render the items each time.
+FLUENT_CONTENTS_STORE_SEARCH_TEXT = getattr(settings, 'FLUENT_CONTENTS_STORE_SEARCH_TEXT', False)
+
 FLUENT_CONTENTS_PLACEHOLDER_CONFIG = getattr(settings, 'FLUENT_CONTENTS_PLACEHOLDER_CONFIG', {})
 
 # Note: the default language setting is used during the migrations
@@ -30,6 +40,9 @@ FLUENT_CONTENTS_FILTER_SITE_ID = getattr(settings, "FLUENT_CONTENTS_FILTER_SITE_
 FLUENT_TEXT_CLEAN_HTML = getattr(settings, "FLUENT_TEXT_CLEAN_HTML", False)
 FLUENT_TEXT_SANITIZE_HTML = getattr(settings, "FLUENT_TEXT_SANITIZE_HTML", False)
 
+# The html5lib tree type to clean the HTML with, 'etree' is faster than 'dom'.
+FLUENT_TEXT_CLEAN_HTML_BACKEND = getattr(settings, "FLUENT_TEXT_CLEAN_HTML_BACKEND", 'dom')
+
 FLUENT_TEXT_PRE_FILTERS = getattr(settings, "FLUENT_TEXT_PRE_FILTERS", ())
 FLUENT_TEXT_POST_FILTERS = getattr(settings, "FLUENT_TEXT_POST_FILTERS", ())
 
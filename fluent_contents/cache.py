@@ -1,7 +1,14 @@
 """
 Functions for caching.
 """
+import hashlib
+import inspect
+
+import six
 from django.contrib.contenttypes.models import ContentType
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+from django.utils.encoding import force_bytes
 
 
 def get_rendering_cache_key(placeholder_name, contentitem):
@@ -15,10 +22,12 @@ def get_rendering_cache_key(placeholder_name, contentitem):
     """
     if not contentitem.pk:
         return None
-    return "contentitem.@{0}.{1}.{2}".format(
+    plugin = contentitem.plugin
+    return "contentitem.@{0}.{1}.{2}.{3}".format(
         placeholder_name,
-        contentitem.plugin.type_name,  # always returns the upcasted name.
-        contentitem.pk,                # already unique per language_code
+        plugin.type_name,    # always returns the upcasted name.
+        contentitem.pk,      # already unique per language_code
+        plugin.fingerprint,  # changes when the plugin code or template is deployed.
     )
 
 
@@ -54,4 +63,90 @@ def get_placeholder_cache_key_for_parent(parent_object, placeholder_name, langua
 def _get_placeholder_cache_key_for_id(parent_type_id, parent_id, placeholder_name, language_code):
     # Return a cache key for a placeholder, without having to fetch a placeholder first.
     # Not yet exposed, maybe more object values are needed later.
-    return "placeholder.{0}.{1}.{2}.{3}".format(parent_type_id, parent_id, placeholder_name, language_code)
+    # The items of a placeholder are unknown at this point,
+    # hence the combined fingerprint of all plugins is included here.
+    from fluent_contents.extensions import plugin_pool
+    return "placeholder.{0}.{1}.{2}.{3}.{4}".format(
+        parent_type_id, parent_id, placeholder_name, language_code, plugin_pool.get_fingerprint()
+    )
+
+
+def get_placeholder_lookup_cache_key(parent_type_id, parent_id, slot):
+    """
+    .. versionadded:: 1.3
+       Return a cache key for the placeholder lookup by parent and slot name.
+
+    This key stores the placeholder fields, so :func:`~fluent_contents.models.PlaceholderManager.get_by_slot`
+    doesn't have to query the database.
+    """
+    return "placeholder_lookup.{0}.{1}.{2}".format(parent_type_id, parent_id, slot)
+
+
+def get_placeholder_items_cache_key(placeholder_id, language_code):
+    """
+    .. versionadded:: 1.3
+       Return a cache key for the list of content items in a placeholder.
+
+    This key stores the ID and polymorphic type of the items, in their rendering order.
+    Together with the output cache of the items, placeholders can be rendered without any database queries.
+    """
+    return "placeholder_items.{0}.{1}".format(placeholder_id, language_code)
+
+
+def get_plugin_fingerprint(plugin):
+    """
+    .. versionadded:: 1.3
+       Return a short hash of the plugin source code and the source of its :attr:`~fluent_contents.extensions.ContentPlugin.render_template`.
+
+    This value is part of the cache keys, so deploying a new version of a plugin
+    only causes cache misses for the output of that plugin.
+    """
+    digest = hashlib.sha1()
+    digest.update(force_bytes(plugin.__class__.__module__ + '.' + plugin.__class__.__name__))
+    digest.update(_get_file_source(_get_class_source_file(plugin.__class__)))
+
+    template_names = plugin.render_template
+    if template_names:
+        if isinstance(template_names, six.string_types):
+            template_names = [template_names]
+
+        for template_name in template_names:
+            digest.update(force_bytes(template_name))
+            digest.update(_get_template_source(template_name))
+
+    return digest.hexdigest()[:8]
+
+
+def _get_class_source_file(cls):
+    try:
+        return inspect.getsourcefile(cls)
+    except TypeError:
+        # Builtin or dynamically created class
+        return None
+
+
+def _get_template_source(template_name):
+    try:
+        template = get_template(template_name)
+    except TemplateDoesNotExist:
+        return b''
+
+    # Django 1.9+ exposes the source, the origin of the 1.8 template adapter points to the file.
+    template = getattr(template, 'template', template)
+    source = getattr(template, 'source', None)
+    if source is not None:
+        return force_bytes(source)
+
+    origin = getattr(template, 'origin', None)
+    return _get_file_source(getattr(origin, 'name', None))
+
+
+def _get_file_source(filename):
+    if not filename:
+        return b''
+
+    try:
+        with open(filename, 'rb') as f:
+            return f.read()
+    except (IOError, OSError):
+        return b''
@@ -19,7 +19,7 @@ from django.template.context import Context
 from django.template.loader import render_to_string
 from django.utils.html import linebreaks, escape
 from django.utils.translation import ugettext_lazy as _, get_language
-from fluent_contents.cache import get_rendering_cache_key, get_placeholder_cache_key
+from fluent_contents.cache import get_rendering_cache_key, get_placeholder_cache_key, get_plugin_fingerprint
 from fluent_contents.forms import ContentItemForm
 from fluent_contents.models import ContentItemOutput, ImmutableMedia, DEFAULT_TIMEOUT
 from fluent_contents.utils.search import get_search_field_values, clean_join
@@ -64,8 +64,26 @@ class PluginContext(Context):
         else:
             Context.__init__(self, dict, current_app=current_app)
 
+        # Push a copy, so assignments in one plugin template don't leak into the shared request data.
+        self.update(get_request_context_data(request).copy())
+
+
+def get_request_context_data(request):
+    """
+    Return the flattened output of the standard context processors for a request.
+
+    The results are stored in the request object,
+    so all plugins rendered in the same request share the same processor output.
+    """
+    try:
+        return request._fluent_contents_context_data
+    except AttributeError:
+        data = {}
         for processor in _STANDARD_REQUEST_CONTEXT_PROCESSORS:
-            self.update(processor(request))
+            data.update(processor(request))
+
+        request._fluent_contents_context_data = data
+        return data
 
 
 def frontend_media_property(cls):
@@ -180,6 +198,12 @@ class ContentPlugin(with_metaclass(PluginMediaDefiningClass, object)):
     #: The template to render the frontend HTML output.
     render_template = None
 
+    #: .. versionadded:: 1.3
+    #: Whether the :attr:`render_template` receives the standard context processor data
+    #: (e.g. ``request``, ``STATIC_URL``, ``user`` and ``csrf_token``).
+    #: Disable this for templates that only display the ``instance``, so rendering is faster.
+    use_context_processors = True
+
     #: By default, rendered output is cached, and updated on admin changes.
     cache_output = True
 
@@ -266,8 +290,15 @@ class ContentPlugin(with_metaclass(PluginMediaDefiningClass, object)):
     #: Define whether the full output should be used for indexing.
     search_output = None
 
+    #: .. versionadded:: 1.3
+    #: Define whether the search text can be stored, see :ref:`FLUENT_CONTENTS_STORE_SEARCH_TEXT`.
+    #: By default, this is only done when the :attr:`search_output` is cached for all sites without a timeout.
+    #: Set this to ``False`` when the search text depends on other objects.
+    store_search_text = None
+
     def __init__(self):
         self._type_id = None
+        self._fingerprint = None
 
     def __repr__(self):
         return '<{0} for {1} model>'.format(self.__class__.__name__, self.model.__name__)
@@ -307,6 +338,20 @@ class ContentPlugin(with_metaclass(PluginMediaDefiningClass, object)):
 
         return self._type_id
 
+    @property
+    def fingerprint(self):
+        """
+        .. versionadded:: 1.3
+           A short hash of the plugin code and :attr:`render_template` source.
+
+           This value is included in the output cache keys, so updated plugins
+           don't display stale output after a deployment. It's calculated once per process.
+           By default, this function generates the value using :func:`~fluent_contents.cache.get_plugin_fingerprint`.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = get_plugin_fingerprint(self)
+        return self._fingerprint
+
     def get_model_instances(self):
         """
         Return the model instances the plugin has created.
@@ -478,9 +523,13 @@ class ContentPlugin(with_metaclass(PluginMediaDefiningClass, object)):
     def render_to_string(self, request, template, context, content_instance=None):
         """
         Render a custom template with the :class:`~PluginContext` as context instance.
+        When :attr:`use_context_processors` is disabled, a plain context is used instead.
         """
         if not content_instance:
-            content_instance = PluginContext(request)
+            if self.use_context_processors:
+                content_instance = PluginContext(request)
+            else:
+                content_instance = Context()
 
         if django.VERSION >= (1, 8):
             # Avoid RemovedInDjango110Warning
@@ -2,8 +2,11 @@
 Internal module for the plugin system,
 the API is exposed via __init__.py
 """
+import hashlib
+
 import six
 from django.core.exceptions import ImproperlyConfigured
+from django.utils.encoding import force_bytes
 
 from future.builtins import str
 from threading import Lock
@@ -57,6 +60,7 @@ class PluginPool(object):
         self.plugins = {}
         self._name_for_model = {}
         self._name_for_ctype_id = None
+        self._fingerprint = None
         self.detected = False
 
     def register(self, plugin):
@@ -100,6 +104,7 @@ class PluginPool(object):
         # Only update lazy indexes if already created
         if self._name_for_ctype_id is not None:
             self._name_for_ctype_id[plugin.type_id] = name
+        self._fingerprint = None
 
         return plugin  # Allow decorator syntax
 
@@ -167,6 +172,22 @@ class PluginPool(object):
             raise PluginNotFound("No plugin found for model '{0}'.".format(model_class.__name__))
         return self.plugins[name]
 
+    def get_fingerprint(self):
+        """
+        .. versionadded:: 1.3
+           Return the combined :attr:`~fluent_contents.extensions.ContentPlugin.fingerprint` of all plugins.
+
+        This is used in cache keys which can contain the output of any plugin, such as the placeholder output.
+        """
+        if self._fingerprint is None:
+            self._import_plugins()
+            digest = hashlib.sha1()
+            for name in sorted(self.plugins.keys()):
+                digest.update(force_bytes(u"{0}:{1};".format(name, self.plugins[name].fingerprint)))
+            self._fingerprint = digest.hexdigest()[:8]
+
+        return self._fingerprint
+
     def _get_plugin_by_content_type(self, contenttype):
         self._import_plugins()
         self._setup_lazy_indexes()
@@ -0,0 +1,179 @@
+import json
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.encoding import is_protected_type
+from fluent_contents.models import ContentItem, Placeholder
+
+
+class Command(BaseCommand):
+    """
+    Export all placeholders and content items as JSON Lines.
+    The output can be loaded again with the ``import_contentitems`` command.
+
+    Many-to-many fields are exported as a list of IDs.
+    Relations with a custom ``through`` model are skipped, as these can't be restored without the extra fields.
+    """
+    help = "Export all placeholders and content items as JSON Lines."
+
+    if getattr(BaseCommand, 'add_arguments', None):  # Django 1.8+
+        def add_arguments(self, parser):
+            super(Command, self).add_arguments(parser)
+            parser.add_argument(
+                '-o', '--output', action='store', dest='output', default=None,
+                help="The file to write to, defaults to the standard output."
+            )
+            parser.add_argument(
+                '--chunk-size', action='store', dest='chunk_size', type=int, default=2000,
+                help="The number of objects to fetch per query."
+            )
+    else:
+        from optparse import make_option
+        option_list = BaseCommand.option_list + (
+            make_option(
+                '-o', '--output', action='store', dest='output', default=None,
+                help="The file to write to, defaults to the standard output."
+            ),
+            make_option(
+                '--chunk-size', action='store', dest='chunk_size', type='int', default=2000,
+                help="The number of objects to fetch per query."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = int(options['verbosity'])
+        self.chunk_size = options['chunk_size']
+        start = time.time()
+
+        if options['output']:
+            with open(options['output'], 'w') as stream:
+                num_objects = self.export(stream)
+        else:
+            num_objects = self.export(self.stdout)
+
+        if self.verbosity >= 1:
+            duration = max(time.time() - start, 0.001)
+            self.stderr.write("Exported {0} objects in {1:.1f} seconds ({2:.0f} objects/s).".format(
+                num_objects, duration, num_objects / duration
+            ))
+
+    def export(self, stream):
+        num_objects = 0
+        for placeholder in iterate_chunks(Placeholder.objects.all(), self.chunk_size):
+            self.write(stream, serialize_placeholder(placeholder))
+            num_objects += 1
+
+        # Export per content type, so the derived tables are fetched with a single join.
+        ct_ids = ContentItem.objects.order_by().values_list('polymorphic_ctype', flat=True).distinct()
+        for ct_id in sorted(ct_ids):
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            if model is None:
+                self.stderr.write("Skipping stale content type #{0}".format(ct_id))
+                continue
+
+            items = model._base_manager.non_polymorphic().filter(polymorphic_ctype=ct_id) \
+                .prefetch_related(*[field.name for field in get_derived_m2m_fields(model)])
+            for item in iterate_chunks(items, self.chunk_size):
+                self.write(stream, serialize_contentitem(item))
+                num_objects += 1
+
+            if self.verbosity >= 2:
+                self.stderr.write("- exported {0}, {1} objects".format(get_natural_key(ct_id), num_objects))
+
+        return num_objects
+
+    def write(self, stream, data):
+        line = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True)
+        if stream is self.stdout:
+            stream.write(line)  # OutputWrapper adds the newline
+        else:
+            stream.write(line + "\n")
+
+
+def iterate_chunks(queryset, chunk_size):
+    """
+    Iterate over the queryset in chunks ordered by primary key, to avoid loading all objects at once.
+    """
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk[:chunk_size])
+        if not chunk:
+            return
+
+        for obj in chunk:
+            yield obj
+
+        last_pk = chunk[-1].pk
+
+
+def get_natural_key(ct_id):
+    if not ct_id:
+        return None
+    ct = ContentType.objects.get_for_id(ct_id)
+    return "{0}.{1}".format(ct.app_label, ct.model)
+
+
+def serialize_placeholder(placeholder):
+    return {
+        'type': 'placeholder',
+        'pk': placeholder.pk,
+        'parent_type': get_natural_key(placeholder.parent_type_id),
+        'parent_id': placeholder.parent_id,
+        'slot': placeholder.slot,
+        'role': placeholder.role,
+        'title': placeholder.title,
+    }
+
+
+def serialize_contentitem(contentitem):
+    # The fields of the derived tables are stored the same way Django's serializers do.
+    fields = {}
+    for field in get_derived_fields(contentitem.__class__):
+        if field.is_relation:
+            value = getattr(contentitem, field.attname)
+        else:
+            value = field.value_from_object(contentitem)
+            if not is_protected_type(value):
+                value = field.value_to_string(contentitem)
+        fields[field.name] = value
+
+    for field in get_derived_m2m_fields(contentitem.__class__):
+        # Uses the prefetched objects.
+        fields[field.name] = [obj.pk for obj in getattr(contentitem, field.name).all()]
+
+    return {
+        'type': 'contentitem',
+        'model': get_natural_key(contentitem.polymorphic_ctype_id),
+        'pk': contentitem.pk,
+        'placeholder': contentitem.placeholder_id,
+        'parent_type': get_natural_key(contentitem.parent_type_id),
+        'parent_id': contentitem.parent_id,
+        'language_code': contentitem.language_code,
+        'sort_order': contentitem.sort_order,
+        'fields': fields,
+    }
+
+
+def get_derived_fields(model):
+    """
+    Return the fields that are stored in the derived tables of a content item model.
+    """
+    base_fields = set(f.attname for f in ContentItem._meta.concrete_fields)
+    return [
+        f for f in model._meta.concrete_fields
+        if f.attname not in base_fields and not (f.primary_key and f.is_relation)  # skip the parent link
+    ]
+
+
+def get_derived_m2m_fields(model):
+    """
+    Return the many-to-many fields of a content item model which use an automatically created table.
+    """
+    return [
+        f for f in model._meta.many_to_many
+        if (getattr(f, 'remote_field', None) or f.rel).through._meta.auto_created
+    ]
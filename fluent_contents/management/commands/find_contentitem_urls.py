@@ -1,16 +1,19 @@
+import json
+import multiprocessing
 import operator
-import sys
 from functools import reduce
 
+import html5lib
+from django.apps import apps
 from django.core.management.base import BaseCommand
-from django.db import models, ProgrammingError
+from django.db import connections, models, ProgrammingError
 from django.db.models import Q
 from django.utils import six
 from django.utils import translation
 from django.utils.encoding import force_text
+from django.utils.six.moves import html_parser
 from fluent_contents.extensions import PluginHtmlField, PluginImageField, PluginUrlField
 from fluent_contents.extensions import plugin_pool
-from html5lib import treebuilders, HTMLParser
 
 try:
     from urllib.parse import unquote  # Python 3
@@ -24,8 +27,8 @@ def unquote_utf8(value):
 
 class Command(BaseCommand):
     """
-    Add a prefix to the name of content items.
-    This makes content items easier to spot in the permissions list.
+    Find all link and image URLs in all content items.
+    The URLs are written as soon as they are found, hence the output is not sorted.
     """
     help = "Find all link and image URLs in all content items."
     exclude = (
@@ -34,22 +37,69 @@ class Command(BaseCommand):
         'Session',
     )
 
+    if getattr(BaseCommand, 'add_arguments', None):  # Django 1.8+
+        def add_arguments(self, parser):
+            super(Command, self).add_arguments(parser)
+            parser.add_argument(
+                '--processes', action='store', dest='processes', type=int, default=1,
+                help="The number of worker processes to inspect the objects with."
+            )
+            parser.add_argument(
+                '--chunk-size', action='store', dest='chunk_size', type=int, default=1000,
+                help="The number of objects to inspect per task."
+            )
+            parser.add_argument(
+                '--json', action='store_true', dest='json',
+                help="Write each match as JSON object, with the model, ID, field and URL."
+            )
+    else:
+        from optparse import make_option
+        option_list = BaseCommand.option_list + (
+            make_option(
+                '--processes', action='store', dest='processes', type='int', default=1,
+                help="The number of worker processes to inspect the objects with."
+            ),
+            make_option(
+                '--chunk-size', action='store', dest='chunk_size', type='int', default=1000,
+                help="The number of objects to inspect per task."
+            ),
+            make_option(
+                '--json', action='store_true', dest='json', default=False,
+                help="Write each match as JSON object, with the model, ID, field and URL."
+            ),
+        )
+
     def handle(self, *args, **options):
         translation.activate('en')  # just in case
 
-        self.verbosity = options['verbosity']
-        urls = []
+        self.verbosity = int(options['verbosity'])
+        self.chunk_size = options['chunk_size']
+        self.json = options['json']
+        self.seen_urls = set()
 
-        # Look through all registered models.
+        # Split the work in chunks of objects, these can be inspected in parallel.
+        tasks = []
         for model in sorted(self.get_models(), key=lambda model: model._meta.model_name):
             try:
-                urls += self.inspect_model(model)
+                tasks += self.get_tasks(model)
             except ProgrammingError as e:
                 self.stderr.write(force_text(e))
 
-        self.stdout.write("")
-        for url in sorted(set(urls)):
-            self.stdout.write(url)
+        processes = options['processes']
+        if processes > 1:
+            # The worker processes should not share the database connection of this process.
+            connections.close_all()
+            pool = multiprocessing.Pool(processes, initializer=connections.close_all)
+            try:
+                for matches in pool.imap_unordered(inspect_chunk, tasks):
+                    self.write_matches(matches)
+                pool.close()
+                pool.join()
+            finally:
+                pool.terminate()
+        else:
+            for task in tasks:
+                self.write_matches(inspect_chunk(task))
 
     def get_models(self):
         """
@@ -58,14 +108,11 @@ class Command(BaseCommand):
         # Could also use `apps.get_models()` here.
         return plugin_pool.get_model_classes()
 
-    def inspect_model(self, model):
+    def get_tasks(self, model):
         """
-        Inspect a single model
+        Split the objects of a single model in ranges of primary keys.
         """
-        # See which interesting fields the model holds.
-        url_fields = sorted(f for f in model._meta.fields if isinstance(f, (PluginUrlField, models.URLField)))
-        file_fields = sorted(f for f in model._meta.fields if isinstance(f, (PluginImageField, models.FileField)))
-        html_fields = sorted(f for f in model._meta.fields if isinstance(f, (models.TextField, PluginHtmlField)))
+        file_fields, html_fields, url_fields = get_url_fields(model)
         all_fields = [f.name for f in (file_fields + html_fields + url_fields)]
         if not all_fields:
             return []
@@ -74,83 +121,151 @@ class Command(BaseCommand):
             self.stderr.write("Skipping {0} ({1})\n".format(model.__name__, ", ".join(all_fields)))
             return []
 
-        sys.stderr.write("Inspecting {0} ({1})\n".format(model.__name__, ", ".join(all_fields)))
-
-        q_notnull = reduce(operator.or_, (Q(**{"{0}__isnull".format(f): False}) for f in all_fields))
-        qs = model.objects.filter(q_notnull).order_by('pk')
-
-        urls = []
-        for object in qs:
-            # HTML fields need proper html5lib parsing
-            for field in html_fields:
-                value = getattr(object, field.name)
-                if value:
-                    html_images = self.extract_html_urls(value)
-                    urls += html_images
-
-                    for image in html_images:
-                        self.show_match(object, image)
-
-            # Picture fields take the URL from the storage class.
-            for field in file_fields:
-                value = getattr(object, field.name)
-                if value:
-                    value = unquote_utf8(value.url)
-                    urls.append(value)
-                    self.show_match(object, value)
-
-            # URL fields can be read directly.
-            for field in url_fields:
-                value = getattr(object, field.name)
-                if value:
-                    if isinstance(value, six.text_type):
-                        value = force_text(value)
-                    else:
-                        value = value.to_db_value()  # AnyUrlValue
-
-                    urls.append(value)
-                    self.show_match(object, value)
-        return urls
-
-    def show_match(self, object, value):
-        if self.verbosity >= 2:
-            self.stdout.write(u"{0}#{1}: \t{2}".format(object.__class__.__name__, object.pk, value))
-
-    def extract_html_urls(self, html):
+        self.stderr.write("Inspecting {0} ({1})\n".format(model.__name__, ", ".join(all_fields)))
+
+        # Only the primary keys are read here, the workers read the objects.
+        qs = get_inspected_queryset(model, all_fields).values_list('pk', flat=True)
+        tasks = []
+        last_pk = None
+        while True:
+            chunk = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+            pks = list(chunk[:self.chunk_size])
+            if not pks:
+                return tasks
+
+            tasks.append((get_model_label(model), pks[0], pks[-1]))
+            last_pk = pks[-1]
+
+    def write_matches(self, matches):
         """
-        Take all ``<img src="..">`` from the HTML
+        Write the matches as soon as they are found.
         """
-        p = HTMLParser(tree=treebuilders.getTreeBuilder("dom"))
-        dom = p.parse(html)
-        urls = []
+        for model_label, pk, field_name, url in matches:
+            if self.json:
+                self.stdout.write(json.dumps({
+                    'model': model_label,
+                    'pk': pk,
+                    'field': field_name,
+                    'url': url,
+                }, sort_keys=True))
+            elif self.verbosity >= 2:
+                self.stdout.write(u"{0}#{1}: \t{2}".format(model_label.split('.')[-1], pk, url))
+            elif url not in self.seen_urls:
+                self.seen_urls.add(url)
+                self.stdout.write(url)
 
-        for img in dom.getElementsByTagName('img'):
-            src = img.getAttribute('src')
-            if src:
-                urls.append(unquote_utf8(src))
 
-            srcset = img.getAttribute('srcset')
-            if srcset:
-                urls += self.extract_srcset(srcset)
+def get_model_label(model):
+    return "{0}.{1}".format(model._meta.app_label, model._meta.object_name)
 
-        for source in dom.getElementsByTagName('source'):
-            srcset = source.getAttribute('srcset')
-            if srcset:
-                urls += self.extract_srcset(srcset)
 
-        for source in dom.getElementsByTagName('a'):
-            href = source.getAttribute('href')
-            if href:
-                urls.append(unquote_utf8(href))
+def get_url_fields(model):
+    """
+    Return the file, HTML and URL fields of a model.
+    """
+    url_fields = sorted(f for f in model._meta.fields if isinstance(f, (PluginUrlField, models.URLField)))
+    file_fields = sorted(f for f in model._meta.fields if isinstance(f, (PluginImageField, models.FileField)))
+    html_fields = sorted(f for f in model._meta.fields if isinstance(f, (models.TextField, PluginHtmlField)))
+    return file_fields, html_fields, url_fields
 
-        return urls
 
-    def extract_srcset(self, srcset):
-        """
-        Handle ``srcset="image.png 1x, image@2x.jpg 2x"``
-        """
-        urls = []
-        for item in srcset.split(','):
-            if item:
-                urls.append(unquote_utf8(item.rsplit(' ', 1)[0]))
-        return urls
+def get_inspected_queryset(model, field_names):
+    q_notnull = reduce(operator.or_, (Q(**{"{0}__isnull".format(f): False}) for f in field_names))
+    return model.objects.filter(q_notnull).order_by('pk')
+
+
+def inspect_chunk(task):
+    """
+    Find the URLs in a range of objects.
+    This runs in a worker process, hence it only receives and returns simple values.
+    """
+    model_label, first_pk, last_pk = task
+    model = apps.get_model(model_label)
+    file_fields, html_fields, url_fields = get_url_fields(model)
+    all_fields = [f.name for f in (file_fields + html_fields + url_fields)]
+
+    translation.activate('en')
+    qs = get_inspected_queryset(model, all_fields).filter(pk__gte=first_pk, pk__lte=last_pk)
+
+    matches = []
+    for object in qs.iterator():
+        # HTML fields are scanned for the tags that hold URLs.
+        for field in html_fields:
+            value = getattr(object, field.name)
+            if value:
+                for url in extract_html_urls(value):
+                    matches.append((model_label, object.pk, field.name, url))
+
+        # Picture fields take the URL from the storage class.
+        for field in file_fields:
+            value = getattr(object, field.name)
+            if value:
+                matches.append((model_label, object.pk, field.name, unquote_utf8(value.url)))
+
+        # URL fields can be read directly.
+        for field in url_fields:
+            value = getattr(object, field.name)
+            if value:
+                if isinstance(value, six.text_type):
+                    value = force_text(value)
+                else:
+                    value = value.to_db_value()  # AnyUrlValue
+
+                matches.append((model_label, object.pk, field.name, value))
+    return matches
+
+
+def extract_html_urls(html):
+    """
+    Take all ``<img src="..">``, ``<source srcset="..">`` and ``<a href="..">`` from the HTML
+    """
+    parser = UrlExtractor()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:  # HTMLParseError in Python 2
+        # Let html5lib correct the malformed markup, which is slower.
+        parser = UrlExtractor()
+        tree = html5lib.parseFragment(html, treebuilder='etree', namespaceHTMLElements=False)
+        for element in tree.iter():
+            parser.handle_starttag(element.tag, element.attrib.items())
+    return parser.urls
+
+
+def extract_srcset(srcset):
+    """
+    Handle ``srcset="image.png 1x, image@2x.jpg 2x"``
+    """
+    urls = []
+    for item in srcset.split(','):
+        item = item.strip()
+        if item:
+            urls.append(unquote_utf8(item.rsplit(' ', 1)[0]))
+    return urls
+
+
+class UrlExtractor(html_parser.HTMLParser):
+    """
+    Collect the URLs while tokenizing the HTML, without building a DOM tree.
+    """
+
+    def __init__(self):
+        if six.PY3:
+            html_parser.HTMLParser.__init__(self, convert_charrefs=True)
+        else:
+            html_parser.HTMLParser.__init__(self)
+        self.urls = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in ('img', 'source', 'a'):
+            return
+
+        attrs = dict(attrs)
+        if tag == 'img' and attrs.get('src'):
+            self.urls.append(unquote_utf8(attrs['src']))
+
+        if tag in ('img', 'source') and attrs.get('srcset'):
+            self.urls += extract_srcset(attrs['srcset'])
+
+        if tag == 'a' and attrs.get('href'):
+            self.urls.append(unquote_utf8(attrs['href']))
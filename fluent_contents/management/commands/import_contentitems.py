@@ -0,0 +1,263 @@
+import json
+import sys
+import time
+
+from collections import OrderedDict
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from fluent_contents.management.commands.export_contentitems import get_derived_fields, get_derived_m2m_fields
+from fluent_contents.models import ContentItem, Placeholder
+from fluent_contents.models.managers import _delete_items
+from fluent_contents.models.mixins import delete_cache_keys
+
+
+class Command(BaseCommand):
+    """
+    Import the placeholders and content items, written by the ``export_contentitems`` command.
+
+    Placeholders are matched by their parent object and slot, missing placeholders are created.
+    The parent objects should already exist in the database with the same IDs.
+    The content items of matched placeholders are replaced, so running the import again gives the same result.
+    Use ``--append`` to keep the existing items instead.
+    The imported content items receive new IDs.
+
+    Many-to-many relations are restored when the related objects exist with the same IDs.
+    Relations with a custom ``through`` model are not exported.
+    """
+    help = "Import placeholders and content items from a JSON Lines file."
+
+    if getattr(BaseCommand, 'add_arguments', None):  # Django 1.8+
+        def add_arguments(self, parser):
+            super(Command, self).add_arguments(parser)
+            parser.add_argument(
+                'input', nargs='?', default=None,
+                help="The file to read from, defaults to the standard input."
+            )
+            parser.add_argument(
+                '--batch-size', action='store', dest='batch_size', type=int, default=1000,
+                help="The number of objects to insert per query."
+            )
+            parser.add_argument(
+                '--append', action='store_true', dest='append', default=False,
+                help="Add the items to existing placeholders, instead of replacing their items."
+            )
+    else:
+        from optparse import make_option
+        args = '[input]'
+        option_list = BaseCommand.option_list + (
+            make_option(
+                '--batch-size', action='store', dest='batch_size', type='int', default=1000,
+                help="The number of objects to insert per query."
+            ),
+            make_option(
+                '--append', action='store_true', dest='append', default=False,
+                help="Add the items to existing placeholders, instead of replacing their items."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = int(options['verbosity'])
+        self.batch_size = options['batch_size']
+        self.append = options['append']
+        self.placeholder_ids = {}  # exported ID -> new Placeholder
+        self.num_placeholders = 0
+        self.num_items = 0
+        self.num_replaced = 0
+        self.start = time.time()
+
+        filename = options.get('input') or (args[0] if args else None)
+        if filename and filename != '-':
+            with open(filename) as stream:
+                self.load(stream)
+        else:
+            self.load(sys.stdin)
+
+        if self.verbosity >= 1:
+            self.stdout.write("Imported {0} placeholders and {1} content items in {2:.1f} seconds ({3:.0f} items/s).".format(
+                self.num_placeholders, self.num_items, self.get_duration(), self.num_items / self.get_duration()
+            ))
+            if self.num_replaced:
+                self.stdout.write("Replaced {0} existing content items.".format(self.num_replaced))
+
+    def get_duration(self):
+        return max(time.time() - self.start, 0.001)
+
+    def load(self, stream):
+        placeholders = []
+        items = []
+        for line_no, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                data = json.loads(line)
+            except ValueError as e:
+                raise CommandError("Invalid JSON at line {0}: {1}".format(line_no, e))
+
+            if data['type'] == 'placeholder':
+                placeholders.append(data)
+                if len(placeholders) >= self.batch_size:
+                    self.import_placeholders(placeholders)
+                    placeholders = []
+            elif data['type'] == 'contentitem':
+                if placeholders:
+                    # The export writes all placeholders first.
+                    self.import_placeholders(placeholders)
+                    placeholders = []
+
+                items.append(data)
+                if len(items) >= self.batch_size:
+                    self.import_contentitems(items)
+                    items = []
+            else:
+                raise CommandError("Unknown object type at line {0}: {1}".format(line_no, data['type']))
+
+        if placeholders:
+            self.import_placeholders(placeholders)
+        if items:
+            self.import_contentitems(items)
+
+    def import_placeholders(self, rows):
+        """
+        Find or create the placeholders, and remember their new IDs.
+        """
+        # Find the existing placeholders with a query per parent type.
+        existing = {}
+        parent_ids = {}
+        for row in rows:
+            parent_ids.setdefault(get_content_type_id(row['parent_type']), set()).add(row['parent_id'])
+        for parent_type_id, ids in parent_ids.items():
+            for placeholder in Placeholder.objects.filter(parent_type=parent_type_id, parent_id__in=ids):
+                existing[(placeholder.parent_type_id, placeholder.parent_id, placeholder.slot)] = placeholder
+
+        new_placeholders = []
+        matched_placeholders = []
+        for row in rows:
+            key = (get_content_type_id(row['parent_type']), row['parent_id'], row['slot'])
+            if key in existing:
+                self.placeholder_ids[row['pk']] = existing[key]
+                matched_placeholders.append(existing[key])
+            else:
+                placeholder = Placeholder(
+                    parent_type_id=key[0],
+                    parent_id=key[1],
+                    slot=key[2],
+                    role=row['role'],
+                    title=row['title'],
+                )
+                new_placeholders.append((row['pk'], placeholder))
+
+        if matched_placeholders and not self.append:
+            # Remove the previously imported items, all languages are part of the export.
+            with transaction.atomic():
+                self.num_replaced += _delete_items(ContentItem.objects.filter(placeholder__in=matched_placeholders))
+
+        if new_placeholders:
+            with transaction.atomic():
+                Placeholder.objects.bulk_create([placeholder for pk, placeholder in new_placeholders])
+
+            # Fetch the generated IDs.
+            created = {}
+            for parent_type_id, ids in parent_ids.items():
+                for placeholder in Placeholder.objects.filter(parent_type=parent_type_id, parent_id__in=ids):
+                    created[(placeholder.parent_type_id, placeholder.parent_id, placeholder.slot)] = placeholder
+            for pk, placeholder in new_placeholders:
+                self.placeholder_ids[pk] = created[(placeholder.parent_type_id, placeholder.parent_id, placeholder.slot)]
+
+            # bulk_create() doesn't call save(), which clears the cached lookups.
+            cache_keys = []
+            for pk, placeholder in new_placeholders:
+                cache_keys.extend(placeholder.get_cache_keys())
+            delete_cache_keys(cache_keys)
+
+        self.num_placeholders += len(rows)
+
+    def import_contentitems(self, rows):
+        """
+        Insert the content items in bulk, with their new placeholder IDs.
+        """
+        items = []
+        m2m_values = []
+        for row in rows:
+            model = get_model(row['model'])
+            if model is None:
+                self.stderr.write("Skipping content item #{0}, model {1} does not exist".format(row['pk'], row['model']))
+                continue
+
+            item = model(
+                language_code=row['language_code'],
+                sort_order=row['sort_order'],
+                parent_type_id=get_content_type_id(row['parent_type']),
+                parent_id=row['parent_id'],
+            )
+
+            if row['placeholder'] is not None:
+                try:
+                    placeholder = self.placeholder_ids[row['placeholder']]
+                except KeyError:
+                    raise CommandError("Content item #{0} refers to placeholder #{1}, which is not part of the import.".format(
+                        row['pk'], row['placeholder']
+                    ))
+
+                # The placeholder defines the parent.
+                item.placeholder = placeholder
+                item.parent_type_id = placeholder.parent_type_id
+                item.parent_id = placeholder.parent_id
+
+            fields = row['fields']
+            for field in get_derived_fields(model):
+                if field.name in fields:
+                    value = fields[field.name]
+                    if field.is_relation:
+                        setattr(item, field.attname, value)
+                    else:
+                        setattr(item, field.attname, field.to_python(value))
+
+            for field in get_derived_m2m_fields(model):
+                if fields.get(field.name):
+                    m2m_values.append((item, field, fields[field.name]))
+
+            items.append(item)
+
+        with transaction.atomic():
+            ContentItem.objects.bulk_create_items(items)
+
+            # The items have their new IDs now, insert the many-to-many rows with a query per table.
+            rows_by_through = OrderedDict()
+            for item, field, ids in m2m_values:
+                through = (getattr(field, 'remote_field', None) or field.rel).through
+                source_attname = through._meta.get_field(field.m2m_field_name()).attname
+                target_attname = through._meta.get_field(field.m2m_reverse_field_name()).attname
+                rows_by_through.setdefault(through, []).extend(
+                    through(**{source_attname: item.pk, target_attname: pk}) for pk in ids
+                )
+            for through, through_rows in rows_by_through.items():
+                through._base_manager.bulk_create(through_rows)
+
+        self.num_items += len(items)
+        if self.verbosity >= 2:
+            self.stdout.write("- imported {0} content items ({1:.0f} items/s)".format(
+                self.num_items, self.num_items / self.get_duration()
+            ))
+
+
+def get_content_type_id(natural_key):
+    if not natural_key:
+        return None
+
+    app_label, model = natural_key.split('.', 1)
+    try:
+        return ContentType.objects.get_by_natural_key(app_label, model).pk
+    except ContentType.DoesNotExist:
+        raise CommandError("Content type '{0}' does not exist".format(natural_key))
+
+
+def get_model(natural_key):
+    app_label, model = natural_key.split('.', 1)
+    try:
+        return ContentType.objects.get_by_natural_key(app_label, model).model_class()
+    except ContentType.DoesNotExist:
+        return None
@@ -0,0 +1,397 @@
+import json
+import multiprocessing
+import time
+from collections import OrderedDict
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone, translation
+from django.utils.dateparse import parse_datetime
+from django.utils.module_loading import import_string
+from fluent_contents.models import ChangedParent, get_parent_language_code
+from fluent_contents.rendering import render_search_text_bulk
+from fluent_contents.rendering.search import SearchRenderingPipe
+
+try:
+    from django.db.models import Case, Value, When
+except ImportError:
+    Case = None  # Django 1.7
+
+
+class Command(BaseCommand):
+    """
+    Render the search text of all parent objects, e.g. to fill a search index.
+
+    The objects are split in chunks, which can be rendered by multiple worker processes.
+    The results are written to a JSON Lines file, a model field or a custom callback.
+    """
+    help = "Render the search text of all placeholders of the given models."
+
+    if getattr(BaseCommand, 'add_arguments', None):  # Django 1.8+
+        def add_arguments(self, parser):
+            super(Command, self).add_arguments(parser)
+            parser.add_argument(
+                'models', nargs='+', metavar='app_label.ModelName',
+                help="The parent models to render the search text for."
+            )
+            parser.add_argument(
+                '-s', '--slots', action='store', dest='slots', default=None,
+                help="Comma separated list of placeholder slots to include, by default all placeholders are included."
+            )
+            parser.add_argument(
+                '-l', '--language', action='store', dest='language', default=None,
+                help="The language to render, defaults to the language of each object."
+            )
+            parser.add_argument(
+                '--changed-since', action='store', dest='changed_since', default=None,
+                help="Only render the objects which changed since this date/time, requires FLUENT_CONTENTS_TRACK_CHANGES."
+            )
+            parser.add_argument(
+                '-o', '--output', action='store', dest='output', default=None,
+                help="Write the results as JSON Lines to this file, defaults to the standard output."
+            )
+            parser.add_argument(
+                '--field', action='store', dest='field', default=None,
+                help="Store the results in this field of the parent model, translated fields are stored per language."
+            )
+            parser.add_argument(
+                '--callback', action='store', dest='callback', default=None,
+                help="Pass the results to this function, given as dotted Python path."
+            )
+            parser.add_argument(
+                '--processes', action='store', dest='processes', type=int, default=1,
+                help="The number of worker processes to render the objects with."
+            )
+            parser.add_argument(
+                '--chunk-size', action='store', dest='chunk_size', type=int, default=500,
+                help="The number of objects to render per task."
+            )
+    else:
+        from optparse import make_option
+        args = 'app_label.ModelName [app_label.ModelName ...]'
+        option_list = BaseCommand.option_list + (
+            make_option(
+                '-s', '--slots', action='store', dest='slots', default=None,
+                help="Comma separated list of placeholder slots to include, by default all placeholders are included."
+            ),
+            make_option(
+                '-l', '--language', action='store', dest='language', default=None,
+                help="The language to render, defaults to the language of each object."
+            ),
+            make_option(
+                '--changed-since', action='store', dest='changed_since', default=None,
+                help="Only render the objects which changed since this date/time, requires FLUENT_CONTENTS_TRACK_CHANGES."
+            ),
+            make_option(
+                '-o', '--output', action='store', dest='output', default=None,
+                help="Write the results as JSON Lines to this file, defaults to the standard output."
+            ),
+            make_option(
+                '--field', action='store', dest='field', default=None,
+                help="Store the results in this field of the parent model, translated fields are stored per language."
+            ),
+            make_option(
+                '--callback', action='store', dest='callback', default=None,
+                help="Pass the results to this function, given as dotted Python path."
+            ),
+            make_option(
+                '--processes', action='store', dest='processes', type='int', default=1,
+                help="The number of worker processes to render the objects with."
+            ),
+            make_option(
+                '--chunk-size', action='store', dest='chunk_size', type='int', default=500,
+                help="The number of objects to render per task."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = int(options['verbosity'])
+        self.chunk_size = options['chunk_size']
+        slots = options['slots'].split(',') if options['slots'] else None
+        models = [get_model(label) for label in (options.get('models') or args)]
+        if not models:
+            raise CommandError("Expected one or more models to index.")
+
+        changed_since = None
+        if options['changed_since']:
+            changed_since = parse_datetime(options['changed_since'])
+            if changed_since is None:
+                raise CommandError("Invalid date/time for --changed-since: {0}".format(options['changed_since']))
+            if settings.USE_TZ and timezone.is_naive(changed_since):
+                changed_since = timezone.make_aware(changed_since)
+
+        # The next run should include everything that changes during this run.
+        watermark = timezone.now()
+
+        if options['field']:
+            sink = ModelFieldSink(options['field'])
+        elif options['callback']:
+            sink = CallbackSink(import_string(options['callback']))
+        elif options['output']:
+            sink = JsonLinesSink(open(options['output'], 'w'), close=True)
+        else:
+            sink = JsonLinesSink(self.stdout)
+
+        tasks = []
+        for model in models:
+            if changed_since is None:
+                tasks += self.get_tasks(model, slots, options['language'])
+            else:
+                for language in self.get_changed_languages(model, changed_since, options['language']):
+                    tasks += self.get_tasks(model, slots, language, changed_since)
+
+        start = time.time()
+        num_objects = 0
+        plugin_timings = {}
+        try:
+            for model_label, results, timings in self.run_tasks(tasks, options['processes']):
+                sink.write(get_model(model_label), results)
+                num_objects += len(results)
+                for name, (count, duration) in timings.items():
+                    total = plugin_timings.setdefault(name, [0, 0.0])
+                    total[0] += count
+                    total[1] += duration
+
+                if self.verbosity >= 2:
+                    self.stderr.write("- rendered {0} objects ({1:.0f} objects/s)".format(
+                        num_objects, num_objects / max(time.time() - start, 0.001)
+                    ))
+        finally:
+            sink.close()
+
+        if self.verbosity >= 1:
+            duration = max(time.time() - start, 0.001)
+            self.stderr.write("Rendered {0} objects in {1:.1f} seconds ({2:.0f} objects/s).".format(
+                num_objects, duration, num_objects / duration
+            ))
+            for name, (count, plugin_duration) in sorted(plugin_timings.items(), key=lambda item: -item[1][1]):
+                self.stderr.write("- {0}: {1} items in {2:.2f} seconds".format(name, count, plugin_duration))
+            self.stderr.write("Use --changed-since={0} to render the objects that change after this run.".format(
+                watermark.isoformat()
+            ))
+
+    def get_changed_languages(self, model, changed_since, language):
+        """
+        Tell which languages of the model need to be rendered again.
+        """
+        changes = ChangedParent.objects.changed_since(changed_since).filter(
+            parent_type=ContentType.objects.get_for_model(model)
+        )
+        if language:
+            # Changes that affect all languages are rendered in the given language.
+            return [language] if changes.filter(language_code__in=(language, '')).exists() else []
+        else:
+            # Changes that affect all languages are rendered in the language of the object.
+            languages = changes.order_by().values_list('language_code', flat=True).distinct()
+            return [language_code or None for language_code in sorted(languages)]
+
+    def get_tasks(self, model, slots, language, changed_since=None):
+        """
+        Split the objects of a single model in ranges of primary keys.
+        """
+        qs = get_parents(model, language, changed_since).values_list('pk', flat=True)
+        tasks = []
+        last_pk = None
+        while True:
+            chunk = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+            pks = list(chunk[:self.chunk_size])
+            if not pks:
+                return tasks
+
+            tasks.append((get_model_label(model), pks[0], pks[-1], slots, language, changed_since))
+            last_pk = pks[-1]
+
+    def run_tasks(self, tasks, processes):
+        if processes <= 1:
+            for task in tasks:
+                yield render_chunk(task)
+            return
+
+        # The worker processes should not share the database connection of this process.
+        connections.close_all()
+        pool = multiprocessing.Pool(processes, initializer=connections.close_all)
+        try:
+            for result in pool.imap_unordered(render_chunk, tasks):
+                yield result
+            pool.close()
+            pool.join()
+        finally:
+            pool.terminate()
+
+
+class TimedSearchRenderingPipe(SearchRenderingPipe):
+    """
+    Track the rendering time of each plugin.
+    """
+
+    def __init__(self, language):
+        super(TimedSearchRenderingPipe, self).__init__(language)
+        self.timings = {}
+
+    def render_item(self, contentitem):
+        start = time.time()
+        try:
+            return super(TimedSearchRenderingPipe, self).render_item(contentitem)
+        finally:
+            timing = self.timings.setdefault(contentitem.plugin.name, [0, 0.0])
+            timing[0] += 1
+            timing[1] += time.time() - start
+
+
+def render_chunk(task):
+    """
+    Render the search text of a range of objects.
+    This runs in a worker process, hence it only receives and returns simple values.
+    """
+    model_label, first_pk, last_pk, slots, language, changed_since = task
+    model = get_model(model_label)
+    parents = get_parents(model, language, changed_since).filter(pk__gte=first_pk, pk__lte=last_pk)
+
+    # Collect the timings of the pipes, which are created per language.
+    pipes = []
+
+    def pipe_class(language_code):
+        pipe = TimedSearchRenderingPipe(language_code)
+        pipes.append(pipe)
+        return pipe
+
+    try:
+        # Translated parent objects are fetched in the active language.
+        with translation.override(language or settings.LANGUAGE_CODE):
+            results = [
+                (parent.pk, language or get_parent_language_code(parent), text)
+                for parent, text in render_search_text_bulk(parents.iterator(), slots=slots, language=language, pipe_class=pipe_class)
+            ]
+    finally:
+        if multiprocessing.current_process().name != 'MainProcess':
+            # Don't keep connections open in idle workers.
+            connections.close_all()
+
+    timings = {}
+    for pipe in pipes:
+        for name, (count, duration) in pipe.timings.items():
+            total = timings.setdefault(name, [0, 0.0])
+            total[0] += count
+            total[1] += duration
+
+    return model_label, results, timings
+
+
+class JsonLinesSink(object):
+    """
+    Write the results as JSON Lines.
+    """
+
+    def __init__(self, stream, close=False):
+        self.stream = stream
+        self.close_stream = close
+
+    def write(self, model, results):
+        label = get_model_label(model)
+        for pk, language_code, text in results:
+            self.stream.write(json.dumps({'model': label, 'pk': pk, 'language': language_code, 'text': text}, sort_keys=True) + "\n")
+
+    def close(self):
+        if self.close_stream:
+            self.stream.close()
+
+
+class ModelFieldSink(object):
+    """
+    Store the results in a field of the parent model.
+    Translated fields of django-parler models are stored in the translation of the rendered language,
+    other fields can only hold the text of a single language.
+    """
+
+    def __init__(self, field_name):
+        self.field_name = field_name
+        self.languages = {}
+
+    def write(self, model, results):
+        parler_meta = getattr(model, '_parler_meta', None)
+        if parler_meta is not None and self.field_name in parler_meta.get_all_fields():
+            translations_model = parler_meta.get_model_by_field(self.field_name)
+            field = translations_model._meta.get_field(self.field_name)
+            texts_by_language = OrderedDict()
+            for pk, language_code, text in results:
+                texts_by_language.setdefault(language_code, []).append((pk, text))
+
+            for language_code, texts in texts_by_language.items():
+                queryset = translations_model._base_manager.filter(language_code=language_code)
+                update_field(queryset, 'master_id', field, texts)
+        else:
+            languages = self.languages.setdefault(model, set())
+            languages.update(language_code for pk, language_code, text in results)
+            if len(languages) > 1:
+                raise CommandError("The field {0}.{1} is not translated, it can't hold the search text of the languages {2}.".format(
+                    model.__name__, self.field_name, ", ".join(sorted(language_code or '' for language_code in languages))
+                ))
+
+            field = model._meta.get_field(self.field_name)
+            update_field(model._base_manager.all(), 'pk', field, [(pk, text) for pk, language_code, text in results])
+
+    def close(self):
+        pass
+
+
+class CallbackSink(object):
+    """
+    Pass the results to a function, which receives the model, primary key, text and ``language_code`` argument.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def write(self, model, results):
+        for pk, language_code, text in results:
+            self.callback(model, pk, text, language_code=language_code)
+
+    def close(self):
+        pass
+
+
+def update_field(queryset, key_name, field, values):
+    """
+    Update the field of all objects with a single query, using ``UPDATE .. SET field = CASE WHEN ..``.
+    The ``values`` are ``(key, value)`` tuples.
+    """
+    if not values:
+        return
+
+    if Case is None:
+        with transaction.atomic(using=queryset.db):
+            for key, value in values:
+                queryset.filter(**{key_name: key}).update(**{field.name: value})
+        return
+
+    queryset.filter(**{key_name + '__in': [key for key, value in values]}).update(**{
+        field.name: Case(*[When(then=Value(value), **{key_name: key}) for key, value in values], output_field=field)
+    })
+
+
+def get_parents(model, language, changed_since=None):
+    """
+    Return the parent objects to render.
+    """
+    parents = model._default_manager.order_by('pk')
+    if changed_since is not None:
+        changes = ChangedParent.objects.changed_since(changed_since).filter(
+            parent_type=ContentType.objects.get_for_model(model),
+            language_code__in=(language or '', '')
+        )
+        parents = parents.filter(pk__in=changes.values('parent_id'))
+    return parents
+
+
+def get_model(label):
+    try:
+        return apps.get_model(label)
+    except (LookupError, ValueError) as e:
+        raise CommandError(str(e))
+
+
+def get_model_label(model):
+    return "{0}.{1}".format(model._meta.app_label, model._meta.object_name)
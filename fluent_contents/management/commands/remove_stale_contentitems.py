@@ -1,8 +1,18 @@
+import time
+from collections import defaultdict
+
+import django
 from django.contrib.contenttypes.models import ContentType
-from django.core.management.base import BaseCommand
-from django.db.models import Model
-from fluent_contents.extensions import PluginNotFound
-from fluent_contents.models import ContentItem
+from django.core.management.base import BaseCommand, CommandError
+from fluent_contents.cache import get_placeholder_cache_key, get_placeholder_items_cache_key
+from fluent_contents.models import ContentItem, Placeholder
+from fluent_contents.models.managers import _get_parent_changes, _record_content_changes
+from fluent_contents.models.mixins import delete_cache_keys
+
+if django.VERSION >= (1, 11):
+    from django.db.models import Exists, OuterRef
+else:
+    Exists = None
 
 
 class Command(BaseCommand):
@@ -19,6 +29,14 @@ class Command(BaseCommand):
                 '-u', '--remove-unreferenced', action='store_true', dest='remove_unreferenced',
                 help="Also remove unreferenced items."
             )
+            parser.add_argument(
+                '--batch-size', action='store', dest='batch_size', type=int, default=1000,
+                help="The number of items to process per query."
+            )
+            parser.add_argument(
+                '--resume-from', action='store', dest='resume_from', default=None,
+                help="Continue an interrupted run, using the PASS:ID value that it printed."
+            )
     else:
         from optparse import make_option
         option_list = BaseCommand.option_list + (
@@ -30,18 +48,41 @@ class Command(BaseCommand):
                 '-u', '--remove-unreferenced', action='store_true', dest='remove_unreferenced', default=False,
                 help="Also remove unreferenced items."
             ),
+            make_option(
+                '--batch-size', action='store', dest='batch_size', type='int', default=1000,
+                help="The number of items to process per query."
+            ),
+            make_option(
+                '--resume-from', action='store', dest='resume_from', default=None,
+                help="Continue an interrupted run, using the PASS:ID value that it printed."
+            ),
         )
 
     def handle(self, *args, **options):
         self.dry_run = options['dry_run']
         self.remove_unreferenced = options['remove_unreferenced']
-        #verbosity = options['verbosity']
+        self.batch_size = options['batch_size']
+        self.resume_pass, self.resume_from = self.parse_resume_from(options['resume_from'])
+        self.verbosity = int(options['verbosity'])
 
         stale_cts = self.get_stale_content_types()
 
         self.remove_stale_items(stale_cts)
         self.remove_unreferenced_items(stale_cts)
 
+    def parse_resume_from(self, value):
+        """
+        The command makes several passes over the items, each ordered by ID.
+        The resume value tells which pass was interrupted, e.g. ``stale:1001`` or ``unreferenced-12:1001``.
+        """
+        if not value:
+            return None, None
+
+        pass_name, _, pk = value.rpartition(':')
+        if not pk.isdigit() or _get_pass_order(pass_name) is None:
+            raise CommandError("Invalid --resume-from value '{0}', expected a PASS:ID value.".format(value))
+        return pass_name, int(pk)
+
     def get_stale_content_types(self):
         stale_cts = {}
         for ct in ContentType.objects.all():
@@ -56,36 +97,29 @@ class Command(BaseCommand):
         stale_ct_ids = list(stale_cts.keys())
         items = (ContentItem.objects
                  .non_polymorphic()  # very important, or polymorphic skips them on fetching derived data
-                 .filter(polymorphic_ctype__in=stale_ct_ids)
-                 .order_by('polymorphic_ctype', 'pk')
-                 )
-        if not items:
-            self.stdout.write("No stale items found.")
-            return
+                 .filter(polymorphic_ctype__in=stale_ct_ids))
 
         if self.dry_run:
-            self.stdout.write("The following content items are stale:")
+            header = "The following content items are stale:"
         else:
-            self.stdout.write("The following content items were stale:")
+            header = "The following content items were stale:"
 
-        for item in items:
+        def describe(item):
             ct = stale_cts[item.polymorphic_ctype_id]
-            self.stdout.write("- #{id} points to removed {app_label}.{model}".format(
+            return "- #{id} points to removed {app_label}.{model}".format(
                 id=item.pk, app_label=ct.app_label, model=ct.model
-            ))
+            )
 
-            if not self.dry_run:
-                try:
-                    item.delete()
-                except PluginNotFound:
-                    Model.delete(item)
+        num_stale = self.process_items('stale', items, describe, delete=not self.dry_run, header=header)
+        if not num_stale:
+            self.stdout.write("No stale items found.")
 
     def remove_unreferenced_items(self, stale_cts):
         """
         See if there are items that no longer point to an existing parent.
         """
         stale_ct_ids = list(stale_cts.keys())
-        parent_types = (ContentItem.objects.order_by()
+        parent_types = (ContentItem.objects.order_by('parent_type_id')
                         .exclude(polymorphic_ctype__in=stale_ct_ids)
                         .values_list('parent_type', flat=True).distinct())
 
@@ -94,26 +128,33 @@ class Command(BaseCommand):
         for ct_id in parent_types:
             parent_ct = ContentType.objects.get_for_id(ct_id)
             unreferenced_items = (ContentItem.objects
+                                  .non_polymorphic()
                                   .filter(parent_type=ct_id)
-                                  .order_by('polymorphic_ctype', 'pk'))
+                                  .exclude(polymorphic_ctype__in=stale_ct_ids))  # already reported as stale
 
-            if parent_ct.model_class() is not None:
+            parent_model = parent_ct.model_class()
+            if parent_model is not None:
                 # Only select the items that are part of removed pages,
                 # unless the parent type was removed - then removing all is correct.
-                unreferenced_items = unreferenced_items.exclude(
-                    parent_id__in=parent_ct.get_all_objects_for_this_type()
+                # This uses a NOT EXISTS query, which databases handle better then a NOT IN query.
+                parents = parent_model._base_manager.order_by()
+                if Exists is not None:
+                    unreferenced_items = (unreferenced_items
+                                          .annotate(parent_exists=Exists(parents.filter(pk=OuterRef('parent_id'))))
+                                          .filter(parent_exists=False))
+                else:
+                    unreferenced_items = unreferenced_items.exclude(parent_id__in=parents.values('pk'))
+
+            def describe(item):
+                model = ContentType.objects.get_for_id(item.polymorphic_ctype_id).model_class() or ContentItem
+                return "- {cls}#{id} points to nonexisting {app_label}.{model}".format(
+                    cls=model.__name__, id=item.pk, app_label=parent_ct.app_label, model=parent_ct.model
                 )
 
-            if unreferenced_items:
-                for item in unreferenced_items:
-                    self.stdout.write(
-                        "- {cls}#{id} points to nonexisting {app_label}.{model}".format(
-                            cls=item.__class__.__name__, id=item.pk,
-                            app_label=parent_ct.app_label, model=parent_ct.model
-                        ))
-                    num_unreferenced += 1
-                    if not self.dry_run and self.remove_unreferenced:
-                        item.delete()
+            num_unreferenced += self.process_items(
+                'unreferenced-{0}'.format(ct_id), unreferenced_items, describe,
+                delete=not self.dry_run and self.remove_unreferenced
+            )
 
         if not num_unreferenced:
             self.stdout.write("No unreferenced items found.")
@@ -121,3 +162,88 @@ class Command(BaseCommand):
             self.stdout.write("{0} unreferenced items found.".format(num_unreferenced))
             if not self.remove_unreferenced:
                 self.stdout.write("Re-run this command with --remove-unreferenced to remove these items")
+
+    def process_items(self, pass_name, items, describe, delete=False, header=None):
+        """
+        Walk through the items in chunks ordered by ID, and delete each chunk at once.
+        """
+        if self.resume_pass is not None:
+            resume_order = _get_pass_order(self.resume_pass)
+            pass_order = _get_pass_order(pass_name)
+            if pass_order < resume_order:
+                return 0  # This pass was completed before the run was interrupted.
+            elif pass_order == resume_order:
+                items = items.filter(pk__gte=self.resume_from)
+
+            # The next passes run in full.
+            self.resume_pass = None
+
+        items = items.order_by('pk')
+
+        start = time.time()
+        num_items = 0
+        last_pk = None
+        while True:
+            chunk = items if last_pk is None else items.filter(pk__gt=last_pk)
+            chunk = list(chunk[:self.batch_size])
+            if not chunk:
+                break
+
+            if header and not num_items:
+                self.stdout.write(header)
+            for item in chunk:
+                self.stdout.write(describe(item))
+
+            if delete:
+                self.delete_items(chunk)
+
+            num_items += len(chunk)
+            last_pk = chunk[-1].pk
+            if self.verbosity >= 1:
+                self.stderr.write("Processed {0} items ({1:.0f} items/s), resume with --resume-from={2}:{3}".format(
+                    num_items, num_items / max(time.time() - start, 0.001), pass_name, last_pk + 1
+                ))
+
+        return num_items
+
+    def delete_items(self, items):
+        """
+        Delete the items with a single query per derived table, and clear the cache at once.
+        """
+        cache_keys = self.get_cache_keys(items)
+
+        pks_by_type = defaultdict(list)
+        for item in items:
+            pks_by_type[item.polymorphic_ctype_id].append(item.pk)
+
+        for polymorphic_ctype_id, pks in pks_by_type.items():
+            model = ContentType.objects.get_for_id(polymorphic_ctype_id).model_class() or ContentItem  # stale types
+            model._base_manager.non_polymorphic().filter(pk__in=pks).delete()
+
+        # The bulk delete doesn't send the signals that update the stored search text.
+        _record_content_changes(_get_parent_changes(items), using=ContentItem.objects.db)
+        delete_cache_keys(cache_keys)
+
+    def get_cache_keys(self, items):
+        # The output of the items themselves is never read again,
+        # only the placeholders that displayed the items need to be cleared.
+        # This also works for stale items, which no longer have a plugin.
+        placeholders = Placeholder.objects.in_bulk(set(item.placeholder_id for item in items if item.placeholder_id))
+        keys = set()
+        for item in items:
+            placeholder = placeholders.get(item.placeholder_id)
+            if placeholder is not None:
+                keys.add(get_placeholder_items_cache_key(placeholder.pk, item.language_code))
+                keys.add(get_placeholder_items_cache_key(placeholder.pk, None))
+                keys.add(get_placeholder_cache_key(placeholder, item.language_code))
+        return list(keys)
+
+
+def _get_pass_order(pass_name):
+    # The stale items are handled first, followed by the unreferenced items per parent type ID.
+    if pass_name == 'stale':
+        return (0, 0)
+    prefix, _, ct_id = pass_name.partition('-')
+    if prefix == 'unreferenced' and ct_id.isdigit():
+        return (1, int(ct_id))
+    return None
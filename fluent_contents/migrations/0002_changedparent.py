@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0001_initial'),
+        ('fluent_contents', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangedParent',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('parent_id', models.IntegerField()),
+                ('language_code', models.CharField(default='', max_length=15, blank=True)),
+                ('modified', models.DateTimeField(db_index=True)),
+                ('parent_type', models.ForeignKey(to='contenttypes.ContentType')),
+            ],
+            options={
+                'verbose_name': 'Changed parent',
+                'verbose_name_plural': 'Changed parents',
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterUniqueTogether(
+            name='changedparent',
+            unique_together=set([('parent_type', 'parent_id', 'language_code')]),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fluent_contents', '0002_changedparent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PlaceholderSearchText',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('language_code', models.CharField(default='', max_length=15, blank=True)),
+                ('text', models.TextField(blank=True)),
+                ('placeholder', models.ForeignKey(related_name='search_texts', on_delete=django.db.models.deletion.CASCADE, to='fluent_contents.Placeholder')),
+            ],
+            options={
+                'verbose_name': 'Placeholder search text',
+                'verbose_name_plural': 'Placeholder search texts',
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterUniqueTogether(
+            name='placeholdersearchtext',
+            unique_together=set([('placeholder', 'language_code')]),
+        ),
+    ]
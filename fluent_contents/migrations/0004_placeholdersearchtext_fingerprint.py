@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fluent_contents', '0003_placeholdersearchtext'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='placeholdersearchtext',
+            name='fingerprint',
+            field=models.CharField(default='', max_length=32, blank=True),
+        ),
+    ]
@@ -2,15 +2,18 @@ from __future__ import unicode_literals
 
 from copy import deepcopy
 from django.utils.functional import cached_property
-from future.utils import with_metaclass, python_2_unicode_compatible, PY3
+from future.utils import with_metaclass, python_2_unicode_compatible, string_types, PY3
 from django.contrib.contenttypes.models import ContentType
 from django.db import connection, models
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 from fluent_contents import appsettings
-from fluent_contents.cache import get_placeholder_cache_key
-from fluent_contents.models.managers import PlaceholderManager, ContentItemManager, get_parent_language_code
+from fluent_contents.cache import get_placeholder_cache_key, get_placeholder_lookup_cache_key, get_placeholder_items_cache_key
+from fluent_contents.models.managers import PlaceholderManager, ContentItemManager, ChangedParentManager, get_parent_language_code, _record_content_changes, \
+    _delete_items
 from fluent_contents.models.mixins import CachedModelMixin
+from fluent_contents.signals import content_changed
 from fluent_utils.django_compat import truncate_name
 from fluent_utils.django_compat.moves.contenttypes import GenericForeignKey
 from parler.models import TranslatableModel
@@ -28,7 +31,7 @@ OPTIMIZE_TRANSLATED_MODEL = True
 
 
 @python_2_unicode_compatible
-class Placeholder(models.Model):
+class Placeholder(CachedModelMixin, models.Model):
     """
     The placeholder groups various :class:`ContentItem` models together in a single compartment.
     It is the reference point to render custom content.
@@ -68,12 +71,19 @@ class Placeholder(models.Model):
 
     objects = PlaceholderManager()
 
+    # When adding objects, the lookup cache should still be emptied.
+    clear_cache_on_add = True
+
     class Meta:
         app_label = 'fluent_contents'  # required for subfolder
         verbose_name = _("Placeholder")
         verbose_name_plural = _("Placeholders")
         unique_together = ('parent_type', 'parent_id', 'slot')
 
+    def __init__(self, *args, **kwargs):
+        super(Placeholder, self).__init__(*args, **kwargs)
+        self._old_lookup = (self.parent_type_id, self.parent_id, self.slot)
+
     def __str__(self):
         return self.title or self.slot
 
@@ -150,6 +160,12 @@ class Placeholder(models.Model):
         except AttributeError:
             return None
 
+    def save(self, *args, **kwargs):
+        super(Placeholder, self).save(*args, **kwargs)
+        self._old_lookup = (self.parent_type_id, self.parent_id, self.slot)
+
+    save.alters_data = True
+
     def delete(self, *args, **kwargs):
         # Some databases may not have a proper ON DELETE rule set, causing a DatabaseError on delete.
         # This happened because South 0.7.4 didn't support on_delete=SET_NULL.
@@ -158,6 +174,39 @@ class Placeholder(models.Model):
 
     delete.alters_data = True
 
+    def get_cache_keys(self):
+        """
+        Get a list of all cache keys associated with this model.
+        This clears the lookup by slot name, the item output is cleared by the :class:`ContentItem` instead.
+        """
+        lookups = set([self._old_lookup, (self.parent_type_id, self.parent_id, self.slot)])
+        return [get_placeholder_lookup_cache_key(*lookup) for lookup in lookups]
+
+
+@receiver(post_save, sender=Placeholder)
+@receiver(post_delete, sender=Placeholder)
+def on_content_changed(instance, **kwargs):
+    """
+    Record which parent objects need to be indexed again.
+    The receivers are connected for the placeholder and content item models only,
+    a receiver without a sender would disable the fast delete of all other models.
+    """
+    if not appsettings.FLUENT_CONTENTS_TRACK_CHANGES and not appsettings.FLUENT_CONTENTS_STORE_SEARCH_TEXT \
+            and not content_changed.has_listeners():
+        return
+
+    if isinstance(instance, ContentItem):
+        changes = [
+            (instance.parent_type_id, instance.parent_id, instance.language_code, instance._old_placeholder_id),
+            (instance.parent_type_id, instance.parent_id, instance.language_code, instance.placeholder_id),
+        ]
+    elif isinstance(instance, Placeholder):
+        changes = [(instance.parent_type_id, instance.parent_id, None, instance.pk)]  # All languages use the placeholder
+    else:
+        return
+
+    _record_content_changes(changes, using=kwargs.get('using'))
+
 
 class ContentItemMetaClass(PolymorphicModelBase):
     """
@@ -182,6 +231,12 @@ class ContentItemMetaClass(PolymorphicModelBase):
                     # but also requires duplicating the whole algorithm that Django uses.
                     new_class._meta.original_attrs['db_table'] = new_class._meta.db_table
 
+                # The auto created many-to-many tables were already named after the old db_table.
+                for field in new_class._meta.local_many_to_many:
+                    through = (getattr(field, 'remote_field', None) or field.rel).through
+                    if not isinstance(through, string_types) and through._meta.auto_created and not field.db_table:
+                        through._meta.db_table = truncate_name("%s_%s" % (new_class._meta.db_table, field.name), connection.ops.max_name_length())
+
             # Enforce good manners. The name is often not visible, except for the delete page.
             if not new_class._meta.abstract:
                 if not hasattr(new_class, '__str__') or new_class.__str__ == ContentItem.__str__:
@@ -192,6 +247,10 @@ class ContentItemMetaClass(PolymorphicModelBase):
                         if not hasattr(new_class, '__unicode__') or new_class.__unicode__ == ContentItem.__unicode__:
                             raise TypeError("The {0} class should implement a __unicode__() or __str__() function.".format(name))
 
+        if not new_class._meta.abstract:
+            post_save.connect(on_content_changed, sender=new_class)
+            post_delete.connect(on_content_changed, sender=new_class)
+
         return new_class
 
 
@@ -275,6 +334,12 @@ class ContentItem(with_metaclass(ContentItemMetaClass, CachedModelMixin, Polymor
     placeholder = models.ForeignKey(Placeholder, related_name='contentitems', null=True, on_delete=models.SET_NULL)
     sort_order = models.IntegerField(default=1, db_index=True)
 
+    def __init__(self, *args, **kwargs):
+        super(ContentItem, self).__init__(*args, **kwargs)
+        # Track the old placeholder and language, as moving items also changes that item list.
+        self._old_placeholder_id = self.placeholder_id
+        self._old_language_code = self.language_code
+
     @cached_property
     def plugin(self):
         """
@@ -382,6 +447,8 @@ class ContentItem(with_metaclass(ContentItemMetaClass, CachedModelMixin, Polymor
             self.language_code = get_parent_language_code(self.parent) or appsettings.FLUENT_CONTENTS_DEFAULT_LANGUAGE_CODE
 
         super(ContentItem, self).save(*args, **kwargs)
+        self._old_placeholder_id = self.placeholder_id
+        self._old_language_code = self.language_code
 
     save.alters_data = True
 
@@ -390,22 +457,85 @@ class ContentItem(with_metaclass(ContentItemMetaClass, CachedModelMixin, Polymor
         Get a list of all cache keys associated with this model.
         This queries the associated plugin for the cache keys it used to store the output at.
         """
+        # The list of items is cached for the parent language, which is None for untranslated parents.
+        language_codes = set([self._old_language_code, self.language_code])
+        keys = []
+        for placeholder_id in set([self._old_placeholder_id, self.placeholder_id]):
+            if placeholder_id:
+                keys.extend(get_placeholder_items_cache_key(placeholder_id, language_code) for language_code in language_codes)
+                keys.append(get_placeholder_items_cache_key(placeholder_id, None))
+
         if not self.placeholder_id:
             # TODO: prune old placeholder slot name?
-            return []
+            return keys
 
         # As plugins can change the output caching,
         # they should also return those keys where content is stored at.
         placeholder = self.placeholder
-        keys = [
+        keys.extend([
             # Always make sure the base placeholder is cleared,
             # regardless whether get_output_cache_keys() is overwritten.
-            get_placeholder_cache_key(placeholder, self.language_code),
-        ]
+            get_placeholder_cache_key(placeholder, language_code) for language_code in language_codes
+        ])
         keys.extend(self.plugin.get_output_cache_keys(placeholder.slot, self))  # ensure list return type.
         return keys
 
 
+@python_2_unicode_compatible
+class ChangedParent(models.Model):
+    """
+    .. versionadded:: 1.3
+
+    Records which parent objects have changed content, and when.
+    This allows search indexes to render only the changed objects since their last run.
+    The records are only kept when the :ref:`FLUENT_CONTENTS_TRACK_CHANGES` setting is enabled.
+
+    The ``language_code`` is empty when all languages of the parent are affected.
+    """
+    parent_type = models.ForeignKey(ContentType)
+    parent_id = models.IntegerField()
+    parent = GenericForeignKey('parent_type', 'parent_id')
+    language_code = models.CharField(max_length=15, blank=True, default='')
+    modified = models.DateTimeField(db_index=True)
+
+    objects = ChangedParentManager()
+
+    class Meta:
+        app_label = 'fluent_contents'  # required for models subfolder
+        verbose_name = _("Changed parent")
+        verbose_name_plural = _("Changed parents")
+        unique_together = ('parent_type', 'parent_id', 'language_code')
+
+    def __str__(self):
+        return "{0}#{1} {2}".format(self.parent_type_id, self.parent_id, self.language_code)
+
+
+@python_2_unicode_compatible
+class PlaceholderSearchText(models.Model):
+    """
+    .. versionadded:: 1.3
+
+    The stored search text of a placeholder in a single language.
+    The text is stored by :func:`~fluent_contents.rendering.render_placeholder_search_text`,
+    and removed when the content items of the placeholder change.
+    The records are only kept when the :ref:`FLUENT_CONTENTS_STORE_SEARCH_TEXT` setting is enabled.
+    Texts which were stored before a plugin code or template change are ignored, as their ``fingerprint`` differs.
+    """
+    placeholder = models.ForeignKey(Placeholder, related_name='search_texts', on_delete=models.CASCADE)
+    language_code = models.CharField(max_length=15, blank=True, default='')
+    text = models.TextField(blank=True)
+    fingerprint = models.CharField(max_length=32, blank=True, default='')
+
+    class Meta:
+        app_label = 'fluent_contents'  # required for models subfolder
+        verbose_name = _("Placeholder search text")
+        verbose_name_plural = _("Placeholder search texts")
+        unique_together = ('placeholder', 'language_code')
+
+    def __str__(self):
+        return "{0} {1}".format(self.placeholder_id, self.language_code)
+
+
 # Instead of overriding the admin classes (effectively inserting the TranslatableAdmin
 # in all your PlaceholderAdmin subclasses too), a signal is handled instead.
 # It's up to you to decide whether the use the TranslatableAdmin (or any other similar class)
@@ -423,5 +553,5 @@ def on_delete_model_translation(instance, **kwargs):
 
     # Also delete any associated plugins
     # Placeholders are shared between languages, so these are not affected.
-    for item in ContentItem.objects.parent(parent_object, limit_parent_language=True):
-        item.delete()  # Delete per item, to trigger cache clearing
+    items = ContentItem.objects.parent(parent_object, limit_parent_language=True)
+    _delete_items(items)
@@ -2,14 +2,22 @@
 The manager classes are accessed via ``Placeholder.objects``.
 """
 import six
+from collections import OrderedDict
 
 from future.builtins import str
-from django.db import models
+from django.core.cache import cache
+from django.db import connections, models, transaction, IntegrityError
 from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
 from django.utils.translation import get_language
 from parler.utils import get_language_title
 from polymorphic.manager import PolymorphicManager
 from polymorphic.query import PolymorphicQuerySet
+from fluent_utils.django_compat.moves.contenttypes import GenericRelation
+from fluent_contents import appsettings
+from fluent_contents.cache import get_placeholder_lookup_cache_key, get_placeholder_items_cache_key
+from fluent_contents.models.mixins import delete_cache_keys
+from fluent_contents.signals import content_changed
 
 
 class PlaceholderManager(models.Manager):
@@ -27,11 +35,137 @@ class PlaceholderManager(models.Manager):
     def get_by_slot(self, parent_object, slot):
         """
         Return a placeholder by key.
+
+        .. versionchanged:: 1.3
+           When :ref:`FLUENT_CONTENTS_CACHE_OUTPUT` is enabled, the placeholder is read from the cache when possible.
+           This includes remembering that a placeholder does not exist.
         """
-        placeholder = self.parent(parent_object).get(slot=slot)
+        if appsettings.FLUENT_CONTENTS_CACHE_OUTPUT and parent_object is not None:
+            placeholder = self._get_cached_by_slot(parent_object, slot)
+        else:
+            placeholder = self.parent(parent_object).get(slot=slot)
+
         placeholder.parent = parent_object  # fill the reverse cache
         return placeholder
 
+    def _get_cached_by_slot(self, parent_object, slot):
+        # Placeholders only change when the page layout is changed.
+        # The cache is cleared by Placeholder.save() and Placeholder.delete()
+        parent_type_id = ContentType.objects.get_for_model(parent_object).id
+        cache_key = get_placeholder_lookup_cache_key(parent_type_id, parent_object.pk, slot)
+        values = cache.get(cache_key)
+        if values is None:
+            try:
+                placeholder = self.parent(parent_object).get(slot=slot)
+            except self.model.DoesNotExist:
+                # Also remember that the placeholder doesn't exist yet,
+                # until create_for_object() or Placeholder.save() clears it.
+                cache.set(cache_key, ())
+                raise
+
+            cache.set(cache_key, (placeholder.pk, placeholder.role, placeholder.title))
+            return placeholder
+        elif not values:
+            raise self.model.DoesNotExist("{0} matching query does not exist.".format(self.model._meta.object_name))
+
+        pk, role, title = values
+        placeholder = self.model(
+            pk=pk,
+            slot=slot,
+            role=role,
+            title=title,
+            parent_type_id=parent_type_id,
+            parent_id=parent_object.pk,
+        )
+        placeholder._state.adding = False
+        placeholder._state.db = self.db
+        return placeholder
+
+    def clone_parent(self, source_object, target_object, languages=None):
+        """
+        .. versionadded:: 1.3
+           Copy all placeholders and content items of a parent object to another parent object.
+
+        Missing placeholders are created for the target object, existing placeholders are reused.
+        When the target placeholder already has items, the copies are placed after these items.
+        The copy happens with a fixed number of queries per content item type,
+        see :func:`ContentItemQuerySet.copy_to_placeholder` for the details.
+
+        :param languages: Optional list of language codes to copy, by default all languages are copied.
+        :returns: The list of copied content items.
+        """
+        from .db import ContentItem
+        source_placeholders = list(self.parent(source_object))
+        if not source_placeholders:
+            return []
+
+        target_placeholders = self._get_or_create_for_object(target_object, source_placeholders)
+        placeholder_map = dict((p.pk, target_placeholders[p.slot]) for p in source_placeholders)
+
+        items = ContentItem.objects.parent(source_object, limit_parent_language=False) \
+            .filter(placeholder__in=list(placeholder_map.keys()))
+        if languages:
+            items = items.translated(*languages)
+
+        items = list(items)
+        offsets = _get_sort_order_offsets(list(target_placeholders.values()), using=self.db)
+        return _copy_items([
+            (item, placeholder_map[item.placeholder_id],
+             item.sort_order + offsets.get((placeholder_map[item.placeholder_id].pk, item.language_code), 0))
+            for item in items
+        ], using=self.db)
+
+    def copy_language(self, parent_object, source_language_code, target_language_code):
+        """
+        .. versionadded:: 1.3
+           Copy all content items of a parent object from one language to another language.
+
+        The items are added to the same placeholders, existing items of the target language are kept.
+        The copies are placed after these existing items.
+
+        :returns: The list of copied content items.
+        """
+        from .db import ContentItem
+        placeholders = dict((p.pk, p) for p in self.parent(parent_object))
+        if not placeholders:
+            return []
+
+        items = ContentItem.objects.parent(parent_object, limit_parent_language=False) \
+            .translated(source_language_code) \
+            .filter(placeholder__in=list(placeholders.keys()))
+
+        items = list(items)
+        offsets = _get_sort_order_offsets(list(placeholders.values()), using=self.db)
+        return _copy_items([
+            (item, placeholders[item.placeholder_id],
+             item.sort_order + offsets.get((item.placeholder_id, target_language_code), 0))
+            for item in items
+        ], using=self.db, language_code=target_language_code)
+
+    def _get_or_create_for_object(self, parent_object, source_placeholders):
+        # Fetch the placeholders of the parent, create the missing ones in bulk.
+        parent_attrs = get_parent_lookup_kwargs(parent_object)
+        placeholders = dict((p.slot, p) for p in self.parent(parent_object))
+        new_placeholders = [
+            self.model(slot=p.slot, role=p.role, title=p.title, **parent_attrs)
+            for p in source_placeholders if p.slot not in placeholders
+        ]
+
+        if new_placeholders:
+            new_slots = [p.slot for p in new_placeholders]
+            self.bulk_create(new_placeholders)
+            placeholders.update((p.slot, p) for p in self.parent(parent_object).filter(slot__in=new_slots))
+
+            # bulk_create() doesn't call save(), which clears the cached lookups.
+            parent_type_id = parent_attrs['parent_type'].pk
+            delete_cache_keys([
+                get_placeholder_lookup_cache_key(parent_type_id, parent_object.pk, slot) for slot in new_slots
+            ], using=self.db)
+
+        for placeholder in placeholders.values():
+            placeholder.parent = parent_object  # fill the reverse cache
+        return placeholders
+
     def create_for_object(self, parent_object, slot, role='m', title=None):
         """
         Create a placeholder with the given parameters
@@ -48,6 +182,42 @@ class PlaceholderManager(models.Manager):
         return obj
 
 
+class ChangedParentManager(models.Manager):
+    """
+    Extra methods for the ``ChangedParent.objects``.
+    """
+
+    def mark_changed(self, changes):
+        """
+        .. versionadded:: 1.3
+           Record that the content of parent objects changed.
+
+        :param changes: The ``(parent_type_id, parent_id, language_code)`` tuples of the changed content.
+        """
+        now = timezone.now()
+        for parent_type_id, parent_id, language_code in set(changes):
+            if parent_type_id is None or parent_id is None:
+                continue  # Not saved yet.
+
+            lookup = dict(parent_type_id=parent_type_id, parent_id=parent_id, language_code=language_code or '')
+            if not self.filter(**lookup).update(modified=now):
+                try:
+                    with transaction.atomic(using=self.db):
+                        self.create(modified=now, **lookup)
+                except IntegrityError:
+                    # Created by a concurrent request.
+                    self.filter(**lookup).update(modified=now)
+
+    mark_changed.alters_data = True
+
+    def changed_since(self, watermark):
+        """
+        .. versionadded:: 1.3
+           Return the parent objects that changed since the given date/time.
+        """
+        return self.filter(modified__gte=watermark)
+
+
 class ContentItemQuerySet(PolymorphicQuerySet):
     """
     QuerySet methods for ``ContentItem.objects.``.
@@ -97,25 +267,119 @@ class ContentItemQuerySet(PolymorphicQuerySet):
 
         This method is not available on the manager class, only the queryset
         (similar to the :func:`~django.db.models.query.QuerySet.delete` method).
+
+        .. versionchanged:: 1.3
+           The cache keys of all entries are deleted in a single call.
         """
-        for contentitem in self:
-            contentitem.clear_cache()
+        delete_cache_keys(self.get_cache_keys(), using=self.db)
 
     clear_cache.alters_data = True
 
+    def get_cache_keys(self):
+        """
+        .. versionadded:: 1.3 Return the cache keys of all selected entries.
+
+        The placeholders of the entries are fetched in a single query.
+        """
+        return _get_cache_keys(list(self))
+
+    def update(self, **kwargs):
+        """
+        .. versionchanged:: 1.3
+           The cached lists of items are cleared for the placeholders and languages of the updated entries.
+           The rendered output is not cleared, use :func:`clear_cache` for that.
+        """
+        if not appsettings.FLUENT_CONTENTS_CACHE_OUTPUT:
+            return super(ContentItemQuerySet, self).update(**kwargs)
+
+        rows = list(self.order_by().values_list('pk', 'placeholder_id', 'language_code'))
+        num_updated = super(ContentItemQuerySet, self).update(**kwargs)
+        if rows and any(name in kwargs for name in ('placeholder', 'placeholder_id', 'language_code')):
+            # The entries moved to other lists too.
+            rows += self.model._base_manager.using(self.db).filter(pk__in=[row[0] for row in rows]) \
+                .values_list('pk', 'placeholder_id', 'language_code')
+
+        delete_cache_keys(_get_item_list_cache_keys(row[1:] for row in rows), using=self.db)
+        return num_updated
+
+    update.alters_data = True
+
+    def delete(self):
+        """
+        .. versionchanged:: 1.3
+           The cached lists of items are cleared for the placeholders and languages of the deleted entries.
+        """
+        keys = []
+        if appsettings.FLUENT_CONTENTS_CACHE_OUTPUT:
+            keys = _get_item_list_cache_keys(self.order_by().values_list('placeholder_id', 'language_code').distinct())
+
+        result = super(ContentItemQuerySet, self).delete()
+        delete_cache_keys(keys, using=self.db)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
     def move_to_placeholder(self, placeholder, sort_order=None):
         """
         .. versionadded: 1.0.2 Move the entire queryset to a new object.
 
         Returns a queryset with the newly created objects.
+
+        .. versionchanged:: 1.3
+           The items are moved with a single ``UPDATE`` query, and the cache is cleared at once.
+           Items which override :func:`ContentItem.move_to_placeholder` are still moved one by one.
+           Note that no ``pre_save`` or ``post_save`` signals are sent for the bulk update,
+           only the :data:`~fluent_contents.signals.content_changed` signal.
         """
         qs = self.all()  # Get clone
+        bulk_items = []
         for item in qs:
             # Change the item directly in the resultset.
-            item.move_to_placeholder(placeholder, sort_order=sort_order)
+            if _overrides_method(item, 'move_to_placeholder'):
+                item.move_to_placeholder(placeholder, sort_order=sort_order)
+            else:
+                bulk_items.append((item, sort_order))
+
             if sort_order is not None:
                 sort_order += 1
 
+        if bulk_items:
+            items = [item for item, _ in bulk_items]
+            cache_keys = set(_get_cache_keys(items))  # Includes the old placeholder
+            changes = set(_get_parent_changes(items))
+            for item, item_sort_order in bulk_items:
+                _set_item_placeholder(item, placeholder, item_sort_order)
+
+            update_kwargs = {
+                'placeholder': placeholder,
+                'parent_type': placeholder.parent_type_id,
+                'parent_id': placeholder.parent_id,
+            }
+            base_qs = self.model._base_manager.using(qs.db).non_polymorphic()
+            if sort_order is not None and not hasattr(models, 'Case'):  # Django 1.7
+                # Each item has a different position, hence update each item.
+                with transaction.atomic(using=qs.db):
+                    for item in items:
+                        _update_items(base_qs.filter(pk=item.pk), sort_order=item.sort_order, **update_kwargs)
+            else:
+                if sort_order is not None:
+                    # Assign all new positions in the same query.
+                    update_kwargs['sort_order'] = models.Case(
+                        *[models.When(pk=item.pk, then=models.Value(item.sort_order)) for item in items],
+                        output_field=models.IntegerField()
+                    )
+
+                _update_items(base_qs.filter(pk__in=[item.pk for item in items]), **update_kwargs)
+
+            cache_keys.update(_get_cache_keys(items))
+            for item in items:
+                item._old_placeholder_id = item.placeholder_id
+
+            changes.update(_get_parent_changes(items))
+            _record_content_changes(changes, using=qs.db)
+            delete_cache_keys(cache_keys, using=qs.db)
+
         return qs
 
     move_to_placeholder.alters_data = True
@@ -125,19 +389,305 @@ class ContentItemQuerySet(PolymorphicQuerySet):
         .. versionadded: 1.0 Copy the entire queryset to a new object.
 
         Returns a queryset with the newly created objects.
+
+        .. versionchanged:: 1.3
+           The items are inserted with a single ``INSERT`` query per table, and the cache is cleared at once.
+           Many-to-many relations are copied too, when these use an automatically created ``through`` model.
+           Items which override :func:`ContentItem.copy_to_placeholder` are still copied one by one.
+           Note that no ``pre_save`` or ``post_save`` signals are sent for the bulk insert,
+           only the :data:`~fluent_contents.signals.content_changed` signal.
         """
         qs = self.all()  # Get clone
+        copies = []
         for item in qs:
             # Change the item directly in the resultset.
-            item.copy_to_placeholder(placeholder, sort_order=sort_order, in_place=True)
+            copies.append((item, placeholder, sort_order))
             if sort_order is not None:
                 sort_order += 1
 
+        _copy_items(copies, using=qs.db)
         return qs
 
     copy_to_placeholder.alters_data = True
 
 
+def _copy_items(copies, using, language_code=None):
+    """
+    Copy the content items in-place to a new placeholder.
+    The ``copies`` parameter is a list of ``(contentitem, placeholder, sort_order)`` tuples.
+    """
+    bulk_items = []
+    old_pks = []
+    for contentitem, placeholder, sort_order in copies:
+        if language_code:
+            contentitem.language_code = language_code
+
+        if _overrides_method(contentitem, 'copy_to_placeholder'):
+            contentitem.copy_to_placeholder(placeholder, sort_order=sort_order, in_place=True)
+        else:
+            old_pks.append(contentitem.pk)
+            _reset_item_pk(contentitem)
+            _set_item_placeholder(contentitem, placeholder, sort_order)
+            bulk_items.append(contentitem)
+
+    if bulk_items:
+        _bulk_insert_items(bulk_items, using=using)
+        _bulk_copy_m2m(bulk_items, old_pks, using=using)
+
+        cache_keys = _get_cache_keys(bulk_items)
+        for contentitem in bulk_items:
+            contentitem._old_placeholder_id = contentitem.placeholder_id
+
+        _record_content_changes(_get_parent_changes(bulk_items), using=using)
+        delete_cache_keys(cache_keys, using=using)
+
+    return [contentitem for contentitem, placeholder, sort_order in copies]
+
+
+def _bulk_copy_m2m(contentitems, old_pks, using):
+    # Copy the many-to-many relations with a query per field, instead of a query per object.
+    # Relations with a custom 'through' model can't be copied automatically.
+    new_pks_by_model = OrderedDict()
+    for contentitem, old_pk in zip(contentitems, old_pks):
+        new_pks_by_model.setdefault(contentitem._meta.concrete_model, {})[old_pk] = contentitem.pk
+
+    for model, new_pks in new_pks_by_model.items():
+        for field in model._meta.many_to_many:
+            through = (getattr(field, 'remote_field', None) or field.rel).through
+            if not through._meta.auto_created:
+                continue
+
+            source_attname = through._meta.get_field(field.m2m_field_name()).attname
+            target_attname = through._meta.get_field(field.m2m_reverse_field_name()).attname
+            rows = through._base_manager.using(using) \
+                .filter(**{source_attname + '__in': list(new_pks.keys())}) \
+                .values_list(source_attname, target_attname)
+
+            through._base_manager.using(using).bulk_create([
+                through(**{source_attname: new_pks[source_id], target_attname: target_id})
+                for source_id, target_id in rows
+            ])
+
+
+def _get_sort_order_offsets(placeholders, using):
+    # The highest sort_order per placeholder and language, so copies are added after the existing items.
+    from fluent_contents.models.db import ContentItem  # avoid circular import
+    rows = ContentItem.objects.using(using).non_polymorphic() \
+        .filter(placeholder__in=placeholders) \
+        .values('placeholder', 'language_code') \
+        .annotate(max_sort_order=models.Max('sort_order')) \
+        .order_by()
+    return dict(((row['placeholder'], row['language_code']), row['max_sort_order'] or 0) for row in rows)
+
+
+def _get_cache_keys(contentitems):
+    # Fetch all placeholders at once, instead of a query per item in get_cache_keys()
+    from fluent_contents.models.db import Placeholder  # avoid circular import
+    placeholder_ids = set(contentitem.placeholder_id for contentitem in contentitems if contentitem.placeholder_id)
+    placeholders = Placeholder.objects.in_bulk(placeholder_ids) if placeholder_ids else {}
+
+    keys = set()
+    for contentitem in contentitems:
+        if contentitem.placeholder_id in placeholders:
+            contentitem.placeholder = placeholders[contentitem.placeholder_id]
+        keys.update(contentitem.get_cache_keys())
+    return list(keys)
+
+
+def _get_item_list_cache_keys(rows):
+    # The list of items is cached per placeholder and parent language, which is None for untranslated parents.
+    keys = set()
+    for placeholder_id, language_code in rows:
+        if placeholder_id:
+            keys.add(get_placeholder_items_cache_key(placeholder_id, language_code))
+            keys.add(get_placeholder_items_cache_key(placeholder_id, None))
+    return list(keys)
+
+
+def _update_items(queryset, **kwargs):
+    # For the bulk operations which clear all cache keys of the items themselves.
+    return super(ContentItemQuerySet, queryset).update(**kwargs)
+
+
+def _get_parent_changes(contentitems):
+    return [(item.parent_type_id, item.parent_id, item.language_code, item.placeholder_id) for item in contentitems]
+
+
+def _record_content_changes(changes, using):
+    """
+    Record the changed parents, and clear the stored search text.
+    The ``changes`` are ``(parent_type_id, parent_id, language_code, placeholder_id)`` tuples.
+    The bulk operations don't send signals, so these call this function directly.
+    """
+    from fluent_contents.models.db import ChangedParent, ContentItem, PlaceholderSearchText
+    changes = set(changes)
+    if content_changed.has_listeners():
+        content_changed.send(sender=ContentItem, changes=changes, using=using)
+
+    if appsettings.FLUENT_CONTENTS_TRACK_CHANGES:
+        ChangedParent.objects.db_manager(using).mark_changed(change[:3] for change in changes)
+
+    if appsettings.FLUENT_CONTENTS_STORE_SEARCH_TEXT:
+        # The fallback languages could be affected too, hence all languages are cleared.
+        placeholder_ids = set(change[3] for change in changes if change[3])
+        if placeholder_ids:
+            PlaceholderSearchText.objects.using(using).filter(placeholder__in=placeholder_ids).delete()
+
+
+def _overrides_method(contentitem, name):
+    # Models that override the single-item method still need to use it,
+    # e.g. to transfer M2M relations as the documentation suggests.
+    from fluent_contents.models.db import ContentItem  # avoid circular import
+    return getattr(contentitem.__class__, name) is not getattr(ContentItem, name)
+
+
+def _set_item_placeholder(contentitem, placeholder, sort_order=None):
+    # Same as ContentItem.move_to_placeholder(), without saving.
+    contentitem.placeholder = placeholder
+    contentitem.parent_type_id = placeholder.parent_type_id
+    contentitem.parent_id = placeholder.parent_id
+
+    try:
+        # Copy cache property set by GenericForeignKey (_meta.virtual_fields[0].cache_attr)
+        setattr(contentitem, '_parent_cache', placeholder._parent_cache)
+    except AttributeError:
+        pass
+
+    if sort_order is not None:
+        contentitem.sort_order = sort_order
+
+
+def _reset_item_pk(contentitem):
+    # Reset the primary key of the base and derived tables.
+    for model in [contentitem.__class__] + contentitem._meta.get_parent_list():
+        setattr(contentitem, model._meta.pk.attname, None)
+    contentitem._state.adding = True
+
+
+def _bulk_insert_items(contentitems, using):
+    """
+    Insert new content items, with a query per table instead of a query per object.
+    Django's ``bulk_create()`` doesn't support multi-table inheritance,
+    hence this inserts the base and derived tables the same way ``Model.save_base()`` does.
+    """
+    from fluent_contents.models.db import ContentItem  # avoid circular import
+
+    # All objects share the base table, which generates the primary keys.
+    meta = ContentItem._meta
+    queryset = ContentItem._base_manager.using(using)
+    objs_with_pk = [obj for obj in contentitems if obj.pk is not None]
+    objs_without_pk = [obj for obj in contentitems if obj.pk is None]
+    if objs_with_pk:
+        queryset._batched_insert(objs_with_pk, meta.local_concrete_fields, batch_size=None)
+    if objs_without_pk:
+        fields = [f for f in meta.local_concrete_fields if f is not meta.auto_field]
+        ids = _insert_returning_ids(queryset, objs_without_pk, fields, using=using)
+        for obj, pk in zip(objs_without_pk, ids):
+            setattr(obj, meta.pk.attname, pk)
+
+    items_by_model = OrderedDict()
+    for contentitem in contentitems:
+        items_by_model.setdefault(contentitem._meta.concrete_model, []).append(contentitem)
+
+    for model, objs in items_by_model.items():
+        # Insert the derived tables, which point to the base table.
+        for table_model in reversed([model] + model._meta.get_parent_list()):
+            if table_model is ContentItem:
+                continue
+
+            table_meta = table_model._meta
+            for obj in objs:
+                setattr(obj, table_meta.pk.attname, getattr(obj, meta.pk.attname))
+            table_model._base_manager.using(using)._batched_insert(objs, table_meta.local_concrete_fields, batch_size=None)
+
+    for obj in contentitems:
+        obj._state.adding = False
+        obj._state.db = using
+
+
+def _insert_returning_ids(queryset, objs, fields, using):
+    # Insert the objects in batches, and return the generated primary keys.
+    connection = connections[using]
+    if getattr(connection.features, 'can_return_ids_from_bulk_insert', False):  # Django 1.10+, PostgreSQL
+        return queryset._batched_insert(objs, fields, batch_size=None)
+    else:
+        # Other databases don't tell which ID belongs to which row of a multi-row insert,
+        # e.g. MySQL with innodb_autoinc_lock_mode=2 or the INSERT .. SELECT .. UNION ALL form for SQLite.
+        return [queryset._insert([obj], fields=fields, return_id=True, using=using) for obj in objs]
+
+
+
+def _delete_items(queryset):
+    """
+    Delete the content items of a queryset, with a query per table.
+    The polymorphic queryset can't delete the mixed types at once.
+    Like the other bulk operations, this records the changes at once and clears the cache in a single call.
+    """
+    from fluent_contents.models.db import ContentItem  # avoid circular import
+    using = queryset.db
+    cache_keys = queryset.get_cache_keys()
+
+    pks_by_type = OrderedDict()
+    changes = set()
+    values = queryset.order_by().values_list(
+        'pk', 'polymorphic_ctype_id', 'parent_type_id', 'parent_id', 'language_code', 'placeholder_id'
+    )
+    for pk, polymorphic_ctype_id, parent_type_id, parent_id, language_code, placeholder_id in values:
+        pks_by_type.setdefault(polymorphic_ctype_id, []).append(pk)
+        changes.add((parent_type_id, parent_id, language_code, placeholder_id))
+
+    for polymorphic_ctype_id, pks in pks_by_type.items():
+        model = ContentType.objects.get_for_id(polymorphic_ctype_id).model_class()
+        if model is None:
+            # Stale types, let the collector find the remaining rows.
+            ContentItem._base_manager.using(using).filter(pk__in=pks).non_polymorphic().delete()
+        else:
+            _bulk_delete_items(model, pks, using=using)
+
+    if changes:
+        _record_content_changes(changes, using=using)
+    delete_cache_keys(cache_keys, using=using)
+    return sum(len(pks) for pks in pks_by_type.values())
+
+def _bulk_delete_items(model, pks, using):
+    """
+    Delete content items of a single type, with a query per table instead of fetching each object.
+    The ``Collector`` of ``QuerySet.delete()`` can't do this, as multi-table models are never fast-deleted.
+    Models with other relations than the automatically created many-to-many tables use the regular delete,
+    so the cascades are still followed. Note that no ``pre_delete`` or ``post_delete`` signals are sent
+    for the bulk delete, the caller records the changes instead.
+    """
+    model = model._meta.concrete_model
+    table_models = [model] + list(model._meta.get_parent_list())
+    if not all(_can_raw_delete(table_model) for table_model in table_models):
+        model._base_manager.using(using).filter(pk__in=pks).non_polymorphic().delete()
+        return
+
+    for table_model in table_models:
+        for field in table_model._meta.local_many_to_many:
+            through = (getattr(field, 'remote_field', None) or field.rel).through
+            source_attname = through._meta.get_field(field.m2m_field_name()).attname
+            through._base_manager.using(using).filter(**{source_attname + '__in': pks})._raw_delete(using)
+
+    # Delete the derived tables first, which point to the base table.
+    for table_model in table_models:
+        table_model._base_manager.using(using).filter(pk__in=pks)._raw_delete(using)
+
+
+def _can_raw_delete(model):
+    # Only the parent links of derived models and auto created many-to-many tables may point to the model.
+    opts = model._meta
+    if hasattr(opts, 'related_objects'):
+        related_objects = opts.related_objects
+    else:
+        related_objects = opts.get_all_related_objects() + opts.get_all_related_many_to_many_objects()  # Django 1.7
+    private_fields = opts.private_fields if hasattr(opts, 'private_fields') else opts.virtual_fields  # Django 1.10+
+
+    return all((getattr(rel.field, 'remote_field', None) or rel.field.rel).parent_link for rel in related_objects) \
+        and all((getattr(field, 'remote_field', None) or field.rel).through._meta.auto_created
+                for field in opts.local_many_to_many) \
+        and not any(isinstance(field, GenericRelation) for field in private_fields)
+
 class ContentItemManager(PolymorphicManager):
     """
     Extra methods for ``ContentItem.objects``.
@@ -194,6 +744,86 @@ class ContentItemManager(PolymorphicManager):
 
         return obj
 
+    def bulk_create_items(self, contentitems):
+        """
+        .. versionadded:: 1.3
+           Insert a list of new content items, which can be a mix of different content item types.
+
+        Django's :func:`~django.db.models.query.QuerySet.bulk_create` doesn't support the multi-table inheritance
+        of content items, this method inserts the shared base table in a single batch, and each derived table in
+        a batch per content item type. On databases that can't return the generated primary keys of a batch,
+        such as SQLite and MySQL, the base table rows are still inserted one by one.
+
+        Missing ``parent_type``/``parent_id`` fields are taken from the placeholder,
+        and a missing ``language_code`` is taken from the parent object, fetched with a query per parent type.
+        Like :func:`~django.db.models.query.QuerySet.bulk_create`, the ``save()`` method is not called,
+        and no ``pre_save`` or ``post_save`` signals are sent. The :data:`~fluent_contents.signals.content_changed` signal is sent.
+
+        :returns: The list of inserted objects, with their primary key filled in.
+        """
+        contentitems = list(contentitems)
+        if not contentitems:
+            return contentitems
+
+        _prepare_new_items(contentitems, using=self.db)
+        _bulk_insert_items(contentitems, using=self.db)
+
+        cache_keys = _get_cache_keys(contentitems)
+        for contentitem in contentitems:
+            contentitem._old_placeholder_id = contentitem.placeholder_id
+
+        _record_content_changes(_get_parent_changes(contentitems), using=self.db)
+        delete_cache_keys(cache_keys, using=self.db)
+        return contentitems
+
+    bulk_create_items.alters_data = True
+
+
+def _prepare_new_items(contentitems, using):
+    # Fill the fields that ContentItem.save() and create_for_placeholder() normally provide.
+    # This avoids the per-object queries these would perform.
+    from fluent_contents.models.db import Placeholder  # avoid circular import
+    placeholder_ids = set(obj.placeholder_id for obj in contentitems if obj.placeholder_id and not obj.parent_type_id)
+    if placeholder_ids:
+        placeholders = Placeholder.objects.using(using).in_bulk(placeholder_ids)
+        for obj in contentitems:
+            if not obj.parent_type_id and obj.placeholder_id in placeholders:
+                placeholder = placeholders[obj.placeholder_id]
+                obj.parent_type_id = placeholder.parent_type_id
+                obj.parent_id = placeholder.parent_id
+
+    content_types = ContentType.objects.db_manager(using)
+    for obj in contentitems:
+        if not obj.polymorphic_ctype_id:
+            obj.polymorphic_ctype_id = content_types.get_for_model(obj, for_concrete_model=False).pk
+
+    missing_language = [obj for obj in contentitems if not obj.language_code]
+    if missing_language:
+        parents = _get_parents(missing_language, using=using)
+        for obj in missing_language:
+            parent = parents.get((obj.parent_type_id, obj.parent_id))
+            obj.language_code = (get_parent_language_code(parent) if parent is not None else None) \
+                or appsettings.FLUENT_CONTENTS_DEFAULT_LANGUAGE_CODE
+
+
+def _get_parents(contentitems, using):
+    # Fetch the parent objects with a query per parent type, unless these are already known.
+    parents = {}
+    ids_by_type = OrderedDict()
+    for obj in contentitems:
+        parent = getattr(obj, '_parent_cache', None)  # by GenericForeignKey (_meta.virtual_fields[0].cache_attr)
+        if parent is not None:
+            parents[(obj.parent_type_id, obj.parent_id)] = parent
+        elif obj.parent_type_id:
+            ids_by_type.setdefault(obj.parent_type_id, set()).add(obj.parent_id)
+
+    for parent_type_id, parent_ids in ids_by_type.items():
+        model = ContentType.objects.db_manager(using).get_for_id(parent_type_id).model_class()
+        if model is not None:
+            for parent_id, parent in model._default_manager.using(using).in_bulk(parent_ids).items():
+                parents[(parent_type_id, parent_id)] = parent
+    return parents
+
 
 # This low-level function is used for both ContentItem and Placeholder objects.
 # Only the first has language_code support, the second one not.
@@ -1,4 +1,6 @@
 from django.core.cache import cache
+from django.db import transaction
+from fluent_contents import appsettings
 
 
 class CachedModelMixin(object):
@@ -30,8 +32,11 @@ class CachedModelMixin(object):
     def clear_cache(self):
         """
         Delete the cache keys associated with this model.
+
+        .. versionchanged:: 1.3
+           Inside a transaction, the keys are deleted when the transaction commits.
         """
-        cache.delete_many(self.get_cache_keys())
+        delete_cache_keys(self.get_cache_keys(), using=self._state.db)
 
     clear_cache.alters_data = True
 
@@ -40,3 +45,51 @@ class CachedModelMixin(object):
         Get a list of all cache keys associated with this model.
         """
         raise NotImplementedError("Implement get_cache_keys() or clear_cache()")
+
+
+def delete_cache_keys(keys, using=None):
+    """
+    .. versionadded:: 1.3
+       Delete the cache keys. Inside a transaction, the keys of all objects
+       are collected, and deleted at once when the transaction commits.
+       Otherwise, a concurrent request could cache the old data again.
+    """
+    if not appsettings.FLUENT_CONTENTS_CACHE_CLEAR_ON_COMMIT \
+            or not hasattr(transaction, 'on_commit'):  # Django 1.9+
+        cache.delete_many(keys)
+        return
+
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        cache.delete_many(keys)
+        return
+
+    _get_commit_callback(using, _PendingCacheKeys).keys.update(keys)
+
+
+def _get_commit_callback(using, callback_class, *args):
+    """
+    Return the callback of the given class, which runs when the current transaction commits.
+    The callback is registered on first use, so all changes of the transaction are handled at once.
+    """
+    # Find the callback of this transaction. It's no longer there after a rollback.
+    connection = transaction.get_connection(using)
+    for sids, func in connection.run_on_commit:
+        if isinstance(func, callback_class):
+            return func
+
+    callback = callback_class(*args)
+    transaction.on_commit(callback, using=using)
+    return callback
+
+
+class _PendingCacheKeys(object):
+    """
+    The keys to delete when the transaction commits.
+    """
+
+    def __init__(self):
+        self.keys = set()
+
+    def __call__(self):
+        cache.delete_many(list(self.keys))
@@ -20,20 +20,73 @@ if not appsettings.FLUENT_CODE_SHORTLIST_ONLY:
     LANGUAGE_CHOICES += (_('Advanced'), [t for t in _languageChoices if '+' not in t[0] and t[0] not in appsettings.FLUENT_CODE_SHORTLIST]),
 
 
-def render_code(instance, style_name='default'):
+# The lexers and formatters can be reused, they don't keep state between calls.
+_lexers = {}
+_formatters = {}
+_style_defs = {}
+
+
+def get_lexer(language):
+    """
+    Return the shared lexer for a programming language.
+    """
+    try:
+        return _lexers[language]
+    except KeyError:
+        lexer = _lexers[language] = get_lexer_by_name(language)
+        return lexer
+
+
+def get_formatter(style_name='default', linenos=False):
+    """
+    Return the shared formatter for a style.
+    """
+    key = (style_name, bool(linenos))
+    try:
+        return _formatters[key]
+    except KeyError:
+        pass
+
     # Some interesting options in the HtmlFormatter:
     # - nowrap       -> no wrap inside <pre>
     # - classprefix  -> prefix for the classnames
     # - noclasses    -> all inline styles.
-    #
-    # To get_style_defs(), you can pass a selector prefix.
-    #
     style = styles.get_style_by_name(style_name)
-    formatter = HtmlFormatter(linenos=instance.linenumbers, style=style, nowrap=True, classprefix='code%s-' % instance.pk)
-    html = highlight(instance.code, get_lexer_by_name(instance.language), formatter)
-    css = formatter.get_style_defs()
+    formatter = _formatters[key] = HtmlFormatter(linenos=linenos, style=style, nowrap=True)
+    return formatter
 
-    # Included in a DIV, so the next item will be displayed below.
-    return '<div class="code"><style type="text/css">' + css + '</style>\n<pre>' + html + '</pre></div>\n'
 
-# TODO: Make code rendering more efficient, have one style definition in the head of the page!
+def get_style_class(style_name='default'):
+    """
+    Return the CSS class of the ``<div>`` around the code, which the style definitions apply to.
+    """
+    return 'code-{0}'.format(style_name)
+
+
+def get_style_defs(style_name='default'):
+    """
+    .. versionadded:: 1.3
+       Return the style sheet of a highlighting style.
+       The rules only apply inside the ``<div>`` of the rendered code, so multiple styles can be combined.
+    """
+    try:
+        return _style_defs[style_name]
+    except KeyError:
+        css = _style_defs[style_name] = get_formatter(style_name).get_style_defs('.' + get_style_class(style_name))
+        return css
+
+
+def render_code(instance, style_name='default', include_style=True):
+    """
+    Render the highlighted code.
+
+    .. versionchanged:: 1.3
+       Added the ``include_style`` parameter. Pass ``include_style=False`` when the style sheet
+       is included elsewhere, e.g. via :func:`get_style_defs`, like the ``CodePlugin`` does.
+    """
+    formatter = get_formatter(style_name, linenos=instance.linenumbers)
+    html = highlight(instance.code, get_lexer(instance.language), formatter)
+
+    # Included in a DIV, so the next item will be displayed below.
+    style = '<style type="text/css">' + get_style_defs(style_name) + '</style>\n' if include_style else ''
+    return '<div class="code ' + get_style_class(style_name) + '">' + style + '<pre>' + html + '</pre></div>\n'
@@ -1,11 +1,17 @@
 """
 Definition of the plugin.
 """
+from django.forms import Media
 from django.utils.safestring import mark_safe
 from fluent_contents.extensions import ContentPlugin, plugin_pool
 from fluent_contents.plugins.code.models import CodeItem
 from fluent_contents.plugins.code import appsettings, backend
 
+try:
+    from django.urls import NoReverseMatch, reverse  # Django 1.10+
+except ImportError:
+    from django.core.urlresolvers import NoReverseMatch, reverse
+
 
 @plugin_pool.register
 class CodePlugin(ContentPlugin):
@@ -19,11 +25,32 @@ class CodePlugin(ContentPlugin):
 
     def get_context(self, request, instance, **kwargs):
         # Style is not stored in the model,
-        # it needs to be a side-wide setting (maybe even in the theme)
-        code = mark_safe(backend.render_code(instance, style_name=appsettings.FLUENT_CODE_STYLE))
+        # it needs to be a side-wide setting (maybe even in the theme).
+        # The style sheet is included as frontend media, or inline when the URL is not configured.
+        include_style = get_style_url(appsettings.FLUENT_CODE_STYLE) is None
+        code = mark_safe(backend.render_code(instance, style_name=appsettings.FLUENT_CODE_STYLE, include_style=include_style))
 
         context = super(CodePlugin, self).get_context(request, instance, **kwargs)
         context.update({
             'code': code,
         })
         return context
+
+    def get_frontend_media(self, instance):
+        """
+        Include the style sheet once per page.
+        """
+        url = get_style_url(appsettings.FLUENT_CODE_STYLE)
+        if url is None:
+            return super(CodePlugin, self).get_frontend_media(instance)
+        return Media(css={'screen': (url,)})
+
+
+def get_style_url(style_name):
+    """
+    Return the URL of the style sheet, when ``fluent_contents.plugins.code.urls`` is included in the URLconf.
+    """
+    try:
+        return reverse('fluent_contents_code_style', kwargs={'style_name': style_name})
+    except NoReverseMatch:
+        return None
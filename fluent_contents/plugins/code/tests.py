@@ -0,0 +1,51 @@
+try:
+    from django.urls import reverse  # Django 1.10+
+except ImportError:
+    from django.core.urlresolvers import reverse
+
+from fluent_contents.models import Placeholder
+from fluent_contents.plugins.code import backend
+from fluent_contents.plugins.code.models import CodeItem
+from fluent_contents.tests.testapp.models import TestPage
+from fluent_contents.tests.utils import AppTestCase, render_content_items
+
+
+class CodePluginTests(AppTestCase):
+    """
+    Test the code highlighting.
+    """
+    install_apps = AppTestCase.install_apps + (
+        'fluent_contents.plugins.code',
+    )
+
+    def test_render_code(self):
+        """
+        The style sheet should be included once as frontend media, not in every item.
+        """
+        page = TestPage.objects.create(contents="Code")
+        placeholder = Placeholder.objects.create_for_object(page, 'slot1')
+        item1 = CodeItem.objects.create_for_placeholder(placeholder, language='python', code=u'print("1")', sort_order=1)
+        item2 = CodeItem.objects.create_for_placeholder(placeholder, language='python', code=u'print("2")', sort_order=2)
+
+        output = render_content_items([item1, item2])
+        self.assertEqual(output.html.count(u'<div class="code code-default"><pre>'), 2)
+        self.assertNotIn(u'<style', output.html)
+        self.assertEqual(output.media._css, {'screen': ['/code/default.css']})
+
+        # Calling the backend directly still includes the style sheet.
+        self.assertIn(u'<style type="text/css">', backend.render_code(item1))
+        self.assertNotIn(u'<style', backend.render_code(item1, include_style=False))
+
+        # The lexers and formatters are shared.
+        self.assertIs(backend.get_lexer('python'), backend.get_lexer('python'))
+        self.assertIs(backend.get_formatter('default'), backend.get_formatter('default'))
+
+    def test_code_style(self):
+        """
+        The style sheet should only apply inside the code.
+        """
+        response = self.client.get(reverse('fluent_contents_code_style', kwargs={'style_name': 'default'}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/css; charset=utf-8')
+        self.assertIn(b'.code-default .k {', response.content)
+        self.assert404(reverse('fluent_contents_code_style', kwargs={'style_name': 'nonexistent'}))
@@ -0,0 +1,6 @@
+from django.conf.urls import url
+from fluent_contents.plugins.code import views
+
+urlpatterns = [
+    url(r'^(?P<style_name>[\w-]+)\.css$', views.code_style, name='fluent_contents_code_style'),
+]
@@ -0,0 +1,22 @@
+"""
+Serve the style sheet of the code highlighting.
+"""
+from django.http import Http404, HttpResponse
+from django.utils.cache import patch_cache_control
+from pygments.util import ClassNotFound
+from fluent_contents.plugins.code import backend
+
+
+def code_style(request, style_name):
+    """
+    Return the style definitions of a highlighting style.
+    The output only changes when Pygments is updated, hence browsers may cache it for a day.
+    """
+    try:
+        css = backend.get_style_defs(style_name)
+    except ClassNotFound:
+        raise Http404("Style not found")
+
+    response = HttpResponse(css, content_type='text/css; charset=utf-8')
+    patch_cache_control(response, public=True, max_age=86400)
+    return response
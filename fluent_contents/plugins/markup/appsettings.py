@@ -13,6 +13,9 @@ _SUPPORTED_LANGUAGES = (
 FLUENT_MARKUP_LANGUAGES = getattr(settings, "FLUENT_MARKUP_LANGUAGES", ['restructuredtext', 'markdown', 'textile'])
 FLUENT_MARKUP_MARKDOWN_EXTRAS = getattr(settings, "FLUENT_MARKUP_MARKDOWN_EXTRAS", [])
 
+# How long rendered texts are kept in the cache, 0 only keeps them in memory.
+FLUENT_MARKUP_CACHE_TIMEOUT = getattr(settings, "FLUENT_MARKUP_CACHE_TIMEOUT", 24 * 3600)
+
 # Experimental:
 FLUENT_MARKUP_USE_DJANGO_MARKUP = getattr(settings, 'FLUENT_MARKUP_USE_DJANGO_MARKUP', False)
 
@@ -3,9 +3,29 @@ The rendering support of the markup plugin.
 
 This uses the backends from the actual text processing libraries.
 """
+import threading
+from importlib import import_module
+
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.safestring import mark_safe
+from django.utils.six import string_types
 from fluent_contents.plugins.markup import appsettings
+from fluent_contents.utils.memo import LRUCache, get_content_hash
+
+# The rendered texts, keyed by language, configuration and text hash.
+_rendered_texts = LRUCache(maxsize=1000)
+
+# The Markdown converter can be reused, but not shared between threads.
+_local = threading.local()
+
+# The libraries that render each language, their version is part of the render key.
+_RENDERER_MODULES = {
+    'restructuredtext': 'docutils',
+    'markdown': 'markdown',
+    'textile': 'textile',
+}
+_renderer_versions = {}
 
 
 def render_restructuredtext(text):
@@ -16,8 +36,21 @@ def render_restructuredtext(text):
 
 
 def render_markdown(text):
-    from markdown import markdown
-    return markdown(text, ','.join(appsettings.FLUENT_MARKUP_MARKDOWN_EXTRAS))
+    converter = _get_markdown_converter()
+    converter.reset()
+    return converter.convert(text)
+
+
+def _get_markdown_converter():
+    # Loading the extensions is costly, hence the converter is kept per thread.
+    extensions = list(appsettings.FLUENT_MARKUP_MARKDOWN_EXTRAS)
+    converter = getattr(_local, 'markdown', None)
+    if converter is None or _local.markdown_extensions != extensions:
+        from markdown import Markdown
+        converter = Markdown(extensions=extensions)
+        _local.markdown = converter
+        _local.markdown_extensions = extensions
+    return converter
 
 
 def render_textile(text):
@@ -59,6 +92,10 @@ LANGUAGE_NAMES = dict(LANGUAGE_CHOICES)
 def render_text(text, language=None):
     """
     Render the text, reuses the template filters provided by Django.
+
+    .. versionchanged:: 1.3
+       The results are remembered in memory, and in the cache for ``FLUENT_MARKUP_CACHE_TIMEOUT`` seconds.
+       Rendering the same text again returns the previous result.
     """
     # Get the filter
     text_filter = SUPPORTED_LANGUAGES.get(language, None)
@@ -67,5 +104,46 @@ def render_text(text, language=None):
             language, ', '.join(list(SUPPORTED_LANGUAGES.keys()))
         ))
 
-    # Convert.
-    return text_filter(text)
+    # Convert, or reuse a previous result.
+    key = _get_render_key(text, language)
+    html = _rendered_texts.get(key)
+    if html is None:
+        cache_key = 'fluent_markup.' + key
+        if appsettings.FLUENT_MARKUP_CACHE_TIMEOUT:
+            html = cache.get(cache_key)
+
+        if html is None:
+            html = text_filter(text)
+            if appsettings.FLUENT_MARKUP_CACHE_TIMEOUT:
+                cache.set(cache_key, html, appsettings.FLUENT_MARKUP_CACHE_TIMEOUT)
+
+        _rendered_texts.set(key, html)
+    return html
+
+
+def _get_render_key(text, language):
+    # The output also depends on the settings of the renderer.
+    if appsettings.FLUENT_MARKUP_USE_DJANGO_MARKUP:
+        config = 'django_markup'
+    elif language == 'markdown':
+        config = ','.join(appsettings.FLUENT_MARKUP_MARKDOWN_EXTRAS)
+    else:
+        config = ''
+    config += '@' + _get_renderer_version(language)
+    return '{0}.{1}.{2}'.format(language, get_content_hash(config), get_content_hash(text))
+
+
+def _get_renderer_version(language):
+    # Upgrading the library could change the output, so old cached results are not reused.
+    module_name = 'django_markup' if appsettings.FLUENT_MARKUP_USE_DJANGO_MARKUP else _RENDERER_MODULES.get(language)
+    try:
+        return _renderer_versions[module_name]
+    except KeyError:
+        try:
+            module = import_module(module_name) if module_name else None
+        except ImportError:
+            module = None
+        # Markdown 2.x has a "__version__" submodule, and a "version" string.
+        versions = [getattr(module, name, None) for name in ('__version__', 'version')]
+        _renderer_versions[module_name] = next((v for v in versions if isinstance(v, string_types)), '')
+        return _renderer_versions[module_name]
@@ -1,6 +1,7 @@
 from django.test import TestCase
 from django.utils.encoding import force_text
 
+from fluent_contents.plugins.markup import appsettings, backend
 from fluent_contents.plugins.markup.models import LANGUAGE_MODEL_CLASSES
 from fluent_contents.tests.factories import create_content_item
 from fluent_contents.tests.utils import render_content_items
@@ -22,3 +23,48 @@ RST
 
         expected = '''<div class="markup"><h1 class="title">RST</h1><ul class="simple"><li>Markup!</li></ul></div>'''
         self.assertHTMLEqual(force_text(render_content_items([item])), expected)
+
+    def test_render_text_memo(self):
+        """
+        Rendering the same text again should reuse the previous result.
+        """
+        calls = []
+
+        def render_markdown(text):
+            calls.append(text)
+            return backend.render_markdown(text)
+
+        backend._rendered_texts.clear()
+        text = u"Markdown *text*"
+        old_filter = backend.SUPPORTED_LANGUAGES['markdown']
+        old_extras = appsettings.FLUENT_MARKUP_MARKDOWN_EXTRAS
+        backend.SUPPORTED_LANGUAGES['markdown'] = render_markdown
+        try:
+            self.assertHTMLEqual(backend.render_text(text, 'markdown'), u'<p>Markdown <em>text</em></p>')
+            self.assertHTMLEqual(backend.render_text(text, 'markdown'), u'<p>Markdown <em>text</em></p>')
+            self.assertEqual(len(calls), 1)
+
+            # Other processes find the result in the cache.
+            backend._rendered_texts.clear()
+            backend.render_text(text, 'markdown')
+            self.assertEqual(len(calls), 1)
+
+            # The configuration is part of the key.
+            appsettings.FLUENT_MARKUP_MARKDOWN_EXTRAS = ['markdown.extensions.toc']
+            self.assertHTMLEqual(backend.render_text(u"# Title", 'markdown'), u'<h1 id="title">Title</h1>')
+            self.assertEqual(len(calls), 2)
+
+            # So is the version of the renderer.
+            old_versions = backend._renderer_versions.copy()
+            backend._renderer_versions['markdown'] = '0.0-test'
+            try:
+                backend.render_text(text, 'markdown')
+                self.assertEqual(len(calls), 3)
+            finally:
+                backend._renderer_versions = old_versions
+        finally:
+            backend.SUPPORTED_LANGUAGES['markdown'] = old_filter
+            appsettings.FLUENT_MARKUP_MARKDOWN_EXTRAS = old_extras
+
+        # The converter is reused.
+        self.assertIs(backend._get_markdown_converter(), backend._get_markdown_converter())
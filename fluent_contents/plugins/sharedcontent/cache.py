@@ -8,10 +8,17 @@ def get_shared_content_cache_key_ptr(site_id, slug, language_code):
     """
     Get the rendering cache key for a sharedcontent block.
 
-    This key is an indirection for the actual cache key,
-    which is based on the object ID and parent ID.
+    This key stores the rendered output directly,
+    so the ``{% sharedcontent %}`` tag can fetch it in a single cache call,
+    without knowing the object ID and parent ID first.
+
+    .. versionchanged:: 1.3
+       The key holds the output, instead of pointing to the placeholder cache key.
     """
-    return "sharedcontent_key.{0}.{1}.{2}".format(site_id, slug, language_code)
+    # The items are unknown at this point,
+    # hence the combined fingerprint of all plugins is included here.
+    from fluent_contents.extensions import plugin_pool
+    return "sharedcontent_key.{0}.{1}.{2}.{3}".format(site_id, slug, language_code, plugin_pool.get_fingerprint())
 
 
 def get_shared_content_cache_key(sharedcontent):
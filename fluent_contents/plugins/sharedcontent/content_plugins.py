@@ -2,7 +2,7 @@ from django.conf import settings
 from fluent_contents import appsettings
 from fluent_contents.extensions import ContentPlugin, ContentItemForm, plugin_pool
 from fluent_contents.plugins.sharedcontent.models import SharedContentItem
-from fluent_contents.rendering import render_placeholder, render_placeholder_search_text
+from fluent_contents.rendering import render_placeholder, render_placeholder_search_text, markers
 
 
 class SharedContentItemForm(ContentItemForm):
@@ -28,16 +28,23 @@ class SharedContentPlugin(ContentPlugin):
     model = SharedContentItem
     form = SharedContentItemForm
     category = ContentPlugin.ADVANCED
-    cache_output = False                # Caching happens via the placeholder/template tag.
+    cache_output_per_language = True    # The shared content is rendered in the current language.
     render_ignore_item_language = True  # Only switch for individual items, not this entire block.
     search_fields = True                # Make sure the indexer processes this plugin too.
+    store_search_text = False           # The search text changes with the shared content.
 
     def render(self, request, instance, **kwargs):
         # Not using "template" parameter yet of render_placeholder().
         # The render_placeholder() returns a ContentItemOutput object, which contains both the media and HTML code.
         # Hence, no mark_safe() or escaping is applied here.
         shared_content = instance.shared_content
-        return render_placeholder(request, shared_content.contents, parent_object=shared_content, fallback_language=True)
+        output = render_placeholder(request, shared_content.contents, parent_object=shared_content, fallback_language=True)
+
+        # The output is cached, and cleared by SharedContent.clear_cache() when the shared content changes.
+        # Only avoid caching the edit markers of the frontend editing mode.
+        if markers.is_edit_mode(request):
+            output.cacheable = False
+        return output
 
     # NOTE: typically, get_frontend_media() should be overwritten,
     # but render_placeholder() already tracks all media in the request.
@@ -1,12 +1,16 @@
 from django.conf import settings
 from future.builtins import str
 from future.utils import python_2_unicode_compatible
+from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.models import Site
 from django.db import models
+from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
-from fluent_contents.models.mixins import CachedModelMixin
+from fluent_contents.models.managers import _get_cache_keys
+from fluent_contents.models.mixins import CachedModelMixin, delete_cache_keys
 from fluent_contents.models import ContentItem, PlaceholderField, ContentItemRelation
 from fluent_contents.plugins.sharedcontent.cache import get_shared_content_cache_key_ptr
+from fluent_contents.signals import content_changed
 from parler.models import TranslatableModel, TranslatedFields
 from .managers import SharedContentManager
 from .utils import get_current_site_id
@@ -53,8 +57,20 @@ class SharedContent(CachedModelMixin, TranslatableModel):
         self._was_cross_site = self.is_cross_site
         self._old_slug = self.slug
 
+    def delete(self, *args, **kwargs):
+        # The items that include this content are deleted too,
+        # hence clear the output of the pages that display them while these can still be found.
+        # This replaces the clear_cache() call of CachedModelMixin.delete(), which happens afterwards.
+        self.clear_cache()
+        super(CachedModelMixin, self).delete(*args, **kwargs)
+
+    delete.alters_data = True
+
     def get_cache_keys(self):
-        # When the shared content is saved, make sure all rendering output PTRs are cleared.
+        return _get_sharedcontent_cache_keys([self], using=self._state.db)
+
+    def _get_slug_cache_keys(self):
+        # When the shared content is saved, make sure all rendering output keys are cleared.
         # The 'slug' could have changed. Whether the Placeholder output is cleared,
         # depends on whether those objects are altered too.
         if self.is_cross_site or self._was_cross_site:
@@ -82,3 +98,40 @@ class SharedContentItem(ContentItem):
 
     def __str__(self):
         return str(self.shared_content)
+
+
+# The output is also cached by slug, which the ContentItem.get_cache_keys() doesn't know about.
+# The content_changed signal is also sent for the bulk operations, e.g. move_to_placeholder().
+@receiver(content_changed)
+def _on_content_changed(changes, using=None, **kwargs):
+    sharedcontent_type_id = ContentType.objects.get_for_model(SharedContent).pk
+    parent_ids = set(parent_id for parent_type_id, parent_id, language_code, placeholder_id in changes
+                     if parent_type_id == sharedcontent_type_id)
+    if not parent_ids:
+        return
+
+    sharedcontents = list(SharedContent.objects.using(using).filter(pk__in=parent_ids))
+    delete_cache_keys(_get_sharedcontent_cache_keys(sharedcontents, using=using), using=using)
+
+
+def _get_sharedcontent_cache_keys(sharedcontents, using=None):
+    """
+    Return the cache keys of the shared content objects, and the placeholders that include them.
+    This includes any shared content that embeds these objects, with a few queries per nesting level.
+    """
+    sharedcontent_type_id = ContentType.objects.get_for_model(SharedContent).pk
+    keys = []
+    seen = set()
+    while sharedcontents:
+        seen.update(sharedcontent.pk for sharedcontent in sharedcontents)
+        for sharedcontent in sharedcontents:
+            keys.extend(sharedcontent._get_slug_cache_keys())
+
+        # The placeholders that include this shared content also cache its output.
+        items = list(SharedContentItem.objects.using(using).non_polymorphic().filter(shared_content__in=sharedcontents))
+        keys.extend(_get_cache_keys(items))
+
+        parent_ids = set(item.parent_id for item in items
+                         if item.parent_type_id == sharedcontent_type_id and item.parent_id not in seen)
+        sharedcontents = list(SharedContent.objects.using(using).in_bulk(parent_ids).values()) if parent_ids else []
+    return keys
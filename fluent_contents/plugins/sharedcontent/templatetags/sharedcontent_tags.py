@@ -1,9 +1,11 @@
 from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.template import Library, TemplateSyntaxError
 from django.contrib.sites.models import Site
 from django.utils.translation import get_language
 from fluent_contents import appsettings
 from fluent_contents import rendering
+from fluent_contents.rendering import markers
 from fluent_contents.plugins.sharedcontent.cache import get_shared_content_cache_key_ptr, get_shared_content_cache_key
 from fluent_contents.plugins.sharedcontent.models import SharedContent
 from tag_parser.basetags import BaseAssignmentOrOutputNode
@@ -11,6 +13,8 @@ from fluent_contents.utils.templatetags import is_true, extract_literal
 
 register = Library()
 
+_PREFETCH_KEY = 'fluent_contents.sharedcontent_prefetch'
+
 
 @register.tag('sharedcontent')
 def sharedcontent(parser, token):
@@ -89,11 +93,10 @@ class SharedContentNode(BaseAssignmentOrOutputNode):
             site = Site.objects.get_current()
             if try_cache:
                 # See if there is output cached, try to avoid fetching the SharedContent + Placeholder model.
-                # Have to perform 2 cache calls for this, because the placeholder output key is based on object IDs
-                cache_key_ptr = get_shared_content_cache_key_ptr(int(site.pk), slot, language_code=get_language())
-                cache_key = cache.get(cache_key_ptr)
-                if cache_key is not None:
-                    output = cache.get(cache_key)
+                # The output is stored by slug, so this only takes a single cache call,
+                # which is shared with the other {% sharedcontent %} tags of the template.
+                cache_key = get_shared_content_cache_key_ptr(int(site.pk), slot, language_code=get_language())
+                output = self.get_cached_output(context, cache_key, int(site.pk), get_language())
 
             if output is None:
                 # Get the placeholder
@@ -102,10 +105,16 @@ class SharedContentNode(BaseAssignmentOrOutputNode):
                 except SharedContent.DoesNotExist:
                     return "<!-- shared content '{0}' does not yet exist -->".format(slot)
 
-                # Now that we've fetched the object, the object key be generated.
-                # No real need to check for output again, render_placeholder() does that already.
-                if try_cache and not cache_key:
-                    cache.set(cache_key_ptr, get_shared_content_cache_key(sharedcontent))
+                # Have to fetch + render it.
+                output = self.render_shared_content(request, sharedcontent, template_name, cachable=cachable)
+
+                # Store the output by slug too. The render_placeholder() function only
+                # stores the output under the object ID, which is not known beforehand.
+                if try_cache and output.cacheable and not markers.is_edit_mode(request):
+                    if output.cache_timeout is not DEFAULT_TIMEOUT:
+                        cache.set(cache_key, output, output.cache_timeout)
+                    else:
+                        cache.set(cache_key, output)
 
         if output is None:
             # Have to fetch + render it.
@@ -114,6 +123,25 @@ class SharedContentNode(BaseAssignmentOrOutputNode):
         rendering.register_frontend_media(request, output.media)  # Need to track frontend media here, as the template tag can't return it.
         return output.html
 
+    def get_cached_output(self, context, cache_key, site_id, language_code):
+        """
+        Fetch the cached output. The first tag fetches the output for all
+        ``{% sharedcontent %}`` tags of the template with a single ``get_many()`` call.
+        """
+        prefetched = context.render_context.get(_PREFETCH_KEY)
+        if prefetched is None or cache_key not in prefetched:
+            cache_keys = [cache_key]
+            for slot in _get_template_slots(context):
+                cache_keys.append(get_shared_content_cache_key_ptr(site_id, slot, language_code=language_code))
+
+            # Missing keys are stored too, so the other tags won't perform a cache call either.
+            prefetched = dict.fromkeys(cache_keys)
+            prefetched.update(cache.get_many(cache_keys))
+            context.render_context[_PREFETCH_KEY] = prefetched
+
+        # Only use the prefetched value once, a next call could happen after the output is stored.
+        return prefetched.pop(cache_key)
+
     def render_shared_content(self, request, sharedcontent, template_name=None, cachable=None):
         # All parsing done, perform the actual rendering
         placeholder = sharedcontent.contents  # Another DB query
@@ -122,3 +150,18 @@ class SharedContentNode(BaseAssignmentOrOutputNode):
             cachable=cachable,
             fallback_language=True
         )
+
+
+def _get_template_slots(context):
+    # Find the slot names of all {% sharedcontent %} tags in the current template.
+    # Django 1.11 tracks the template of included/extended templates in the render context.
+    template = getattr(context.render_context, 'template', None) or getattr(context, 'template', None)
+    if template is None:
+        return []
+
+    slots = []
+    for node in template.nodelist.get_nodes_by_type(SharedContentNode):
+        slot = extract_literal(node.args[0])
+        if slot:
+            slots.append(slot)
+    return slots
@@ -12,3 +12,7 @@ def smartypants_filter(textitem, html):
     Apply smartypants to the text.
     """
     return smartypants(html)
+
+
+# The output only depends on the text.
+smartypants_filter.memoize = True
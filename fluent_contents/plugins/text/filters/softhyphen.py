@@ -20,3 +20,7 @@ def softhyphen_filter(textitem, html):
         language = "{0}-{0}".format(language)
 
     return hyphenate(html, language=language)
+
+
+# The output only depends on the text and language.
+softhyphen_filter.memoize = True
@@ -0,0 +1,202 @@
+import multiprocessing
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from django.utils.encoding import force_text
+from fluent_contents.models.managers import _record_content_changes, _update_items
+from fluent_contents.models.mixins import delete_cache_keys
+from fluent_contents.plugins.text.models import TextItem
+from fluent_contents.utils.filters import apply_filters
+
+try:
+    from django.db.models import Case, Value, When
+except ImportError:
+    Case = None  # Django 1.7
+
+
+class Command(BaseCommand):
+    """
+    Apply the HTML cleanup and text filters again to all text items.
+    This is needed after changing the ``FLUENT_TEXT_PRE_FILTERS``, ``FLUENT_TEXT_POST_FILTERS``
+    or ``FLUENT_TEXT_CLEAN_HTML`` settings.
+    """
+    help = "Apply the text filters again to all text items, after the settings changed."
+
+    if getattr(BaseCommand, 'add_arguments', None):  # Django 1.8+
+        def add_arguments(self, parser):
+            super(Command, self).add_arguments(parser)
+            parser.add_argument(
+                '-p', '--dry-run', action='store_true', dest='dry_run',
+                help="Only list what will change, don't make the actual changes."
+            )
+            parser.add_argument(
+                '--processes', action='store', dest='processes', type=int, default=1,
+                help="The number of worker processes to filter the text items with."
+            )
+            parser.add_argument(
+                '--chunk-size', action='store', dest='chunk_size', type=int, default=500,
+                help="The number of text items to filter per task."
+            )
+    else:
+        from optparse import make_option
+        option_list = BaseCommand.option_list + (
+            make_option(
+                '-p', '--dry-run', action='store_true', dest='dry_run', default=False,
+                help="Only list what will change, don't make the actual changes."
+            ),
+            make_option(
+                '--processes', action='store', dest='processes', type='int', default=1,
+                help="The number of worker processes to filter the text items with."
+            ),
+            make_option(
+                '--chunk-size', action='store', dest='chunk_size', type='int', default=500,
+                help="The number of text items to filter per task."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = int(options['verbosity'])
+        self.chunk_size = options['chunk_size']
+        dry_run = options['dry_run']
+
+        start = time.time()
+        num_items = 0
+        num_changed = 0
+        cache_keys = set()
+        changes = set()
+        for results, keys, parent_changes, errors, num_chunk_items in self.run_tasks(self.get_tasks(), options['processes']):
+            for pk, message in errors:
+                self.stderr.write("TextItem #{0} is not changed: {1}".format(pk, message))
+
+            if results:
+                if dry_run:
+                    for pk, text, text_final in results:
+                        self.stdout.write("- TextItem #{0} will change".format(pk))
+                else:
+                    update_items(results)
+
+            num_items += num_chunk_items
+            num_changed += len(results)
+            cache_keys.update(keys)
+            changes.update(parent_changes)
+
+            if self.verbosity >= 2:
+                self.stderr.write("- processed {0} text items ({1:.0f} items/s)".format(
+                    num_items, num_items / max(time.time() - start, 0.001)
+                ))
+
+        if not dry_run:
+            # Clear all caches at once, instead of a cache call per saved item.
+            _record_content_changes(changes, using=TextItem.objects.db)
+            delete_cache_keys(list(cache_keys))
+
+        if self.verbosity >= 1:
+            duration = max(time.time() - start, 0.001)
+            self.stderr.write("{0} {1} of {2} text items in {3:.1f} seconds ({4:.0f} items/s).".format(
+                "Found changes in" if dry_run else "Updated", num_changed, num_items, duration, num_items / duration
+            ))
+
+    def get_tasks(self):
+        """
+        Split the text items in ranges of primary keys.
+        """
+        qs = TextItem.objects.non_polymorphic().order_by('pk').values_list('pk', flat=True)
+        tasks = []
+        last_pk = None
+        while True:
+            chunk = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+            pks = list(chunk[:self.chunk_size])
+            if not pks:
+                return tasks
+
+            tasks.append((pks[0], pks[-1]))
+            last_pk = pks[-1]
+
+    def run_tasks(self, tasks, processes):
+        if processes <= 1:
+            for task in tasks:
+                yield filter_chunk(task)
+            return
+
+        # The worker processes should not share the database connection of this process.
+        connections.close_all()
+        pool = multiprocessing.Pool(processes, initializer=connections.close_all)
+        try:
+            for result in pool.imap_unordered(filter_chunk, tasks):
+                yield result
+            pool.close()
+            pool.join()
+        finally:
+            pool.terminate()
+
+
+def filter_chunk(task):
+    """
+    Apply the filters to a range of text items.
+    This runs in a worker process, hence it only receives and returns simple values.
+    Only the changed items are returned.
+    """
+    first_pk, last_pk = task
+    text_field = TextItem._meta.get_field('text')
+
+    results = []
+    errors = []
+    changed_items = []
+    try:
+        items = list(TextItem.objects.filter(pk__gte=first_pk, pk__lte=last_pk).order_by('pk'))
+        for item in items:
+            try:
+                # Same steps as TextItem.full_clean(), the field applies the HTML cleanup.
+                text, text_final = apply_filters(item, text_field.to_python(item.text), field_name='text')
+            except ValidationError as e:
+                errors.append((item.pk, u"; ".join(force_text(message) for message in e.messages)))
+                continue
+
+            text = force_text(text)
+            text_final = force_text(text_final) if text_final != text else None
+            if text != item.text or text_final != item.text_final:
+                results.append((item.pk, text, text_final))
+                changed_items.append(item)
+
+        # The cache keys also include the output of the placeholders.
+        cache_keys = TextItem.objects.filter(pk__in=[item.pk for item in changed_items]).get_cache_keys() if changed_items else []
+        parent_changes = [
+            (item.parent_type_id, item.parent_id, item.language_code, item.placeholder_id)
+            for item in changed_items
+        ]
+    finally:
+        if multiprocessing.current_process().name != 'MainProcess':
+            # Don't keep connections open in idle workers.
+            connections.close_all()
+
+    return results, cache_keys, parent_changes, errors, len(items)
+
+
+def update_items(results, batch_size=100):
+    """
+    Write the new texts with a single query per batch.
+    """
+    if hasattr(TextItem.objects, 'bulk_update'):  # Django 2.2+
+        items = [TextItem(pk=pk, text=text, text_final=text_final) for pk, text, text_final in results]
+        TextItem.objects.bulk_update(items, ['text', 'text_final'], batch_size=batch_size)
+        return
+
+    if Case is None:
+        with transaction.atomic():
+            for pk, text, text_final in results:
+                _update_items(TextItem._base_manager.non_polymorphic().filter(pk=pk), text=text, text_final=text_final)
+        return
+
+    # Same as bulk_update(), using an UPDATE .. SET text = CASE WHEN .. query.
+    text_field = TextItem._meta.get_field('text')
+    text_final_field = TextItem._meta.get_field('text_final')
+    with transaction.atomic():
+        for i in range(0, len(results), batch_size):
+            batch = results[i:i + batch_size]
+            _update_items(
+                TextItem._base_manager.non_polymorphic().filter(pk__in=[pk for pk, text, text_final in batch]),
+                text=Case(*[When(pk=pk, then=Value(text)) for pk, text, text_final in batch], output_field=text_field),
+                text_final=Case(*[When(pk=pk, then=Value(text_final)) for pk, text, text_final in batch], output_field=text_final_field),
+            )
@@ -1,6 +1,8 @@
 from __future__ import print_function
 import html5lib
 from unittest import TestCase
+from fluent_contents.plugins.text.models import TextItem
+from fluent_contents.utils.filters import _apply_filter
 from fluent_contents.utils.html import clean_html
 
 
@@ -36,3 +38,38 @@ class TextPluginTests(TestCase):
         self.assertTrue('float: left' in sanitized, u"Missing elements in {0}".format(sanitized))
         self.assertTrue('/media/image.jpg' in sanitized, u"Missing elements in {0}".format(sanitized))
         self.assertTrue('/media/image2.jpg' in sanitized, u"Missing elements in {0}".format(sanitized))
+
+    def test_clean_html_backends(self):
+        """
+        Test whether the faster tree types give the same output, and the results are remembered.
+        """
+        for sanitize in (False, True):
+            expected = clean_html(self.HTML1_ORIGINAL, sanitize=sanitize, backend='dom')
+            self.assertEqual(clean_html(self.HTML1_ORIGINAL, sanitize=sanitize, backend='etree'), expected)
+
+        html = u'<p>Foo<b>bar</b><i>Ooops!</p>'
+        self.assertIs(clean_html(html), clean_html(html))
+
+    def test_memoize_filters(self):
+        """
+        Test whether the results of filters are only remembered when they allow it.
+        """
+        calls = []
+
+        def upper_filter(textitem, html):
+            calls.append(html)
+            return html.upper()
+
+        textitem = TextItem(language_code='en')
+        self.assertEqual(_apply_filter(upper_filter, textitem, u'<p>a</p>'), u'<P>A</P>')
+        self.assertEqual(_apply_filter(upper_filter, textitem, u'<p>a</p>'), u'<P>A</P>')
+        self.assertEqual(len(calls), 2)
+
+        upper_filter.memoize = True
+        self.assertEqual(_apply_filter(upper_filter, textitem, u'<p>b</p>'), u'<P>B</P>')
+        self.assertEqual(_apply_filter(upper_filter, textitem, u'<p>b</p>'), u'<P>B</P>')
+        self.assertEqual(len(calls), 3)
+
+        textitem.language_code = 'nl'
+        self.assertEqual(_apply_filter(upper_filter, textitem, u'<p>b</p>'), u'<P>B</P>')
+        self.assertEqual(len(calls), 4)
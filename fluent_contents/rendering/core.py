@@ -1,4 +1,5 @@
 import logging
+from collections import OrderedDict
 
 import django
 import six
@@ -14,7 +15,7 @@ from django.utils.safestring import mark_safe
 from parler.utils.context import smart_override
 from fluent_utils.django_compat import is_queryset_empty
 from fluent_contents import appsettings
-from fluent_contents.cache import get_rendering_cache_key, get_placeholder_cache_key_for_parent
+from fluent_contents.cache import get_rendering_cache_key, get_placeholder_cache_key_for_parent, get_placeholder_items_cache_key
 from fluent_contents.extensions import PluginNotFound
 from fluent_contents.models import ContentItemOutput, DEFAULT_TIMEOUT, get_parent_language_code
 from . import markers
@@ -165,22 +166,27 @@ class RenderingPipe(object):
         self.edit_mode = edit_mode
         optimize_logger_level(logger, logging.DEBUG)
 
+    def _render_empty_placeholder(self, placeholder):
+        return ContentItemOutput(mark_safe(u"<!-- no items in placeholder '{0}' -->".format(escape(get_placeholder_name(placeholder)))), cacheable=True)
+
     def render_items(self, placeholder, items, parent_object=None, template_name=None, cachable=None):
         """
         The main rendering sequence.
         """
         # Unless it was done before, disable polymorphic effects.
-        is_queryset = False
-        if hasattr(items, "non_polymorphic"):
-            is_queryset = True
+        queryset = None
+        if isinstance(items, CachedItemList):
+            queryset = items.queryset
+        elif hasattr(items, "non_polymorphic"):
             if not items.polymorphic_disabled and items._result_cache is None:
                 items = items.non_polymorphic()
+            queryset = items
 
         # See if the queryset contained anything.
         # This test is moved here, to prevent earlier query execution.
         if not items:
             logger.debug("- no items in placeholder '%s'", get_placeholder_debug_name(placeholder))
-            return ContentItemOutput(mark_safe(u"<!-- no items in placeholder '{0}' -->".format(escape(get_placeholder_name(placeholder)))), cacheable=True)
+            return self._render_empty_placeholder(placeholder)
 
         # Tracked data during rendering:
         result = self.result_class(
@@ -193,10 +199,10 @@ class RenderingPipe(object):
         if self.edit_mode:
             result.set_uncachable()
 
-        if is_queryset:
+        if queryset is not None:
             # Phase 1: get cached output
             self._fetch_cached_output(items, result=result)
-            result.fetch_remaining_instances(queryset=items)
+            result.fetch_remaining_instances(queryset=queryset)
         else:
             # The items is either a list of manually created items, or it's a QuerySet.
             # Can't prevent reading the subclasses only, so don't bother with caching here.
@@ -266,32 +272,56 @@ class RenderingPipe(object):
     def _render_uncached_items(self, items, result):
         """
         Render a list of items, that didn't exist in the cache yet.
+
+        The items are rendered in groups per language, so the translation is only activated once per group.
+        The result object keeps track of the original ordering.
+        """
+        for render_language, language_items in self._group_by_render_language(items, result):
+            with smart_override(render_language):
+                for contentitem in language_items:
+                    # Render the item.
+                    # Allow derived classes to skip it.
+                    try:
+                        output = self.render_item(contentitem)
+                    except PluginNotFound as ex:
+                        result.store_exception(contentitem, ex)
+                        logger.debug("- item #%s has no matching plugin: %s", contentitem.pk, str(ex))
+                        continue
+                    except SkipItem:
+                        result.set_skipped(contentitem)
+                        continue
+
+                    # Try caching it.
+                    self._try_cache_output(contentitem, output, result=result)
+                    if self.edit_mode:
+                        output.html = markers.wrap_contentitem_output(output.html, contentitem)
+
+                    result.store_output(contentitem, output)
+
+    def _group_by_render_language(self, items, result):
+        """
+        Group the items by the language they should be rendered in.
+        The languages are determined upfront, as some plugins render in the currently active language.
         """
+        groups = OrderedDict()
         for contentitem in items:
-            # Render the item.
-            # Allow derived classes to skip it.
             try:
-                output = self.render_item(contentitem)
+                render_language = get_render_language(contentitem)
             except PluginNotFound as ex:
                 result.store_exception(contentitem, ex)
                 logger.debug("- item #%s has no matching plugin: %s", contentitem.pk, str(ex))
                 continue
-            except SkipItem:
-                result.set_skipped(contentitem)
-                continue
 
-            # Try caching it.
-            self._try_cache_output(contentitem, output, result=result)
-            if self.edit_mode:
-                output.html = markers.wrap_contentitem_output(output.html, contentitem)
+            groups.setdefault(render_language, []).append(contentitem)
 
-            result.store_output(contentitem, output)
+        return groups.items()
 
     def render_item(self, contentitem):
         """
         Render the individual item.
         May raise :class:`SkipItem` to ignore an item.
         """
+        # This is a no-op when _render_uncached_items() already activated the language.
         render_language = get_render_language(contentitem)
         with smart_override(render_language):
             # Plugin output is likely HTML, but it should be placed in mark_safe() to raise awareness about escaping.
@@ -421,7 +451,7 @@ class PlaceholderRenderingPipe(RenderingPipe):
 
         if output is None:
             # Get the items, and render them
-            items, is_fallback = self._get_placeholder_items(placeholder, parent_object, limit_parent_language, fallback_language, try_cache)
+            items, is_fallback = self._get_placeholder_items(placeholder, parent_object, language_code, limit_parent_language, fallback_language, try_cache)
             output = self.render_items(placeholder, items, parent_object, template_name, cachable)
 
             if is_fallback:
@@ -440,11 +470,13 @@ class PlaceholderRenderingPipe(RenderingPipe):
 
         return output
 
-    def _get_placeholder_items(self, placeholder, parent_object, limit_parent_language, fallback_language, try_cache):
+    def _get_placeholder_items(self, placeholder, parent_object, language_code, limit_parent_language, fallback_language, try_cache):
         # No full-placeholder cache. Get the items
         items = placeholder.get_content_items(parent_object, limit_parent_language=limit_parent_language).non_polymorphic()
         if is_queryset_empty(items):  # Detect qs.none() was applied
             logging.debug("- skipping regular language, parent object has no translation for it.")
+        elif limit_parent_language:
+            items = self._fetch_cached_items(placeholder, items, language_code)
 
         if fallback_language \
         and not items:  # NOTES: performs query, so hence the .non_polymorphic() above
@@ -452,10 +484,29 @@ class PlaceholderRenderingPipe(RenderingPipe):
             language_code = appsettings.FLUENT_CONTENTS_DEFAULT_LANGUAGE_CODE if fallback_language is True else fallback_language
             logger.debug("- reading fallback language %s, try_cache=%s", language_code, try_cache)
             items = placeholder.get_content_items(parent_object, limit_parent_language=False).translated(language_code).non_polymorphic()
+            items = self._fetch_cached_items(placeholder, items, language_code)
             return items, True
         else:
             return items, False
 
+    def _fetch_cached_items(self, placeholder, items, language_code):
+        """
+        Return the base items from the cache, or store them in the cache.
+        When all item output is also cached, the placeholder can be rendered without database queries.
+        """
+        if not appsettings.FLUENT_CONTENTS_CACHE_OUTPUT or not self.use_cached_output or not placeholder.pk:
+            return items
+
+        cache_key = get_placeholder_items_cache_key(placeholder.pk, language_code)
+        rows = cache.get(cache_key)
+        if rows is None:
+            # Performs the query, the queryset results can be used directly afterwards.
+            rows = [tuple(getattr(item, name) for name in _CACHED_ITEM_FIELDS) for item in items]
+            cache.set(cache_key, rows)
+            return items
+        else:
+            return CachedItemList([_get_cached_item(items, placeholder, row) for row in rows], queryset=items)
+
     @classmethod
     def may_cache_placeholders(cls):
         return appsettings.FLUENT_CONTENTS_CACHE_OUTPUT \
@@ -466,6 +517,29 @@ class SkipItem(RuntimeError):
     pass
 
 
+class CachedItemList(list):
+    """
+    The base items of a placeholder, which are read from the cache.
+    The queryset is kept to fetch the derived models of the items that have no cached output.
+    """
+
+    def __init__(self, items, queryset):
+        super(CachedItemList, self).__init__(items)
+        self.queryset = queryset
+
+
+# The fields which are needed to read the item output from the cache, or fetch the derived models.
+_CACHED_ITEM_FIELDS = ('pk', 'polymorphic_ctype_id', 'parent_type_id', 'parent_id', 'language_code', 'sort_order')
+
+
+def _get_cached_item(queryset, placeholder, row):
+    # Construct the base object, as if it was fetched by the queryset.
+    contentitem = queryset.model(placeholder=placeholder, **dict(zip(_CACHED_ITEM_FIELDS, row)))
+    contentitem._state.adding = False
+    contentitem._state.db = queryset.db
+    return contentitem
+
+
 def _get_stale_item_class_name(item):
     try:
         return item.plugin.type_name
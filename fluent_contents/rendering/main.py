@@ -4,10 +4,12 @@ This is exposed via __init__.py
 """
 from django.core.cache import cache
 from django.utils.safestring import mark_safe
+from fluent_contents import appsettings
 from fluent_contents.cache import get_placeholder_cache_key_for_parent
 from fluent_contents.models import ContentItemOutput, get_parent_language_code
+from fluent_contents.utils.search import clean_join
 from .core import RenderingPipe, PlaceholderRenderingPipe
-from .search import SearchRenderingPipe
+from .search import SearchRenderingPipe, get_plain_search_text, get_search_items_bulk, get_stored_search_text, store_search_text
 from . import markers
 
 
@@ -114,12 +116,89 @@ def render_placeholder_search_text(placeholder, fallback_language=None):
                               Passing ``True`` uses the default :ref:`FLUENT_CONTENTS_DEFAULT_LANGUAGE_CODE`.
     :type fallback_language: bool|str
     :rtype: str
+
+    .. versionchanged:: 1.3
+       The search text is stored when :ref:`FLUENT_CONTENTS_STORE_SEARCH_TEXT` is enabled.
+       The result is plain text with decoded entities, which should be escaped when it's displayed as HTML.
     """
     parent_object = placeholder.parent   # this is a cached lookup thanks to PlaceholderFieldDescriptor
     language = get_parent_language_code(parent_object)
-    output = SearchRenderingPipe(language).render_placeholder(
+
+    store = appsettings.FLUENT_CONTENTS_STORE_SEARCH_TEXT and placeholder.pk
+    if store:
+        text = get_stored_search_text(placeholder, language)
+        if text is not None:
+            return get_plain_search_text(text)
+
+    pipe = SearchRenderingPipe(language)
+    output = pipe.render_placeholder(
         placeholder=placeholder,
         parent_object=parent_object,
         fallback_language=fallback_language
     )
-    return output.html   # Tags already stripped.
+
+    if store and pipe.is_storable:
+        store_search_text(placeholder, language, output.html)
+    return get_plain_search_text(output.html)   # Tags already stripped.
+
+
+def render_search_text_bulk(parents, slots=None, language=None, fallback_language=None, chunk_size=100, pipe_class=SearchRenderingPipe):
+    """
+    .. versionadded:: 1.3
+
+    Render the search text of many parent objects at once.
+    This is a variation of :func:`render_placeholder_search_text` for (re)indexing a complete site.
+
+    The parents are processed in chunks, so the placeholders and content items
+    are fetched with a few queries per chunk instead of a few queries per placeholder.
+    The dummy request is created only once per language.
+
+    :param parents: The parent objects, e.g. a queryset or iterator.
+    :param slots: Optional, the placeholder slots to include. By default all placeholders are included.
+    :type slots: list[str] | None
+    :param language: Optional, the language of the content items. Defaults to the language of each parent object.
+    :type language: str | None
+    :param fallback_language: The fallback language to use if a placeholder has no items in the current language.
+                              Passing ``True`` uses the default :ref:`FLUENT_CONTENTS_DEFAULT_LANGUAGE_CODE`.
+    :type fallback_language: bool|str
+    :param chunk_size: The number of parent objects to fetch the content items for at once.
+    :type chunk_size: int
+    :param pipe_class: The rendering class, which can be a subclass of :class:`~fluent_contents.rendering.search.SearchRenderingPipe`.
+    :returns: A generator that yields ``(parent, text)`` tuples, the text is plain text with decoded entities.
+    """
+    pipes = {}
+    chunk = []
+    for parent in parents:
+        chunk.append(parent)
+        if len(chunk) >= chunk_size:
+            for result in _render_search_text_chunk(pipes, pipe_class, chunk, slots, language, fallback_language):
+                yield result
+            chunk = []
+
+    if chunk:
+        for result in _render_search_text_chunk(pipes, pipe_class, chunk, slots, language, fallback_language):
+            yield result
+
+
+def _render_search_text_chunk(pipes, pipe_class, parents, slots, language, fallback_language):
+    languages = [language or get_parent_language_code(parent) for parent in parents]
+    placeholder_items = get_search_items_bulk(parents, languages, slots=slots, fallback_language=fallback_language)
+
+    for parent, parent_language, placeholders in zip(parents, languages, placeholder_items):
+        try:
+            pipe = pipes[parent_language]
+        except KeyError:
+            pipe = pipes[parent_language] = pipe_class(parent_language)
+
+        texts = []
+        for placeholder, items, stored_text, is_fallback in placeholders:
+            if stored_text is not None:
+                texts.append(stored_text)
+            elif items:
+                pipe.is_storable = not is_fallback
+                text = pipe.render_items(placeholder, items, parent_object=parent).html
+                if appsettings.FLUENT_CONTENTS_STORE_SEARCH_TEXT and pipe.is_storable:
+                    store_search_text(placeholder, parent_language, text)
+                texts.append(text)
+
+        yield parent, get_plain_search_text(clean_join(u" ", texts))
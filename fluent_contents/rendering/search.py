@@ -1,17 +1,30 @@
+from collections import OrderedDict
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import IntegrityError, transaction
+from django.utils.html import conditional_escape, escape
 from django.utils.safestring import mark_safe
-from fluent_contents.models import ContentItemOutput
-from fluent_contents.utils.search import get_cleaned_string
+from fluent_contents import appsettings
+from fluent_contents.extensions import plugin_pool
+from fluent_contents.models import ContentItem, ContentItemOutput, Placeholder, PlaceholderSearchText
+from fluent_contents.utils.search import clean_join, get_cleaned_string, unescape
 from .core import PlaceholderRenderingPipe, SkipItem, ResultTracker
 from .utils import get_dummy_request
 
 
 class SearchResultTracker(ResultTracker):
+    #: Whether the search text of all items can be stored.
+    storable = True
 
     def store_output(self, contentitem, output):
         # Strip all output from HTML tags while collecting
         # (the output is already cached at this point)
-        output.html = get_cleaned_string(output.html)
+        # Entities are decoded while doing so. The output remains HTML until get_plain_search_text() is called.
+        output.html = escape(get_cleaned_string(output.html))
         output.cacheable = False
+        if not is_search_text_storable(contentitem.plugin):
+            self.storable = False
         super(SearchResultTracker, self).store_output(contentitem, output)
 
 
@@ -25,6 +38,24 @@ class SearchRenderingPipe(PlaceholderRenderingPipe):
         request = get_dummy_request(language)
         super(SearchRenderingPipe, self).__init__(request)
 
+        #: Whether the last rendered search text can be stored, see :ref:`FLUENT_CONTENTS_STORE_SEARCH_TEXT`.
+        self.is_storable = True
+
+    def render_placeholder(self, *args, **kwargs):
+        self.is_storable = True
+        return super(SearchRenderingPipe, self).render_placeholder(*args, **kwargs)
+
+    def _get_placeholder_items(self, *args, **kwargs):
+        items, is_fallback = super(SearchRenderingPipe, self)._get_placeholder_items(*args, **kwargs)
+        if is_fallback:
+            # The text depends on the items of another language.
+            self.is_storable = False
+        return items, is_fallback
+
+    def _render_empty_placeholder(self, placeholder):
+        # The search text only contains words, not the HTML comment.
+        return ContentItemOutput(u'', cacheable=False)
+
     def can_use_cached_output(self, contentitem):
         """
         Read the cached output - only when search needs it.
@@ -48,7 +79,8 @@ class SearchRenderingPipe(PlaceholderRenderingPipe):
 
         if plugin.search_fields:
             # Just add the results into the output, but avoid caching that somewhere.
-            output.html += plugin.get_search_text(contentitem)
+            # The text is escaped, as the output is HTML until the tags are stripped.
+            output.html = u"{0} {1}".format(output.html, conditional_escape(plugin.get_search_text(contentitem)))
             output.cacheable = False
 
         return output
@@ -59,10 +91,159 @@ class SearchRenderingPipe(PlaceholderRenderingPipe):
         return
 
     def merge_output(self, result, items, template_name):
+        if not result.storable:
+            self.is_storable = False
+
         # Collect all individual rendered items.
         html_output = []
         for contentitem, output in result.get_output():
             html_output.append(output.html)
 
-        merged_html = mark_safe(u''.join(html_output))
+        merged_html = mark_safe(clean_join(u' ', html_output))
         return ContentItemOutput(merged_html, cacheable=False)   # since media is not included, don't cache this
+
+
+def is_search_text_storable(plugin):
+    """
+    Tell whether the search text of a plugin can be stored.
+    """
+    if plugin.store_search_text is not None:
+        return plugin.store_search_text
+
+    # When the output can't be cached, it likely depends on the request or time.
+    return not plugin.search_output or (
+        plugin.cache_output
+        and not plugin.cache_output_per_site
+        and plugin.cache_timeout is DEFAULT_TIMEOUT
+    )
+
+
+def get_plain_search_text(html):
+    """
+    Convert the rendered search text to plain text.
+    The rendering works with HTML, hence the entities are decoded as last step.
+    """
+    return unescape(u"{0}".format(html))  # Also converts SafeText to a regular string.
+
+
+def get_stored_search_text(placeholder, language_code):
+    """
+    Return the stored search text of a placeholder, or ``None`` when it's not stored.
+    """
+    texts = PlaceholderSearchText.objects.filter(placeholder=placeholder, language_code=language_code or '')
+    texts = texts.filter(fingerprint=plugin_pool.get_fingerprint())  # Changes when plugins are deployed.
+    return texts.values_list('text', flat=True).first()
+
+
+def store_search_text(placeholder, language_code, text):
+    """
+    Store the search text of a placeholder.
+    """
+    lookup = dict(placeholder=placeholder, language_code=language_code or '')
+    fingerprint = plugin_pool.get_fingerprint()
+    if not PlaceholderSearchText.objects.filter(**lookup).update(text=text, fingerprint=fingerprint):
+        try:
+            with transaction.atomic():
+                PlaceholderSearchText.objects.create(text=text, fingerprint=fingerprint, **lookup)
+        except IntegrityError:
+            pass  # Stored by a concurrent request.
+
+
+def get_search_items_bulk(parents, languages, slots=None, fallback_language=None):
+    """
+    Fetch the placeholders and content items of many parent objects at once.
+    Returns a list of ``(placeholder, items, stored_text, is_fallback)`` tuples for each parent.
+    The items are not fetched when the search text is stored.
+    """
+    # Fetch the placeholders with a query per parent type.
+    ids_by_type = OrderedDict()
+    for parent in parents:
+        parent_type = ContentType.objects.get_for_model(parent)
+        ids_by_type.setdefault(parent_type.pk, set()).add(parent.pk)
+
+    parent_placeholders = {}
+    for parent_type_id, parent_ids in ids_by_type.items():
+        placeholders = Placeholder.objects.filter(parent_type=parent_type_id, parent_id__in=parent_ids).order_by('pk')
+        if slots is not None:
+            placeholders = placeholders.filter(slot__in=slots)
+        for placeholder in placeholders:
+            parent_placeholders.setdefault((placeholder.parent_type_id, placeholder.parent_id), []).append(placeholder)
+
+    # Fetch the items with a query per language.
+    placeholders_by_language = OrderedDict()
+    all_placeholders = {}
+    for parent, language_code in zip(parents, languages):
+        for placeholder in _get_parent_placeholders(parent_placeholders, parent, slots):
+            placeholders_by_language.setdefault(language_code, {})[placeholder.pk] = placeholder
+            all_placeholders[placeholder.pk] = placeholder
+
+    stored_texts = {}
+    if appsettings.FLUENT_CONTENTS_STORE_SEARCH_TEXT:
+        for language_code, placeholders in placeholders_by_language.items():
+            texts = PlaceholderSearchText.objects.filter(
+                placeholder__in=list(placeholders.keys()),
+                language_code=language_code or '',
+                fingerprint=plugin_pool.get_fingerprint(),
+            )
+            for placeholder_id, text in texts.values_list('placeholder_id', 'text'):
+                stored_texts[placeholder_id] = text
+                del placeholders[placeholder_id]
+
+    placeholder_items = {}
+    for language_code, placeholders in placeholders_by_language.items():
+        if placeholders:
+            _fetch_base_items(placeholder_items, placeholders, language_code)
+
+    fallback_ids = set()
+    if fallback_language:
+        fallback_language = appsettings.FLUENT_CONTENTS_DEFAULT_LANGUAGE_CODE if fallback_language is True else fallback_language
+        empty_placeholders = dict(
+            (pk, placeholder)
+            for placeholders in placeholders_by_language.values()
+            for pk, placeholder in placeholders.items()
+            if pk not in placeholder_items
+        )
+        if empty_placeholders:
+            _fetch_base_items(placeholder_items, empty_placeholders, fallback_language)
+            fallback_ids = set(empty_placeholders.keys())
+
+    # Fetch the derived models with a query per content type.
+    base_items = [item for items in placeholder_items.values() for item in items]
+    real_items = {}
+    for item in (ContentItem.objects.all().get_real_instances(base_items) if base_items else ()):  # [] means all
+        item.placeholder = all_placeholders[item.placeholder_id]
+        real_items[item.pk] = item
+
+    return [
+        [
+            (
+                placeholder,
+                [real_items[item.pk] for item in placeholder_items.get(placeholder.pk, ()) if item.pk in real_items],
+                stored_texts.get(placeholder.pk),
+                placeholder.pk in fallback_ids,
+            )
+            for placeholder in _get_parent_placeholders(parent_placeholders, parent, slots)
+        ]
+        for parent in parents
+    ]
+
+
+def _get_parent_placeholders(parent_placeholders, parent, slots):
+    parent_type = ContentType.objects.get_for_model(parent)
+    placeholders = parent_placeholders.get((parent_type.pk, parent.pk), [])
+    if slots:
+        # Keep the ordering of the slots.
+        placeholders = sorted(placeholders, key=lambda placeholder: slots.index(placeholder.slot))
+    return placeholders
+
+
+def _fetch_base_items(placeholder_items, placeholders, language_code):
+    items = ContentItem.objects.non_polymorphic().filter(placeholder__in=list(placeholders.keys()))
+    if language_code:
+        items = items.filter(language_code=language_code)
+
+    for item in items:
+        # Same as Placeholder.get_content_items(), skip items which belong to a different parent.
+        placeholder = placeholders[item.placeholder_id]
+        if item.parent_type_id == placeholder.parent_type_id and item.parent_id == placeholder.parent_id:
+            placeholder_items.setdefault(item.placeholder_id, []).append(item)
@@ -0,0 +1,31 @@
+"""
+.. versionadded:: 1.3
+
+A local full-text index of the placeholder contents.
+
+This uses a SQLite FTS5 table or a PostgreSQL ``tsvector`` index when the database supports it,
+so small and medium sites don't need to run a separate search server.
+"""
+
+
+def search(query, language_code=None, models=None, limit=50):
+    """
+    Find the parent objects which contain all words of the query.
+
+    :param query: The search query, as entered by the user.
+    :param language_code: The language of the content, defaults to the current language.
+    :param models: Optional, limit the results to these parent models.
+    :param limit: The maximum number of results.
+    :returns: The parent objects, ordered by relevance.
+    """
+    from fluent_contents.searchindex.models import SearchDocument  # avoid loading the models on app startup
+    return SearchDocument.objects.search(query, language_code=language_code, models=models, limit=limit)
+
+
+def store_search_text(model, pk, text, language_code=None):
+    """
+    Store the search text of a parent object.
+    This function can be used as ``index_contentitem_search_text --callback`` to fill the index in parallel.
+    """
+    from fluent_contents.searchindex.models import SearchDocument
+    SearchDocument.objects.store(model, pk, text, language_code=language_code)
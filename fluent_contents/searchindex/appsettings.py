@@ -0,0 +1,7 @@
+"""
+Settings for the search index.
+"""
+from django.conf import settings
+
+# Update the index when the content items change:
+FLUENT_CONTENTS_SEARCHINDEX_AUTO_UPDATE = getattr(settings, "FLUENT_CONTENTS_SEARCHINDEX_AUTO_UPDATE", True)
@@ -0,0 +1,182 @@
+"""
+The database specific queries of the search index.
+"""
+import re
+from collections import defaultdict
+
+from django.db import connections
+
+DOCUMENT_TABLE = 'fluent_contents_searchdocument'
+FTS5_TABLE = 'fluent_contents_searchdocument_fts'
+POSTGRESQL_INDEX = 'fluent_contents_searchdocument_tsvector'
+
+_backends = {}
+_RE_WORD = re.compile(r'\w+', re.UNICODE)
+
+
+def get_search_terms(query):
+    """
+    Split the query in words. Operators and quotes are ignored, so any user input is valid.
+    """
+    return [term.lower() for term in _RE_WORD.findall(query or u'')]
+
+
+def get_backend(using):
+    """
+    Return the backend that can search in the given database.
+    """
+    try:
+        return _backends[using]
+    except KeyError:
+        pass
+
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        backend = PostgreSQLBackend(using)
+    elif connection.vendor == 'sqlite' and FTS5_TABLE in connection.introspection.table_names():
+        backend = SQLiteFTS5Backend(using)
+    elif connection.vendor == 'sqlite' and _has_fts5(connection):
+        # The migration didn't run yet, possibly it runs in another process.
+        # Look for the FTS5 table again next time.
+        return BasicBackend(using)
+    else:
+        backend = BasicBackend(using)
+
+    _backends[using] = backend
+    return backend
+
+
+def create_index(schema_editor):
+    """
+    Create the full-text index, called by the migration.
+    """
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        schema_editor.execute(
+            "CREATE INDEX {index} ON {table} USING GIN (to_tsvector('simple'::regconfig, text))".format(
+                index=POSTGRESQL_INDEX, table=DOCUMENT_TABLE
+            )
+        )
+    elif connection.vendor == 'sqlite' and _has_fts5(connection):
+        # The FTS5 table only holds the index, the triggers keep it in sync with the document table.
+        for sql in (
+            "CREATE VIRTUAL TABLE {fts} USING fts5(text, content='{table}', content_rowid='id', tokenize='unicode61 remove_diacritics 1')",
+            "CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN"
+            " INSERT INTO {fts}(rowid, text) VALUES (new.id, new.text);"
+            " END",
+            "CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN"
+            " INSERT INTO {fts}({fts}, rowid, text) VALUES ('delete', old.id, old.text);"
+            " END",
+            "CREATE TRIGGER {fts}_au AFTER UPDATE ON {table} BEGIN"
+            " INSERT INTO {fts}({fts}, rowid, text) VALUES ('delete', old.id, old.text);"
+            " INSERT INTO {fts}(rowid, text) VALUES (new.id, new.text);"
+            " END",
+            "INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ):
+            schema_editor.execute(sql.format(fts=FTS5_TABLE, table=DOCUMENT_TABLE))
+
+    _backends.pop(connection.alias, None)
+
+
+def drop_index(schema_editor):
+    """
+    Remove the full-text index, called by the migration.
+    """
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        schema_editor.execute("DROP INDEX IF EXISTS {index}".format(index=POSTGRESQL_INDEX))
+    elif connection.vendor == 'sqlite':
+        for suffix in ('_ai', '_ad', '_au'):
+            schema_editor.execute("DROP TRIGGER IF EXISTS {0}{1}".format(FTS5_TABLE, suffix))
+        schema_editor.execute("DROP TABLE IF EXISTS {0}".format(FTS5_TABLE))
+
+    _backends.pop(connection.alias, None)
+
+
+def _has_fts5(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        return any(row[0] == 'ENABLE_FTS5' for row in cursor.fetchall())
+
+
+class BaseBackend(object):
+    """
+    The search backend for a single database.
+    """
+
+    def __init__(self, using):
+        self.using = using
+
+    def search(self, terms, language_code, parent_type_ids=None, limit=50):
+        """
+        Find the documents that contain all terms.
+
+        :returns: The ``(parent_type_id, parent_id)`` tuples, the best match first.
+        """
+        raise NotImplementedError("{0} should implement search()".format(self.__class__.__name__))
+
+    def _execute(self, sql, params, language_code, parent_type_ids, limit):
+        where = ["d.language_code = %s"]
+        params = list(params) + [language_code]
+        if parent_type_ids:
+            where.append("d.parent_type_id IN ({0})".format(", ".join(["%s"] * len(parent_type_ids))))
+            params += list(parent_type_ids)
+
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(sql.format(where=" AND ".join(where)) + " LIMIT %s", params + [limit])
+            return [(parent_type_id, parent_id) for parent_type_id, parent_id in cursor.fetchall()]
+
+
+class SQLiteFTS5Backend(BaseBackend):
+    """
+    Search with the SQLite FTS5 extension, the results are ordered by the BM25 rank.
+    """
+
+    def search(self, terms, language_code, parent_type_ids=None, limit=50):
+        # Each quoted word should be the prefix of a word in the document.
+        match = u" ".join(u'"{0}"*'.format(term) for term in terms)
+        sql = (
+            "SELECT d.parent_type_id, d.parent_id FROM {fts}"
+            " INNER JOIN {table} d ON d.id = {fts}.rowid"
+            " WHERE {fts} MATCH %s AND {{where}}"
+            " ORDER BY bm25({fts})"
+        ).format(fts=FTS5_TABLE, table=DOCUMENT_TABLE)
+        return self._execute(sql, [match], language_code, parent_type_ids, limit)
+
+
+class PostgreSQLBackend(BaseBackend):
+    """
+    Search with a PostgreSQL ``tsvector`` index, the results are ordered by ``ts_rank()``.
+    The ``simple`` configuration is used, as the documents can be written in any language.
+    """
+
+    def search(self, terms, language_code, parent_type_ids=None, limit=50):
+        tsquery = u" & ".join(u"{0}:*".format(term) for term in terms)
+        sql = (
+            "SELECT d.parent_type_id, d.parent_id FROM {table} d, to_tsquery('simple'::regconfig, %s) query"
+            " WHERE to_tsvector('simple'::regconfig, d.text) @@ query AND {{where}}"
+            " ORDER BY ts_rank(to_tsvector('simple'::regconfig, d.text), query) DESC"
+        ).format(table=DOCUMENT_TABLE)
+        return self._execute(sql, [tsquery], language_code, parent_type_ids, limit)
+
+
+class BasicBackend(BaseBackend):
+    """
+    Search with a ``LIKE`` query, for databases without a full-text index.
+    The results are ordered by the number of occurrences of the terms.
+    """
+
+    def search(self, terms, language_code, parent_type_ids=None, limit=50):
+        from fluent_contents.searchindex.models import SearchDocument
+        qs = SearchDocument.objects.using(self.using).filter(language_code=language_code)
+        if parent_type_ids:
+            qs = qs.filter(parent_type__in=parent_type_ids)
+        for term in terms:
+            qs = qs.filter(text__icontains=term)
+
+        scores = defaultdict(int)
+        for parent_type_id, parent_id, text in qs.values_list('parent_type_id', 'parent_id', 'text').iterator():
+            text = text.lower()
+            scores[(parent_type_id, parent_id)] = sum(text.count(term) for term in terms)
+
+        return sorted(scores, key=lambda key: -scores[key])[:limit]
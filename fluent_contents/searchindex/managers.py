@@ -0,0 +1,113 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.utils.translation import get_language
+from fluent_contents.models import ContentItem
+from fluent_contents.rendering import render_search_text_bulk
+from fluent_contents.utils.search import get_cleaned_string
+from .backends import get_backend, get_search_terms
+
+
+class SearchDocumentManager(models.Manager):
+    """
+    Extra methods for the ``SearchDocument.objects``.
+    """
+
+    def search(self, query, language_code=None, models=None, limit=50):
+        """
+        Find the parent objects which contain all words of the query.
+
+        :returns: The parent objects, ordered by relevance.
+        """
+        terms = get_search_terms(query)
+        if not terms:
+            return []
+
+        parent_type_ids = [ContentType.objects.get_for_model(model).pk for model in models] if models else None
+        matches = get_backend(self.db).search(terms, language_code or get_language(), parent_type_ids, limit)
+
+        # Fetch the parent objects with a query per model.
+        ids_by_type = defaultdict(list)
+        for parent_type_id, parent_id in matches:
+            ids_by_type[parent_type_id].append(parent_id)
+
+        parents = {}
+        for parent_type_id, ids in ids_by_type.items():
+            model = ContentType.objects.get_for_id(parent_type_id).model_class()
+            if model is not None:
+                for pk, parent in model._default_manager.using(self.db).in_bulk(ids).items():
+                    parents[(parent_type_id, pk)] = parent
+
+        return [parents[match] for match in matches if match in parents]
+
+    def index_parents(self, parents):
+        """
+        Render and store the search text of the parent objects,
+        in all languages that have content items.
+        """
+        parents_by_type = defaultdict(list)
+        for parent in parents:
+            parents_by_type[ContentType.objects.get_for_model(parent).pk].append(parent)
+
+        for parent_type_id, type_parents in parents_by_type.items():
+            by_id = dict((parent.pk, parent) for parent in type_parents)
+            parents_by_language = defaultdict(list)
+            languages = (ContentItem.objects.using(self.db).filter(parent_type=parent_type_id, parent_id__in=list(by_id))
+                         .order_by().values_list('parent_id', 'language_code').distinct())
+            for parent_id, language_code in languages:
+                parents_by_language[language_code].append(by_id[parent_id])
+
+            documents = []
+            for language_code, language_parents in parents_by_language.items():
+                for parent, text in render_search_text_bulk(language_parents, language=language_code):
+                    if text:
+                        documents.append(self.model(
+                            parent_type_id=parent_type_id,
+                            parent_id=parent.pk,
+                            language_code=language_code,
+                            text=text,
+                        ))
+
+            with transaction.atomic(using=self.db):
+                self.filter(parent_type=parent_type_id, parent_id__in=list(by_id)).delete()
+                self.bulk_create(documents)
+
+    index_parents.alters_data = True
+
+    def index_changes(self, changes):
+        """
+        Update the index for the changed parent objects.
+
+        :param changes: The ``(parent_type_id, parent_id)`` tuples of the changed objects.
+        """
+        ids_by_type = defaultdict(set)
+        for parent_type_id, parent_id in changes:
+            ids_by_type[parent_type_id].add(parent_id)
+
+        for parent_type_id, ids in ids_by_type.items():
+            model = ContentType.objects.get_for_id(parent_type_id).model_class()
+            parents = list(model._base_manager.using(self.db).filter(pk__in=ids)) if model is not None else []
+
+            # Deleted objects are removed from the index.
+            deleted_ids = ids - set(parent.pk for parent in parents)
+            if deleted_ids:
+                self.filter(parent_type=parent_type_id, parent_id__in=deleted_ids).delete()
+
+            self.index_parents(parents)
+
+    index_changes.alters_data = True
+
+    def store(self, model, pk, text, language_code=None):
+        """
+        Store the rendered search text of a single object.
+        """
+        language_code = language_code or get_language()
+        lookup = dict(parent_type=ContentType.objects.get_for_model(model), parent_id=pk, language_code=language_code)
+        text = get_cleaned_string(text)
+        if text:
+            self.update_or_create(defaults={'text': text}, **lookup)
+        else:
+            self.filter(**lookup).delete()
+
+    store.alters_data = True
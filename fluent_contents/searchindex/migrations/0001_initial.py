@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+import django.db.models.deletion
+from fluent_contents.searchindex.backends import create_index, drop_index
+
+
+def forwards(apps, schema_editor):
+    # The full-text index depends on the database.
+    create_index(schema_editor)
+
+
+def backwards(apps, schema_editor):
+    drop_index(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('parent_id', models.IntegerField()),
+                ('language_code', models.CharField(db_index=True, max_length=15)),
+                ('text', models.TextField()),
+                ('modified', models.DateTimeField(auto_now=True)),
+                ('parent_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.ContentType')),
+            ],
+            options={
+                'verbose_name': 'Search document',
+                'verbose_name_plural': 'Search documents',
+                'db_table': 'fluent_contents_searchdocument',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='searchdocument',
+            unique_together=set([('parent_type', 'parent_id', 'language_code')]),
+        ),
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,68 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.dispatch import receiver
+from django.utils.translation import ugettext_lazy as _
+from fluent_contents.models.mixins import _get_commit_callback
+from fluent_contents.signals import content_changed
+from fluent_utils.django_compat.moves.contenttypes import GenericForeignKey
+from future.utils import python_2_unicode_compatible
+from . import appsettings
+from .managers import SearchDocumentManager
+
+
+@python_2_unicode_compatible
+class SearchDocument(models.Model):
+    """
+    The search text of a parent object, in a single language.
+    The full-text index of the database is created by the migrations.
+    """
+    parent_type = models.ForeignKey(ContentType)
+    parent_id = models.IntegerField()
+    parent = GenericForeignKey('parent_type', 'parent_id')
+    language_code = models.CharField(max_length=15, db_index=True)
+    text = models.TextField()
+    modified = models.DateTimeField(auto_now=True)
+
+    objects = SearchDocumentManager()
+
+    class Meta:
+        db_table = 'fluent_contents_searchdocument'
+        verbose_name = _("Search document")
+        verbose_name_plural = _("Search documents")
+        unique_together = ('parent_type', 'parent_id', 'language_code')
+
+    def __str__(self):
+        return "{0}#{1} {2}".format(self.parent_type_id, self.parent_id, self.language_code)
+
+
+@receiver(content_changed)
+def on_content_changed(sender, changes, using=None, **kwargs):
+    """
+    Update the index when the transaction commits, once for all changes.
+    """
+    if not appsettings.FLUENT_CONTENTS_SEARCHINDEX_AUTO_UPDATE:
+        return
+
+    parents = set((change[0], change[1]) for change in changes if change[0] is not None and change[1] is not None)
+    if not parents:
+        return
+
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block or not hasattr(transaction, 'on_commit'):  # Django 1.9+
+        SearchDocument.objects.db_manager(connection.alias).index_changes(parents)
+        return
+
+    _get_commit_callback(connection.alias, _PendingIndexUpdate, connection.alias).parents.update(parents)
+
+
+class _PendingIndexUpdate(object):
+    """
+    The parent objects to index when the transaction commits.
+    """
+
+    def __init__(self, using):
+        self.using = using
+        self.parents = set()
+
+    def __call__(self):
+        SearchDocument.objects.db_manager(self.using).index_changes(self.parents)
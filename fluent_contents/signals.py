@@ -0,0 +1,11 @@
+"""
+Signals sent by this package.
+"""
+from django.dispatch import Signal
+
+#: .. versionadded:: 1.3
+#:    Sent when content items or placeholders of parent objects change, including bulk operations.
+#:    The ``changes`` argument holds ``(parent_type_id, parent_id, language_code, placeholder_id)`` tuples,
+#:    the ``language_code`` is ``None`` when all languages are affected.
+#:    The ``using`` argument holds the database alias.
+content_changed = Signal(providing_args=['changes', 'using'])
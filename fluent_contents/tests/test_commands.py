@@ -0,0 +1,277 @@
+import json
+import os
+import tempfile
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+from django.utils.six import StringIO
+
+from fluent_contents import appsettings
+from fluent_contents.management.commands.index_contentitem_search_text import ModelFieldSink
+from fluent_contents.models import ChangedParent, ContentItem, Placeholder
+from fluent_contents.plugins.sharedcontent.models import SharedContent
+from fluent_contents.plugins.text.models import TextItem
+from fluent_contents.tests.testapp.models import RawHtmlTestItem, TimeoutTestItem, M2MTestItem, PlaceholderFieldTestPage, \
+    TestPage
+from fluent_contents.tests.utils import AppTestCase
+
+
+class CommandTests(AppTestCase):
+    """
+    Testing the management commands.
+    """
+
+    def test_export_import_contentitems(self):
+        """
+        The exported content should be imported again.
+        """
+        page1 = PlaceholderFieldTestPage.objects.create()
+        placeholder1 = Placeholder.objects.create_for_object(page1, 'field_slot1')
+        placeholder2 = Placeholder.objects.create_for_object(page1, 'field_slot2')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder1, html='html1', sort_order=1)
+        TimeoutTestItem.objects.create_for_placeholder(placeholder1, html='html2', sort_order=2)
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder2, html='html3', sort_order=1)
+        linked = TestPage.objects.create(contents="linked")
+        M2MTestItem.objects.create_for_placeholder(placeholder2, title='m2m', sort_order=2).pages.add(linked)
+
+        def get_items():
+            items = ContentItem.objects.parent(page1).order_by('placeholder__slot', 'sort_order')
+            return [(item.__class__, item.placeholder.slot, str(item), item.sort_order) for item in items]
+
+        expected = [
+            (RawHtmlTestItem, 'field_slot1', 'html1', 1),
+            (TimeoutTestItem, 'field_slot1', 'html2', 2),
+            (RawHtmlTestItem, 'field_slot2', 'html3', 1),
+            (M2MTestItem, 'field_slot2', 'm2m', 2),
+        ]
+
+        fd, filename = tempfile.mkstemp(suffix='.jsonl')
+        os.close(fd)
+        try:
+            call_command('export_contentitems', output=filename, chunk_size=2, verbosity=0)
+            with open(filename) as stream:
+                self.assertEqual(len(stream.readlines()), 6)
+
+            # Import into a fresh database state.
+            # The polymorphic queryset would delete all items as the first type.
+            ContentItem.objects.non_polymorphic().delete()
+            Placeholder.objects.filter(slot='field_slot2').delete()
+
+            stdout = StringIO()
+            call_command('import_contentitems', filename, batch_size=2, stdout=stdout)
+            self.assertIn("Imported 2 placeholders and 4 content items", stdout.getvalue())
+            self.assertEqual(Placeholder.objects.parent(page1).count(), 2)
+            self.assertEqual(get_items(), expected)
+            self.assertEqual(list(M2MTestItem.objects.get().pages.all()), [linked])
+
+            # Importing again replaces the items of the existing placeholders.
+            stdout = StringIO()
+            call_command('import_contentitems', filename, stdout=stdout)
+            self.assertIn("Replaced 4 existing content items.", stdout.getvalue())
+            self.assertEqual(get_items(), expected)
+            self.assertEqual(M2MTestItem.pages.through.objects.count(), 1)
+
+            # Unless the items should be added.
+            call_command('import_contentitems', filename, append=True, verbosity=0)
+            self.assertEqual(ContentItem.objects.parent(page1).count(), 8)
+        finally:
+            os.remove(filename)
+
+    def test_remove_stale_contentitems(self):
+        """
+        Unreferenced items should be removed in batches.
+        """
+        page1 = PlaceholderFieldTestPage.objects.create()
+        placeholder1 = Placeholder.objects.create_for_object(page1, 'field_slot1')
+        placeholder2 = Placeholder.objects.create(
+            parent_type=ContentType.objects.get_for_model(PlaceholderFieldTestPage),
+            parent_id=page1.pk + 100,  # does not exist
+            slot='field_slot1',
+        )
+        item1 = RawHtmlTestItem.objects.create_for_placeholder(placeholder1, html='html1')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder2, html='html2')
+        TimeoutTestItem.objects.create_for_placeholder(placeholder2, html='html3')
+
+        stdout = StringIO()
+        call_command('remove_stale_contentitems', dry_run=True, verbosity=0, stdout=stdout)
+        self.assertIn("2 unreferenced items found.", stdout.getvalue())
+        self.assertIn("- TimeoutTestItem#", stdout.getvalue())
+        self.assertEqual(ContentItem.objects.count(), 3)
+
+        stderr = StringIO()
+        old_value = appsettings.FLUENT_CONTENTS_TRACK_CHANGES
+        appsettings.FLUENT_CONTENTS_TRACK_CHANGES = True
+        try:
+            call_command('remove_stale_contentitems', remove_unreferenced=True, batch_size=1,
+                         stdout=StringIO(), stderr=stderr)
+        finally:
+            appsettings.FLUENT_CONTENTS_TRACK_CHANGES = old_value
+        self.assertIn("Processed 2 items", stderr.getvalue())
+        self.assertEqual(list(ChangedParent.objects.values_list('parent_id', flat=True)), [placeholder2.parent_id])
+        self.assertEqual(list(ContentItem.objects.all()), [item1])
+        self.assertEqual(RawHtmlTestItem.objects.count(), 1)
+        self.assertEqual(TimeoutTestItem.objects.count(), 0)
+
+    def test_remove_stale_contentitems_resume(self):
+        """
+        Resuming should only skip the items of the pass that was interrupted.
+        """
+        pages = [PlaceholderFieldTestPage.objects.create(), TestPage.objects.create(contents="Page")]
+        items = []
+        for page in pages:
+            placeholder = Placeholder.objects.create(
+                parent_type=ContentType.objects.get_for_model(page),
+                parent_id=page.pk + 100,  # does not exist
+                slot='field_slot1',
+            )
+            items.append(RawHtmlTestItem.objects.create_for_placeholder(placeholder, html='html'))
+
+        # The last item is created last, but its parent type can be handled in the first pass.
+        first, second = sorted(items, key=lambda item: item.parent_type_id)
+        stdout = StringIO()
+        call_command('remove_stale_contentitems', dry_run=True, verbosity=0, stdout=stdout,
+                     resume_from='unreferenced-{0}:{1}'.format(first.parent_type_id, max(first.pk, second.pk) + 1))
+        self.assertIn("1 unreferenced items found.", stdout.getvalue())
+        self.assertIn("#{0} points".format(second.pk), stdout.getvalue())
+        self.assertNotIn("stale:", stdout.getvalue())
+
+    def test_find_contentitem_urls(self):
+        """
+        The URLs in HTML fields should be found.
+        """
+        page1 = PlaceholderFieldTestPage.objects.create()
+        placeholder1 = Placeholder.objects.create_for_object(page1, 'field_slot1')
+        item1 = RawHtmlTestItem.objects.create_for_placeholder(
+            placeholder1,
+            html='<p><a href="/foo/">Foo</a> <img src="/bar.png" srcset="/bar.png 1x, /bar@2x.png 2x"></p>'
+        )
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder1, html='<a href="/foo/">Foo again</a>')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder1, html='<![foo[ broken ]]><a href="/malformed/">Broken</a>')
+
+        stdout = StringIO()
+        call_command('find_contentitem_urls', chunk_size=1, stdout=stdout, stderr=StringIO())
+        self.assertEqual(stdout.getvalue().splitlines(), ['/foo/', '/bar.png', '/bar@2x.png', '/malformed/'])
+
+        stdout = StringIO()
+        call_command('find_contentitem_urls', json=True, stdout=stdout, stderr=StringIO())
+        matches = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual(len(matches), 6)
+        self.assertEqual(matches[0], {'model': 'testapp.RawHtmlTestItem', 'pk': item1.pk, 'field': 'html', 'url': '/foo/'})
+
+    def test_index_contentitem_search_text(self):
+        """
+        The search text should be rendered for all parent objects.
+        """
+        page1 = TestPage.objects.create(contents="Search!")
+        page2 = TestPage.objects.create(contents="Empty")
+        placeholder1 = Placeholder.objects.create_for_object(page1, 'slot1')
+        TextItem.objects.create_for_placeholder(placeholder1, text=u'<b>Item1!</b>')
+
+        stdout = StringIO()
+        stderr = StringIO()
+        call_command('index_contentitem_search_text', 'testapp.TestPage', chunk_size=1, stdout=stdout, stderr=stderr)
+        results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([(result['pk'], result['text'].strip()) for result in results], [
+            (page1.pk, u"Item1!"),
+            (page2.pk, u""),
+        ])
+        self.assertIn("Rendered 2 objects", stderr.getvalue())
+        self.assertIn("- TextPlugin: 1 items", stderr.getvalue())
+
+        call_command('index_contentitem_search_text', 'testapp.TestPage', field='contents', verbosity=0)
+        self.assertEqual(TestPage.objects.get(pk=page1.pk).contents.strip(), u"Item1!")
+
+    def test_index_contentitem_search_text_translated_field(self):
+        """
+        Translated fields should store the search text of each language in its own translation.
+        """
+        shared = SharedContent.objects.language('en').create(slug='translated', title='EN')
+        shared.set_current_language('nl')
+        shared.title = 'NL'
+        shared.save()
+        placeholder = Placeholder.objects.create_for_object(shared, 'shared_content')
+        TextItem.objects.create_for_placeholder(placeholder, text=u'English', language_code='en')
+        TextItem.objects.create_for_placeholder(placeholder, text=u'Dutch', language_code='nl')
+
+        for language_code in ('en', 'nl'):
+            call_command('index_contentitem_search_text', 'sharedcontent.SharedContent', field='title',
+                         language=language_code, verbosity=0)
+
+        titles = dict(shared.translations.values_list('language_code', 'title'))
+        self.assertEqual({language_code: title.strip() for language_code, title in titles.items()}, {
+            'en': u"English",
+            'nl': u"Dutch",
+        })
+
+        # An untranslated field can't hold the text of several languages.
+        sink = ModelFieldSink('slug')
+        sink.write(SharedContent, [(shared.pk, 'en', u"English")])
+        self.assertRaises(CommandError, sink.write, SharedContent, [(shared.pk, 'nl', u"Dutch")])
+
+    def test_index_contentitem_search_text_changed(self):
+        """
+        Only the changed parent objects should be rendered again.
+        """
+        page1 = TestPage.objects.create(contents="Search!")
+        page2 = TestPage.objects.create(contents="Search 2!")
+        placeholder1 = Placeholder.objects.create_for_object(page1, 'slot1')
+        placeholder2 = Placeholder.objects.create_for_object(page2, 'slot1')
+        TextItem.objects.create_for_placeholder(placeholder1, text=u'Item1!')
+
+        old_value = appsettings.FLUENT_CONTENTS_TRACK_CHANGES
+        appsettings.FLUENT_CONTENTS_TRACK_CHANGES = True
+        try:
+            watermark = timezone.now()
+            item2 = TextItem.objects.create_for_placeholder(placeholder2, text=u'Item2!')
+            self.assertEqual(ChangedParent.objects.changed_since(watermark).count(), 1)
+
+            item2.text = u'Item2 changed!'
+            item2.save()
+            self.assertEqual(ChangedParent.objects.count(), 1)
+        finally:
+            appsettings.FLUENT_CONTENTS_TRACK_CHANGES = old_value
+
+        stdout = StringIO()
+        call_command('index_contentitem_search_text', 'testapp.TestPage', changed_since=watermark.isoformat(),
+                     stdout=stdout, verbosity=0)
+        results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([(result['pk'], result['text'].strip()) for result in results], [
+            (page2.pk, u"Item2 changed!"),
+        ])
+
+    def test_reapply_text_filters(self):
+        """
+        The changed filters should be applied to all text items, unchanged items are skipped.
+        """
+        page1 = TestPage.objects.create(contents="Filters")
+        placeholder1 = Placeholder.objects.create_for_object(page1, 'slot1')
+        item1 = TextItem.objects.create_for_placeholder(placeholder1, text=u'<p>Item1</p>', sort_order=1)
+        item2 = TextItem.objects.create_for_placeholder(placeholder1, text=u'<P>ITEM2</P>', sort_order=2)
+        self.assertEqual(placeholder1.get_search_text().strip(), u"Item1 ITEM2")
+
+        def upper_filter(textitem, html):
+            return html.upper()
+
+        old_value = appsettings.POST_FILTER_FUNCTIONS
+        appsettings.POST_FILTER_FUNCTIONS = [upper_filter]
+        try:
+            stdout = StringIO()
+            stderr = StringIO()
+            call_command('reapply_text_filters', dry_run=True, stdout=stdout, stderr=stderr)
+            self.assertEqual(stdout.getvalue().strip(), "- TextItem #{0} will change".format(item1.pk))
+            self.assertIn("Found changes in 1 of 2 text items", stderr.getvalue())
+            self.assertEqual(TextItem.objects.get(pk=item1.pk).text_final, None)
+
+            stderr = StringIO()
+            call_command('reapply_text_filters', chunk_size=1, stderr=stderr)
+            self.assertIn("Updated 1 of 2 text items", stderr.getvalue())
+        finally:
+            appsettings.POST_FILTER_FUNCTIONS = old_value
+
+        item1 = TextItem.objects.get(pk=item1.pk)
+        self.assertEqual(item1.text, u'<p>Item1</p>')
+        self.assertEqual(item1.text_final, u'<P>ITEM1</P>')
+        self.assertEqual(TextItem.objects.get(pk=item2.pk).text_final, None)
+        self.assertEqual(placeholder1.get_search_text().strip(), u"ITEM1 ITEM2")
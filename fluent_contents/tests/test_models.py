@@ -1,7 +1,18 @@
 import django
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.signals import post_delete, post_save
+from django.utils import translation
+from unittest import skipIf
 
-from fluent_contents.models import ContentItem
+from fluent_contents import appsettings
+from fluent_contents.cache import get_placeholder_items_cache_key
+from fluent_contents.models import ContentItem, Placeholder
+from fluent_contents.models.mixins import delete_cache_keys
+from fluent_contents.plugins.sharedcontent.models import SharedContent
+from fluent_contents.tests.testapp.models import RawHtmlTestItem, TimeoutTestItem, M2MTestItem, \
+    PlaceholderFieldTestPage, TestPage
 from fluent_contents.tests.utils import AppTestCase
 
 
@@ -20,3 +31,262 @@ class ModelTests(AppTestCase):
             c.save()
         a = ContentItem(polymorphic_ctype=c)
         self.assertEqual(str(a), "'(type deleted) 0' in 'None None'")
+
+    @skipIf(django.VERSION < (1, 9), "transaction.on_commit() is not available")
+    def test_delete_cache_keys_on_commit(self):
+        """
+        Inside a transaction, the cache keys should be deleted at once when the transaction commits.
+        """
+        old_value = appsettings.FLUENT_CONTENTS_CACHE_CLEAR_ON_COMMIT
+        appsettings.FLUENT_CONTENTS_CACHE_CLEAR_ON_COMMIT = True
+        try:
+            cache.set_many({'test.key1': 1, 'test.key2': 2, 'test.key3': 3})
+
+            # The TestCase runs in a transaction.
+            delete_cache_keys(['test.key1', 'test.key2'])
+            delete_cache_keys(['test.key2', 'test.key3'])
+            self.assertEqual(cache.get('test.key1'), 1)
+
+            # A single callback is registered for all keys.
+            callbacks = [func for sids, func in connection.run_on_commit if func.__class__.__name__ == '_PendingCacheKeys']
+            self.assertEqual(len(callbacks), 1)
+            self.assertEqual(callbacks[0].keys, set(['test.key1', 'test.key2', 'test.key3']))
+
+            callbacks[0]()
+            self.assertEqual(cache.get_many(['test.key1', 'test.key2', 'test.key3']), {})
+        finally:
+            appsettings.FLUENT_CONTENTS_CACHE_CLEAR_ON_COMMIT = old_value
+
+    def test_content_changed_receivers(self):
+        """
+        The change tracking should only listen to the placeholder and content item models,
+        so other models can still be deleted without fetching each object.
+        """
+        self.assertTrue(post_delete.has_listeners(Placeholder))
+        self.assertTrue(post_delete.has_listeners(RawHtmlTestItem))
+        self.assertTrue(post_save.has_listeners(M2MTestItem))
+        self.assertFalse(post_delete.has_listeners(TestPage))
+        self.assertFalse(post_save.has_listeners(TestPage))
+
+    def test_delete_translation(self):
+        """
+        Deleting a translation should delete the content items, and clear their cache at once.
+        """
+        shared = SharedContent.objects.language('en').create(slug='translated', title='EN')
+        shared.set_current_language('nl')
+        shared.title = 'NL'
+        shared.save()
+
+        placeholder = Placeholder.objects.create_for_object(shared, 'shared_content')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder, html='en1', language_code='en')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder, html='nl1', language_code='nl')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder, html='nl2', language_code='nl')
+        m2m_item = M2MTestItem.objects.create_for_placeholder(placeholder, title='nl3', language_code='nl')
+        m2m_item.pages.add(TestPage.objects.create(contents='linked'))
+        cache_key = get_placeholder_items_cache_key(placeholder.pk, 'nl')
+        cache.set(cache_key, [])
+
+        # The items are deleted with a query per table, not fetched one by one.
+        with self.assertNumQueries(13):
+            shared.delete_translation('nl')
+        self.assertEqual(list(RawHtmlTestItem.objects.filter(placeholder=placeholder).values_list('html', flat=True)), ['en1'])
+        self.assertEqual(ContentItem.objects.filter(placeholder=placeholder).count(), 1)
+        self.assertEqual(M2MTestItem.pages.through.objects.count(), 0)
+        self.assertIsNone(cache.get(cache_key))
+
+    def test_item_list_cache_keys(self):
+        """
+        The cached list of items should be cleared for the old and new language, also by queryset updates.
+        """
+        page = PlaceholderFieldTestPage.objects.create()
+        placeholder = Placeholder.objects.create_for_object(page, 'field_slot1')
+        item = RawHtmlTestItem.objects.create_for_placeholder(placeholder, html='html1', language_code='en')
+        cache_keys = [get_placeholder_items_cache_key(placeholder.pk, language_code) for language_code in ('en', 'nl')]
+
+        def reset():
+            cache.set_many(dict((key, []) for key in cache_keys))
+
+        reset()
+        item.language_code = 'nl'
+        item.save()
+        self.assertEqual(cache.get_many(cache_keys), {})
+
+        reset()
+        ContentItem.objects.filter(pk=item.pk).update(sort_order=2)
+        self.assertEqual(cache.get_many(cache_keys), {cache_keys[0]: []})
+
+        reset()
+        ContentItem.objects.filter(pk=item.pk).update(language_code='en')
+        self.assertEqual(cache.get_many(cache_keys), {})
+
+        reset()
+        ContentItem.objects.filter(pk=item.pk).non_polymorphic().delete()
+        self.assertEqual(cache.get_many(cache_keys), {cache_keys[1]: []})
+
+    def test_copy_to_placeholder(self):
+        """
+        Copying a queryset should insert the items in bulk.
+        """
+        page1 = PlaceholderFieldTestPage.objects.create()
+        page2 = PlaceholderFieldTestPage.objects.create()
+        placeholder1 = Placeholder.objects.create_for_object(page1, 'field_slot1')
+        placeholder2 = Placeholder.objects.create_for_object(page2, 'field_slot1')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder1, html='html1', sort_order=1)
+        TimeoutTestItem.objects.create_for_placeholder(placeholder1, html='html2', sort_order=2)
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder1, html='html3', sort_order=3)
+        cache_key = get_placeholder_items_cache_key(placeholder2.pk, None)
+        cache.set(cache_key, [])
+
+        # Query: fetch base + 2x derived, insert base (per item without bulk insert ids), insert derived per item type, fetch placeholder
+        with self.assertNumQueries(3 + (1 if getattr(connection.features, 'can_return_ids_from_bulk_insert', False) else 3) + 2 + 1):
+            copies = list(ContentItem.objects.filter(placeholder=placeholder1).copy_to_placeholder(placeholder2, sort_order=10))
+
+        self.assertIsNone(cache.get(cache_key))
+        self.assertEqual([item.placeholder_id for item in copies], [placeholder2.pk] * 3)
+        items = list(ContentItem.objects.filter(placeholder=placeholder2))
+        self.assertEqual([(item.__class__, item.html, item.sort_order) for item in items], [
+            (RawHtmlTestItem, 'html1', 10),
+            (TimeoutTestItem, 'html2', 11),
+            (RawHtmlTestItem, 'html3', 12),
+        ])
+        self.assertEqual([item.pk for item in items], [item.pk for item in copies])
+        self.assertEqual(ContentItem.objects.filter(placeholder=placeholder1).count(), 3)
+
+    def test_move_to_placeholder(self):
+        """
+        Moving a queryset should update all items at once.
+        """
+        page1 = PlaceholderFieldTestPage.objects.create()
+        page2 = PlaceholderFieldTestPage.objects.create()
+        placeholder1 = Placeholder.objects.create_for_object(page1, 'field_slot1')
+        placeholder2 = Placeholder.objects.create_for_object(page2, 'field_slot1')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder1, html='html1', sort_order=1)
+        TimeoutTestItem.objects.create_for_placeholder(placeholder1, html='html2', sort_order=2)
+        cache_key1 = get_placeholder_items_cache_key(placeholder1.pk, None)
+        cache_key2 = get_placeholder_items_cache_key(placeholder2.pk, None)
+        cache.set_many({cache_key1: [], cache_key2: []})
+
+        # Query: fetch base + 2x derived, fetch old placeholder, update, fetch new placeholder
+        # Django 1.7 has no Case() expression, the items are updated one by one in a savepoint.
+        num_updates = 1 if django.VERSION >= (1, 8) else 1 + 2 + 1
+        with self.assertNumQueries(3 + 1 + num_updates + 1):
+            ContentItem.objects.filter(placeholder=placeholder1).move_to_placeholder(placeholder2, sort_order=5)
+
+        self.assertEqual(cache.get_many([cache_key1, cache_key2]), {})
+        self.assertEqual(ContentItem.objects.filter(placeholder=placeholder1).count(), 0)
+        items = list(ContentItem.objects.filter(placeholder=placeholder2))
+        self.assertEqual([(item.html, item.sort_order, item.parent_id) for item in items], [
+            ('html1', 5, page2.pk),
+            ('html2', 6, page2.pk),
+        ])
+
+    def test_clone_parent(self):
+        """
+        All placeholders and items should be copied to the new parent.
+        """
+        page1 = PlaceholderFieldTestPage.objects.create()
+        page2 = PlaceholderFieldTestPage.objects.create()
+        placeholder1 = Placeholder.objects.create_for_object(page1, 'field_slot1')
+        placeholder2 = Placeholder.objects.create_for_object(page1, 'field_slot2', role='s', title='Sidebar')
+        target1 = Placeholder.objects.create_for_object(page2, 'field_slot1')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder1, html='html1', sort_order=1)
+        TimeoutTestItem.objects.create_for_placeholder(placeholder1, html='html2', sort_order=2)
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder2, html='html3', sort_order=1)
+        RawHtmlTestItem.objects.create_for_placeholder(target1, html='existing', sort_order=3)
+
+        # The cached lookup of the missing placeholder is cleared.
+        self.assertRaises(Placeholder.DoesNotExist, lambda: Placeholder.objects.get_by_slot(page2, 'field_slot2'))
+
+        copies = Placeholder.objects.clone_parent(page1, page2)
+        self.assertEqual(len(copies), 3)
+
+        new_placeholder2 = Placeholder.objects.get_by_slot(page2, 'field_slot2')
+        self.assertEqual((new_placeholder2.role, new_placeholder2.title), ('s', 'Sidebar'))
+        self.assertEqual(Placeholder.objects.parent(page2).count(), 2)
+
+        # The copies are placed after the existing items of the target.
+        items = ContentItem.objects.parent(page2).order_by('placeholder__slot', 'sort_order')
+        self.assertEqual([(item.placeholder.slot, item.html, item.sort_order) for item in items], [
+            ('field_slot1', 'existing', 3),
+            ('field_slot1', 'html1', 4),
+            ('field_slot1', 'html2', 5),
+            ('field_slot2', 'html3', 1),
+        ])
+        self.assertEqual(ContentItem.objects.parent(page1).count(), 3)
+
+    def test_clone_parent_m2m(self):
+        """
+        Many-to-many relations should be copied with the items.
+        """
+        page1 = PlaceholderFieldTestPage.objects.create()
+        page2 = PlaceholderFieldTestPage.objects.create()
+        shared = SharedContent.objects.language('en').create(slug='copy-m2m', title='EN')
+        linked1 = TestPage.objects.create(contents='linked1')
+        linked2 = TestPage.objects.create(contents='linked2')
+
+        placeholder = Placeholder.objects.create_for_object(page1, 'field_slot1')
+        item = M2MTestItem.objects.create_for_placeholder(placeholder, title='m2m')
+        item.pages.add(linked1, linked2)
+        M2MTestItem.objects.create_for_placeholder(placeholder, title='empty', sort_order=2)
+
+        copies = Placeholder.objects.clone_parent(page1, page2)
+        self.assertEqual(len(copies), 2)
+        new_item = M2MTestItem.objects.parent(page2).get(title='m2m')
+        self.assertNotEqual(new_item.pk, item.pk)
+        self.assertEqual(sorted(page.contents for page in new_item.pages.all()), ['linked1', 'linked2'])
+        self.assertFalse(M2MTestItem.objects.parent(page2).get(title='empty').pages.exists())
+
+        # The source keeps its relations.
+        self.assertEqual(item.pages.count(), 2)
+        self.assertEqual(M2MTestItem.pages.through.objects.count(), 4)
+
+        # Same for copying to another language.
+        shared_placeholder = Placeholder.objects.create_for_object(shared, 'shared_content')
+        M2MTestItem.objects.create_for_placeholder(shared_placeholder, title='m2m', language_code='en').pages.add(linked1, linked2)
+        Placeholder.objects.copy_language(shared, 'en', 'nl')
+        nl_item = M2MTestItem.objects.filter(placeholder=shared_placeholder).translated('nl').get()
+        self.assertEqual(sorted(page.contents for page in nl_item.pages.all()), ['linked1', 'linked2'])
+
+    def test_copy_language(self):
+        """
+        Items can be copied to another language.
+        """
+        shared = SharedContent.objects.language('en').create(slug='copy', title='EN')
+        placeholder = Placeholder.objects.create_for_object(shared, 'shared_content')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder, html='en1', sort_order=1, language_code='en')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder, html='en2', sort_order=2, language_code='en')
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder, html='nl1', sort_order=1, language_code='nl')
+
+        copies = Placeholder.objects.copy_language(shared, 'en', 'nl')
+        self.assertEqual([item.language_code for item in copies], ['nl', 'nl'])
+
+        # The copies are placed after the existing items of the target language.
+        items = ContentItem.objects.filter(placeholder=placeholder).translated('nl').order_by('sort_order')
+        self.assertEqual([(item.html, item.sort_order) for item in items], [('nl1', 1), ('en1', 2), ('en2', 3)])
+        self.assertEqual(ContentItem.objects.filter(placeholder=placeholder).translated('en').count(), 2)
+
+    def test_bulk_create_items(self):
+        """
+        Different content item types can be inserted at once.
+        """
+        shared = SharedContent.objects.language('en').create(slug='bulk', title='EN')
+        placeholder = Placeholder.objects.create_for_object(shared, 'shared_content')
+        placeholder = Placeholder.objects.get(pk=placeholder.pk)  # Test without cached parent
+        cache_key = get_placeholder_items_cache_key(placeholder.pk, 'en')
+        cache.set(cache_key, [])
+
+        with translation.override('en'):
+            items = ContentItem.objects.bulk_create_items([
+                RawHtmlTestItem(placeholder=placeholder, html='html1', sort_order=1),
+                TimeoutTestItem(placeholder=placeholder, html='html2', sort_order=2),
+                RawHtmlTestItem(placeholder=placeholder, html='html3', sort_order=3, language_code='nl'),
+            ])
+        self.assertTrue(all(item.pk for item in items))
+        self.assertIsNone(cache.get(cache_key))
+
+        items = list(ContentItem.objects.filter(placeholder=placeholder))
+        self.assertEqual([(item.__class__, item.html, item.language_code, item.parent_id) for item in items], [
+            (RawHtmlTestItem, 'html1', 'en', shared.pk),
+            (TimeoutTestItem, 'html2', 'en', shared.pk),
+            (RawHtmlTestItem, 'html3', 'nl', shared.pk),
+        ])
@@ -3,8 +3,11 @@ from django.core.urlresolvers import reverse
 from django.http import HttpResponseRedirect
 from django.template import Template
 from django.test import RequestFactory
+from django.utils.translation import get_language
 
 from fluent_contents import rendering
+from fluent_contents.cache import get_rendering_cache_key, get_placeholder_cache_key
+from fluent_contents.extensions import plugin_pool, pluginbase
 from fluent_contents.extensions import PluginContext
 from fluent_contents.models import Placeholder, DEFAULT_TIMEOUT
 from fluent_contents.rendering import utils as rendering_utils
@@ -67,6 +70,98 @@ class RenderingTests(AppTestCase):
         self.assertIsInstance(response, HttpResponseRedirect)
         self.assertTrue(response['Location'].endswith('/contact/success/'))
 
+    def test_render_fingerprint(self):
+        """
+        The cache keys should change when the plugin code or templates change.
+        """
+        placeholder = factories.create_placeholder()
+        item = factories.create_content_item(MediaTestItem, placeholder=placeholder, html='FINGERPRINT_TEST')
+        plugin = item.plugin
+
+        item_key = get_rendering_cache_key(placeholder.slot, item)
+        placeholder_key = get_placeholder_cache_key(placeholder, item.language_code)
+        self.assertTrue(item_key.endswith(plugin.fingerprint))
+        self.assertTrue(placeholder_key.endswith(plugin_pool.get_fingerprint()))
+
+        old_fingerprint = plugin.fingerprint
+        try:
+            plugin._fingerprint = 'deployed'
+            plugin_pool._fingerprint = None
+            self.assertNotEqual(get_rendering_cache_key(placeholder.slot, item), item_key)
+            self.assertNotEqual(get_placeholder_cache_key(placeholder, item.language_code), placeholder_key)
+        finally:
+            plugin._fingerprint = old_fingerprint
+            plugin_pool._fingerprint = None
+
+    def test_render_context_processors_once(self):
+        """
+        The context processors should only run once per request.
+        """
+        calls = []
+
+        def counting_processor(request):
+            calls.append(request)
+            return {'counted': True}
+
+        old_processors = pluginbase._STANDARD_REQUEST_CONTEXT_PROCESSORS
+        pluginbase._STANDARD_REQUEST_CONTEXT_PROCESSORS = (counting_processor,)
+        try:
+            request = RequestFactory().get('/')
+            context = PluginContext(request)
+            self.assertTrue(context['counted'])
+            context['counted'] = False
+            self.assertTrue(PluginContext(request)['counted'])
+            self.assertEqual(len(calls), 1)
+        finally:
+            pluginbase._STANDARD_REQUEST_CONTEXT_PROCESSORS = old_processors
+
+    def test_render_without_context_processors(self):
+        """
+        Plugins with use_context_processors = False should render without running the context processors.
+        """
+        calls = []
+
+        def counting_processor(request):
+            calls.append(request)
+            return {'counted': True}
+
+        placeholder = factories.create_placeholder()
+        item = factories.create_content_item(MediaTestItem, placeholder=placeholder, html='<b>media</b>')
+        plugin = item.plugin
+
+        old_processors = pluginbase._STANDARD_REQUEST_CONTEXT_PROCESSORS
+        pluginbase._STANDARD_REQUEST_CONTEXT_PROCESSORS = (counting_processor,)
+        plugin.use_context_processors = False
+        try:
+            request = RequestFactory().get('/')
+            self.assertEqual(plugin.render(request, item).strip(), u'<b>media</b>')
+            self.assertEqual(calls, [])
+
+            plugin.use_context_processors = True
+            self.assertEqual(plugin.render(request, item).strip(), u'<b>media</b>')
+            self.assertEqual(len(calls), 1)
+        finally:
+            del plugin.use_context_processors
+            pluginbase._STANDARD_REQUEST_CONTEXT_PROCESSORS = old_processors
+
+    def test_render_language_groups(self):
+        """
+        Items are rendered in their own language, while keeping the original ordering.
+        """
+        placeholder = factories.create_placeholder()
+        item1 = factories.create_content_item(RawHtmlTestItem, placeholder=placeholder, html='1', sort_order=1, language_code='en')
+        item2 = factories.create_content_item(RawHtmlTestItem, placeholder=placeholder, html='2', sort_order=2, language_code='nl')
+        item3 = factories.create_content_item(RawHtmlTestItem, placeholder=placeholder, html='3', sort_order=3, language_code='en')
+
+        plugin = item1.plugin
+        plugin.render = lambda request, instance, **kwargs: u"{0}:{1};".format(instance.html, get_language())
+        try:
+            output = rendering.render_content_items(self.dummy_request, [item1, item2, item3])
+        finally:
+            del plugin.render
+
+        self.assertEqual(output.html, u'1:en;2:nl;3:en;')
+
     def test_debug_is_method_overwritten(self):
         """
         Test the "is method overwritten" logic to detect template changes
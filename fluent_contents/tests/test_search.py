@@ -1,8 +1,14 @@
-from fluent_contents.models import Placeholder
+from django.utils.safestring import SafeData
+from fluent_contents import appsettings
+from fluent_contents.extensions import plugin_pool
+from fluent_contents.models import Placeholder, PlaceholderSearchText
+from fluent_contents.rendering import render_search_text_bulk
 from fluent_contents.plugins.picture.models import PictureItem
+from fluent_contents.plugins.sharedcontent.models import SharedContent, SharedContentItem
 from fluent_contents.plugins.text.models import TextItem
 from fluent_contents.tests.testapp.models import TestPage, RawHtmlTestItem
 from fluent_contents.tests.utils import AppTestCase
+from fluent_contents.utils.search import get_cleaned_string
 
 
 class SearchTest(AppTestCase):
@@ -39,3 +45,89 @@ class SearchTest(AppTestCase):
 
         PictureItem.objects.create_for_placeholder(placeholder, caption=u"<b>caption</b>", sort_order=1)
         self.assertEqual(placeholder.get_search_text(), u"caption")
+
+    def test_search_text_bulk(self):
+        """
+        Test: The search text of many parents can be rendered at once.
+        """
+        page1 = TestPage.objects.create(pk=20, contents="Search!")
+        page2 = TestPage.objects.create(pk=21, contents="Search 2!")
+        page3 = TestPage.objects.create(pk=22, contents="Empty")
+        placeholder1a = Placeholder.objects.create_for_object(page1, 'slot1')
+        placeholder1b = Placeholder.objects.create_for_object(page1, 'slot2')
+        placeholder2 = Placeholder.objects.create_for_object(page2, 'slot2')
+        TextItem.objects.create_for_placeholder(placeholder1a, text=u'<b>Item1!</b>', sort_order=1)
+        PictureItem.objects.create_for_placeholder(placeholder1a, caption=u"caption", sort_order=2)
+        TextItem.objects.create_for_placeholder(placeholder1b, text=u'Item2!', sort_order=1)
+        TextItem.objects.create_for_placeholder(placeholder2, text=u'Item3!', sort_order=1)
+
+        results = list(render_search_text_bulk(TestPage.objects.order_by('pk'), chunk_size=2))
+        self.assertEqual([(parent, text.strip()) for parent, text in results], [
+            (page1, u"Item1! caption Item2!"),
+            (page2, u"Item3!"),
+            (page3, u""),
+        ])
+
+        results = list(render_search_text_bulk([page1], slots=['slot2', 'slot1']))
+        self.assertEqual(results[0][1].strip(), u"Item2! Item1! caption")
+
+    def test_search_text_stored(self):
+        """
+        Test: The search text can be stored, and is removed when the items change.
+        """
+        page = TestPage.objects.create(pk=20, contents="Search!")
+        placeholder = Placeholder.objects.create_for_object(page, 'slot2')
+        item = TextItem.objects.create_for_placeholder(placeholder, text=u'<b>Item1!</b>', sort_order=1)
+
+        old_value = appsettings.FLUENT_CONTENTS_STORE_SEARCH_TEXT
+        appsettings.FLUENT_CONTENTS_STORE_SEARCH_TEXT = True
+        try:
+            self.assertEqual(placeholder.get_search_text().rstrip(), u"Item1!")
+            self.assertEqual(PlaceholderSearchText.objects.get(placeholder=placeholder).text.rstrip(), u"Item1!")
+            with self.assertNumQueries(1):
+                self.assertEqual(placeholder.get_search_text().rstrip(), u"Item1!")
+            with self.assertNumQueries(2):
+                self.assertEqual(list(render_search_text_bulk([page]))[0][1].rstrip(), u"Item1!")
+
+            # Deploying changed plugins ignores the stored text.
+            PlaceholderSearchText.objects.update(text=u"Old!")
+            old_fingerprint = plugin_pool._fingerprint
+            plugin_pool._fingerprint = 'deployed'
+            try:
+                self.assertEqual(placeholder.get_search_text().rstrip(), u"Item1!")
+                self.assertEqual(list(render_search_text_bulk([page]))[0][1].rstrip(), u"Item1!")
+            finally:
+                plugin_pool._fingerprint = old_fingerprint
+
+            item.text = u'Item2!'
+            item.save()
+            self.assertFalse(PlaceholderSearchText.objects.exists())
+            self.assertEqual(placeholder.get_search_text().rstrip(), u"Item2!")
+
+            # Items which depend on other objects are rendered each time.
+            shared_content = SharedContent.objects.create(slug='foo')
+            Placeholder.objects.create_for_object(shared_content, 'shared_content')
+            SharedContentItem.objects.create_for_placeholder(placeholder, shared_content=shared_content, sort_order=2)
+            self.assertEqual(placeholder.get_search_text().rstrip(), u"Item2!")
+            self.assertFalse(PlaceholderSearchText.objects.exists())
+        finally:
+            appsettings.FLUENT_CONTENTS_STORE_SEARCH_TEXT = old_value
+
+    def test_cleaned_string(self):
+        """
+        Test: The HTML is converted to words, without the contents of scripts.
+        """
+        self.assertEqual(
+            get_cleaned_string(u'<p>Hello&nbsp;<b>world</b> &amp;\n  co</p><p>Next<br>line</p>'
+                               u'<script>var a = "<b>";</script><style>p {}</style>&lt;tag&gt; &#233;'),
+            u'Hello world & co Next line <tag> \xe9'
+        )
+        self.assertEqual(get_cleaned_string(u'<a title="1 > 0">A</a><template><p>T</p></template><!-- C --><p>B</p>'), u'A B')
+
+        page = TestPage.objects.create(pk=20, contents="Search!")
+        placeholder = Placeholder.objects.create_for_object(page, 'slot2')
+        TextItem.objects.create_for_placeholder(placeholder, text=u'<p>&lt;script&gt; &amp; caf&eacute;</p>', sort_order=1)
+        text = placeholder.get_search_text()
+        self.assertEqual(text.strip(), u"<script> & caf\xe9")
+        self.assertNotIsInstance(text, SafeData)  # Should be escaped when it's displayed.
+        self.assertEqual(list(render_search_text_bulk([page]))[0][1].strip(), u"<script> & caf\xe9")
@@ -0,0 +1,80 @@
+from django.db import connection
+from django.utils.translation import get_language
+from fluent_contents.models import Placeholder
+from fluent_contents.plugins.text.models import TextItem
+from fluent_contents.searchindex import search, store_search_text
+from fluent_contents.searchindex.backends import BasicBackend, SQLiteFTS5Backend, _has_fts5, get_backend
+from fluent_contents.searchindex.models import SearchDocument
+from fluent_contents.tests.testapp.models import TestPage
+from fluent_contents.tests.utils import AppTestCase
+
+
+def run_on_commit():
+    # TestCase never commits, run the pending callbacks.
+    callbacks, connection.run_on_commit = connection.run_on_commit, []
+    for sids, func in callbacks:
+        func()
+
+
+class SearchIndexTest(AppTestCase):
+    """
+    Tests for the search index.
+    """
+
+    def test_search(self):
+        """
+        Test: The index is updated when the transaction commits, and the results are ranked.
+        """
+        page1 = TestPage.objects.create(pk=20, contents="Page1")
+        page2 = TestPage.objects.create(pk=21, contents="Page2")
+        placeholder1 = Placeholder.objects.create_for_object(page1, 'slot1')
+        placeholder2 = Placeholder.objects.create_for_object(page2, 'slot1')
+        TextItem.objects.create_for_placeholder(placeholder1, text=u'<p>Caf&eacute; opening hours</p>', sort_order=1)
+        item = TextItem.objects.create_for_placeholder(placeholder2, text=u'<p>Opening hours, opening times</p>', sort_order=1)
+        self.assertFalse(SearchDocument.objects.exists())
+
+        run_on_commit()
+        self.assertEqual(SearchDocument.objects.get(parent_id=20).text, u"Caf\xe9 opening hours")
+        self.assertEqual(search(u"opening"), [page2, page1])
+        self.assertEqual(search(u"open HOURS"), [page2, page1])
+        if _has_fts5(connection):
+            self.assertEqual(search(u"cafe"), [page1])  # FTS5 ignores the diacritics.
+        self.assertEqual(search(u"caf\xe9 times"), [])
+        self.assertEqual(search(u'"" AND *'), [])
+        self.assertEqual(search(u"opening", language_code='nl'), [])
+        self.assertEqual(search(u"opening", models=[Placeholder]), [])
+
+        item.text = u'Closed'
+        item.save()
+        run_on_commit()
+        self.assertEqual(search(u"opening"), [page1])
+
+        page1.delete()
+        run_on_commit()
+        self.assertEqual(search(u"opening"), [])
+
+    def test_search_backends(self):
+        """
+        Test: The full-text index and the basic search find the same objects.
+        """
+        if not _has_fts5(connection):
+            self.skipTest("SQLite is compiled without FTS5")
+        self.assertIsInstance(get_backend(connection.alias), SQLiteFTS5Backend)
+
+        page1 = TestPage.objects.create(pk=20, contents="Page1")
+        page2 = TestPage.objects.create(pk=21, contents="Page2")
+        store_search_text(TestPage, page1.pk, u"Opening hours today")
+        store_search_text(TestPage, page2.pk, u"Opening hours, opening times")
+
+        language_code = get_language()
+        for backend in (SQLiteFTS5Backend(connection.alias), BasicBackend(connection.alias)):
+            parent_ids = [parent_id for parent_type_id, parent_id in backend.search([u"opening"], language_code)]
+            self.assertEqual(parent_ids, [21, 20])
+            parent_ids = [parent_id for parent_type_id, parent_id in backend.search([u"opening", u"hour"], language_code)]
+            self.assertEqual(parent_ids, [21, 20])
+            parent_ids = [parent_id for parent_type_id, parent_id in backend.search([u"times"], language_code)]
+            self.assertEqual(parent_ids, [21])
+
+        # Empty texts remove the object from the index.
+        store_search_text(TestPage, page2.pk, u"")
+        self.assertEqual(search(u"opening"), [page1])
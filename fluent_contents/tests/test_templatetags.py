@@ -3,10 +3,13 @@ from django.contrib.auth.models import AnonymousUser
 from django.core.cache import cache
 from django.template import Template, Context, VariableDoesNotExist, TemplateSyntaxError
 from django.test import RequestFactory
+from django.utils import translation
 from template_analyzer import get_node_instances
 
 from fluent_contents import appsettings
 from fluent_contents.models import Placeholder
+from fluent_contents.plugins.sharedcontent.cache import get_shared_content_cache_key_ptr
+from fluent_contents.plugins.sharedcontent.models import SharedContent, SharedContentItem
 from fluent_contents.templatetags.fluent_contents_tags import PagePlaceholderNode
 from fluent_contents.tests.testapp.models import TestPage, RawHtmlTestItem, PlaceholderFieldTestPage
 from fluent_contents.tests.utils import AppTestCase
@@ -23,6 +26,159 @@ class TemplateTagTests(AppTestCase):
         'fluent_contents.tests.testapp',
     )
 
+    def test_page_placeholder_missing(self):
+        """
+        Missing and empty placeholders should not query the database every time.
+        """
+        page4 = PlaceholderFieldTestPage.objects.create()
+        appsettings.FLUENT_CONTENTS_CACHE_OUTPUT = True
+        appsettings.FLUENT_CONTENTS_CACHE_PLACEHOLDER_OUTPUT = False
+        cache.clear()
+
+        # First time:
+        # - fetch Placeholder
+        with self.assertNumQueries(1):
+            html = self._render("""{% load fluent_contents_tags %}{% page_placeholder 'field_slot1' %}""", {'page': page4})
+            self.assertEqual(html, u"<!-- placeholder 'field_slot1' does not yet exist -->")
+
+        # Second time, the missing placeholder is cached
+        with self.assertNumQueries(0):
+            html = self._render("""{% load fluent_contents_tags %}{% page_placeholder 'field_slot1' %}""", {'page': page4})
+            self.assertEqual(html, u"<!-- placeholder 'field_slot1' does not yet exist -->")
+
+        # Creating the placeholder clears the cache.
+        # - fetch Placeholder
+        # - fetch ContentItem
+        placeholder1 = Placeholder.objects.create_for_object(page4, 'field_slot1')
+        with self.assertNumQueries(2):
+            html = self._render("""{% load fluent_contents_tags %}{% page_placeholder 'field_slot1' %}""", {'page': page4})
+            self.assertEqual(html, u"<!-- no items in placeholder 'field_slot1' -->")
+
+        # The empty placeholder is cached too
+        with self.assertNumQueries(0):
+            html = self._render("""{% load fluent_contents_tags %}{% page_placeholder 'field_slot1' %}""", {'page': page4})
+            self.assertEqual(html, u"<!-- no items in placeholder 'field_slot1' -->")
+
+        # Adding the first item clears the cache
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder1, html='<b>Item1!</b>', sort_order=1)
+        html = self._render("""{% load fluent_contents_tags %}{% page_placeholder 'field_slot1' %}""", {'page': page4})
+        self.assertEqual(html, u'<b>Item1!</b>')
+
+    def test_sharedcontent(self):
+        """
+        The sharedcontent tags should fetch the output with a single cache call.
+        """
+        appsettings.FLUENT_CONTENTS_CACHE_OUTPUT = True
+        appsettings.FLUENT_CONTENTS_CACHE_PLACEHOLDER_OUTPUT = True
+        cache.clear()
+        template = """{% load sharedcontent_tags %}{% sharedcontent "footer1" %}|{% sharedcontent "footer2" %}"""
+
+        for slug in ('footer1', 'footer2'):
+            shared = SharedContent.objects.language('en').create(slug=slug, title=slug)
+            placeholder = Placeholder.objects.create_for_object(shared, 'shared_content')
+            RawHtmlTestItem.objects.create_for_placeholder(placeholder, html=u'<b>{0}</b>'.format(slug), language_code='en')
+
+        with translation.override('en'):
+            html = self._render(template, {})
+            self.assertEqual(html, u'<b>footer1</b>|<b>footer2</b>')
+
+            # Second time, both blocks are fetched from a single get_many()
+            with self.assertNumQueries(0):
+                html = self._render(template, {})
+                self.assertEqual(html, u'<b>footer1</b>|<b>footer2</b>')
+
+            # Changing an item clears the output
+            item = RawHtmlTestItem.objects.get(html=u'<b>footer2</b>')
+            item.html = u'<b>footer2b</b>'
+            item.save()
+            html = self._render(template, {})
+            self.assertEqual(html, u'<b>footer1</b>|<b>footer2b</b>')
+
+            # Moving an item into the shared content also clears the output, no post_save is sent there.
+            page = PlaceholderFieldTestPage.objects.create()
+            page_placeholder = Placeholder.objects.create_for_object(page, 'field_slot1')
+            RawHtmlTestItem.objects.create_for_placeholder(page_placeholder, html=u'<i>moved</i>', language_code='en')
+            RawHtmlTestItem.objects.filter(placeholder=page_placeholder).move_to_placeholder(
+                Placeholder.objects.get_by_slot(SharedContent.objects.get(slug='footer1'), 'shared_content'), sort_order=2
+            )
+            html = self._render(template, {})
+            self.assertEqual(html, u'<b>footer1</b><i>moved</i>|<b>footer2b</b>')
+
+    def test_sharedcontent_dependencies(self):
+        """
+        Placeholders that include shared content should be cached, and cleared when the shared content changes.
+        """
+        appsettings.FLUENT_CONTENTS_CACHE_OUTPUT = True
+        appsettings.FLUENT_CONTENTS_CACHE_PLACEHOLDER_OUTPUT = True
+        cache.clear()
+        template = """{% load fluent_contents_tags %}{% page_placeholder 'field_slot1' %}"""
+
+        shared = SharedContent.objects.language('en').create(slug='sidebar', title='Sidebar')
+        shared_placeholder = Placeholder.objects.create_for_object(shared, 'shared_content')
+        shared_item = RawHtmlTestItem.objects.create_for_placeholder(shared_placeholder, html=u'<b>Shared!</b>', language_code='en')
+
+        page5 = PlaceholderFieldTestPage.objects.create()
+        placeholder1 = Placeholder.objects.create_for_object(page5, 'field_slot1')
+        SharedContentItem.objects.create_for_placeholder(placeholder1, shared_content=shared, sort_order=1)
+
+        with translation.override('en'):
+            html = self._render(template, {'page': page5})
+            self.assertEqual(html, u'<b>Shared!</b>')
+
+            # The full placeholder is cached.
+            with self.assertNumQueries(0):
+                html = self._render(template, {'page': page5})
+                self.assertEqual(html, u'<b>Shared!</b>')
+
+            # Changing the shared content clears the placeholder of the page.
+            shared_item.html = u'<b>Updated!</b>'
+            shared_item.save()
+            html = self._render(template, {'page': page5})
+            self.assertEqual(html, u'<b>Updated!</b>')
+
+            # Deleting the shared content removes it from the page.
+            shared.delete()
+            html = self._render(template, {'page': page5})
+            self.assertEqual(html, u"<!-- no items in placeholder 'field_slot1' -->")
+
+    def test_sharedcontent_nested(self):
+        """
+        Changing shared content should clear the placeholders that include it, also via other shared content.
+        """
+        appsettings.FLUENT_CONTENTS_CACHE_OUTPUT = True
+        appsettings.FLUENT_CONTENTS_CACHE_PLACEHOLDER_OUTPUT = True
+        cache.clear()
+        template = """{% load fluent_contents_tags %}{% page_placeholder 'field_slot1' %}"""
+
+        inner = SharedContent.objects.language('en').create(slug='inner', title='Inner')
+        inner_item = RawHtmlTestItem.objects.create_for_placeholder(
+            Placeholder.objects.create_for_object(inner, 'shared_content'), html=u'<b>Inner</b>', language_code='en'
+        )
+        outer = SharedContent.objects.language('en').create(slug='outer', title='Outer')
+        outer_placeholder = Placeholder.objects.create_for_object(outer, 'shared_content')
+        SharedContentItem.objects.create_for_placeholder(outer_placeholder, shared_content=inner, language_code='en')
+
+        pages = []
+        for i in range(3):
+            page = PlaceholderFieldTestPage.objects.create()
+            placeholder = Placeholder.objects.create_for_object(page, 'field_slot1')
+            SharedContentItem.objects.create_for_placeholder(placeholder, shared_content=outer, sort_order=1)
+            pages.append(page)
+
+        # A query for the items and placeholders per nesting level, and one for the parents.
+        with self.assertNumQueries(5):
+            keys = inner.get_cache_keys()
+        self.assertIn(get_shared_content_cache_key_ptr(outer.parent_site_id, 'outer', 'en'), keys)
+
+        with translation.override('en'):
+            html = self._render(template, {'page': pages[2]})
+            self.assertEqual(html, u'<b>Inner</b>')
+
+            inner_item.html = u'<b>Updated!</b>'
+            inner_item.save()
+            html = self._render(template, {'page': pages[2]})
+            self.assertEqual(html, u'<b>Updated!</b>')
+
     def test_page_placeholder_metadata(self):
         """
         The ``page_placeholder`` tag should expose metadata, which ``fluent_contents.analyzer`` can read.
@@ -162,26 +318,33 @@ class TemplateTagTests(AppTestCase):
             #pprint(ctx.captured_queries)
 
         # Second time
-        # - fetch ContentItem
-        with self.assertNumQueries(1) as ctx:
+        # - ContentItem list is cached
+        with self.assertNumQueries(0) as ctx:
             self._render("""{% load fluent_contents_tags %}{% render_placeholder placeholder1 %}""", {'placeholder1': placeholder1})
             #pprint(ctx.captured_queries)
 
         # Using page_placeholder
         # - fetch Placeholder
-        # - fetch ContentItem
-        with self.assertNumQueries(2) as ctx:
+        # - ContentItem list is cached
+        with self.assertNumQueries(1) as ctx:
             self._render("""{% load fluent_contents_tags %}{% page_placeholder 'field_slot1' %}""", {'page': page3})
             #pprint(ctx.captured_queries)
 
         # Using page_placeholder, use fallback
-        # - fetch Placeholder
-        # - fetch ContentItem
-        # - fetch ContentItem fallback
-        with self.assertNumQueries(2) as ctx:
+        # - Placeholder lookup is cached
+        # - ContentItem list is cached
+        with self.assertNumQueries(0) as ctx:
             self._render("""{% load fluent_contents_tags %}{% page_placeholder 'field_slot1' fallback=True %}""", {'page': page3})
             #pprint(ctx.captured_queries)
 
+        # Adding an item clears the ContentItem list
+        # - fetch ContentItem
+        # - fetch RawHtmlTestItem
+        RawHtmlTestItem.objects.create_for_placeholder(placeholder1, html='<b>Item3!</b>', sort_order=3)
+        with self.assertNumQueries(2) as ctx:
+            html = self._render("""{% load fluent_contents_tags %}{% page_placeholder 'field_slot1' %}""", {'page': page3})
+            self.assertEqual(html, u'<b>Item1!</b><b>Item2!</b><b>Item3!</b>')
+
     def test_num_placeholder_queries(self):
         page3 = PlaceholderFieldTestPage.objects.create()
         placeholder1 = Placeholder.objects.create_for_object(page3, 'field_slot1')
@@ -1,7 +1,8 @@
 from django.http import HttpResponseRedirect
 from django.utils.safestring import mark_safe
 from fluent_contents.extensions import ContentPlugin, plugin_pool
-from fluent_contents.tests.testapp.models import RawHtmlTestItem, TimeoutTestItem, MediaTestItem, RedirectTestItem
+from fluent_contents.tests.testapp.models import RawHtmlTestItem, TimeoutTestItem, MediaTestItem, RedirectTestItem, \
+    M2MTestItem
 
 
 @plugin_pool.register
@@ -60,3 +61,14 @@ class RedirectTestPlugin(ContentPlugin):
         # Since this call happens inside a template render, the code flow
         # is interrupted by an exception that is handled in middleware.
         return HttpResponseRedirect('/contact/success/')
+
+
+@plugin_pool.register
+class M2MTestPlugin(ContentPlugin):
+    """
+    Testing a plugin with a many-to-many relation.
+    """
+    model = M2MTestItem
+
+    def render(self, request, instance, **kwargs):
+        return mark_safe(u", ".join(page.contents for page in instance.pages.all()))
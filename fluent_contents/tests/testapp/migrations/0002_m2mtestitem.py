@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('testapp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='M2MTestItem',
+            fields=[
+                ('contentitem_ptr', models.OneToOneField(parent_link=True, auto_created=True, primary_key=True, serialize=False, to='fluent_contents.ContentItem')),
+                ('title', models.CharField(max_length=200, verbose_name='Title')),
+                ('pages', models.ManyToManyField(to='testapp.TestPage', blank=True)),
+            ],
+            options={
+                'db_table': 'contentitem_testapp_m2mtestitem',
+                'verbose_name': 'M2M test',
+                'verbose_name_plural': 'M2M test',
+            },
+            bases=('fluent_contents.contentitem',),
+        ),
+    ]
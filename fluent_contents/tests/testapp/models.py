@@ -108,3 +108,20 @@ class RedirectTestItem(ContentItem):
 
     def __str__(self):
         return self.html
+
+
+@python_2_unicode_compatible
+class M2MTestItem(ContentItem):
+    """
+    A content item with a many-to-many relation, for testing.
+    """
+    title = models.CharField("Title", max_length=200)
+    pages = models.ManyToManyField(TestPage, blank=True)
+
+    class Meta:
+        app_label = 'testapp'
+        verbose_name = 'M2M test'
+        verbose_name_plural = 'M2M test'
+
+    def __str__(self):
+        return self.title
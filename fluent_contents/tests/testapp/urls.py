@@ -7,7 +7,8 @@ admin.autodiscover()
 
 urlpatterns = [
     url(r'^admin/', include(admin.site.urls)),
-    url(r'^testpage/(?P<pk>\d+)/$', views.TestPageView.as_view(), name='testpage')
+    url(r'^testpage/(?P<pk>\d+)/$', views.TestPageView.as_view(), name='testpage'),
+    url(r'^code/', include('fluent_contents.plugins.code.urls')),
 
     #url(r'^comments/', include('django.contrib.comments.urls')),
     #url(r'^forms/', include('form_designer.urls')),
@@ -6,6 +6,10 @@ Plugins may call these functions during form input clean/validation.
 """
 from django.core.exceptions import ValidationError
 from fluent_contents import appsettings
+from fluent_contents.utils.memo import LRUCache, get_content_hash
+
+# The results of the filters which are marked as ``memoize``.
+_filter_results = LRUCache(maxsize=1000)
 
 
 def apply_filters(instance, html, field_name):
@@ -52,7 +56,7 @@ def apply_pre_filters(instance, html):
     """
     # Allow pre processing. Typical use-case is HTML syntax correction.
     for post_func in appsettings.PRE_FILTER_FUNCTIONS:
-        html = post_func(instance, html)
+        html = _apply_filter(post_func, instance, html)
 
     return html
 
@@ -66,6 +70,22 @@ def apply_post_filters(instance, html):
     :raise ValidationError: when one of the filters detects a problem.
     """
     for post_func in appsettings.POST_FILTER_FUNCTIONS:
-        html = post_func(instance, html)
+        html = _apply_filter(post_func, instance, html)
 
     return html
+
+
+def _apply_filter(func, instance, html):
+    """
+    Run a single filter. The results of filters with ``memoize = True``
+    are remembered by the hash of the text and the language.
+    """
+    if not getattr(func, 'memoize', False):
+        return func(instance, html)
+
+    key = (func, get_content_hash(html), instance.language_code)
+    result = _filter_results.get(key)
+    if result is None:
+        result = func(instance, html)
+        _filter_results.set(key, result)
+    return result
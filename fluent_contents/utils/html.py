@@ -6,22 +6,36 @@ These are used when FLUENT_TEXT_CLEANUP_HTML or FLUENT_TEXT_SANITIZE_HTML are en
 These are extracted from django-wysiwyg, so they can be used by default for all HTML fields.
 It simplifies the dependencies a bit; html5lib can be directly mentioned as dependency.
 """
+import threading
 import warnings
 
 from html5lib import treebuilders, treewalkers, HTMLParser
 from html5lib.serializer import HTMLSerializer
+from fluent_contents import appsettings
+from fluent_contents.utils.memo import LRUCache, get_content_hash
 
 try:
     from html5lib.sanitizer import HTMLSanitizer
 except ImportError:
     HTMLSanitizer = None
 
+# The results of clean_html(), by the hash of the input.
+# Admin forms and full_clean() clean the same texts over and over again.
+_cleaned_html = LRUCache(maxsize=1000)
 
-def clean_html(input, sanitize=False):
+# The parser and serializer can be reused, but not shared between threads.
+_local = threading.local()
+
+
+def clean_html(input, sanitize=False, backend=None):
     """
     Takes an HTML fragment and processes it using html5lib to ensure that the HTML is well-formed.
 
+    .. versionchanged:: 1.3
+       The results are remembered by the hash of the input, and the parser is reused.
+
     :param sanitize: Remove unwanted HTML tags and attributes.
+    :param backend: The html5lib tree type, defaults to the :ref:`FLUENT_TEXT_CLEAN_HTML_BACKEND` setting.
 
     >>> clean_html("<p>Foo<b>bar</b></p>")
     u'<p>Foo<b>bar</b></p>'
@@ -30,6 +44,31 @@ def clean_html(input, sanitize=False):
     >>> clean_html('<p>Foo<b>bar</b>& oops<a href="#foo&bar">This is a <>link</a></p>')
     u'<p>Foo<b>bar</b>&amp; oops<a href=#foo&amp;bar>This is a &lt;&gt;link</a></p>'
     """
+    backend = backend or appsettings.FLUENT_TEXT_CLEAN_HTML_BACKEND
+    key = (get_content_hash(input), bool(sanitize), backend)
+    output = _cleaned_html.get(key)
+    if output is None:
+        parser, walker, serializer = _get_html5lib_objects(bool(sanitize), backend)
+        dom_tree = parser.parseFragment(input)
+        output = "".join(serializer.serialize(walker(dom_tree)))
+        _cleaned_html.set(key, output)
+    return output
+
+
+def _get_html5lib_objects(sanitize, backend):
+    """
+    Return the parser, tree walker and serializer for the current thread.
+    """
+    try:
+        objects = _local.objects
+    except AttributeError:
+        objects = _local.objects = {}
+
+    try:
+        return objects[(sanitize, backend)]
+    except KeyError:
+        pass
+
     parser_kwargs = {}
     serializer_kwargs = {}
     if sanitize:
@@ -39,13 +78,11 @@ def clean_html(input, sanitize=False):
         else:
             parser_kwargs['tokenizer'] = HTMLSanitizer
 
-    p = HTMLParser(tree=treebuilders.getTreeBuilder("dom"), **parser_kwargs)
-    dom_tree = p.parseFragment(input)
-    walker = treewalkers.getTreeWalker("dom")
-    stream = walker(dom_tree)
-
-    s = HTMLSerializer(omit_optional_tags=False, **serializer_kwargs)
-    return "".join(s.serialize(stream))
+    parser = HTMLParser(tree=treebuilders.getTreeBuilder(backend), **parser_kwargs)
+    walker = treewalkers.getTreeWalker(backend)
+    serializer = HTMLSerializer(omit_optional_tags=False, **serializer_kwargs)
+    objects[(sanitize, backend)] = (parser, walker, serializer)
+    return parser, walker, serializer
 
 
 def sanitize_html(input):
@@ -0,0 +1,51 @@
+"""
+Internal utilities to remember the results of expensive functions in memory.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.utils.encoding import force_bytes
+
+
+def get_content_hash(text):
+    """
+    Return a short key for a (possibly large) text.
+    """
+    return hashlib.sha1(force_bytes(text)).hexdigest()
+
+
+class LRUCache(object):
+    """
+    A dictionary that only keeps the most recently used items.
+    It can be shared between threads.
+    """
+
+    def __init__(self, maxsize=1000):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return default
+
+            self._data[key] = value  # Move to the end
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
@@ -1,10 +1,36 @@
 """
 Internal utils for search.
 """
+import re
+
 from django.utils.encoding import force_text
 from django.utils.html import strip_tags
+from django.utils.six.moves import html_parser
 import six
 
+try:
+    from html import unescape  # Python 3.4+
+except ImportError:
+    unescape = html_parser.HTMLParser().unescape
+
+# Tags which separate words, even when there is no whitespace between them.
+_BLOCK_TAGS = frozenset((
+    'address', 'article', 'aside', 'blockquote', 'br', 'caption', 'dd', 'div', 'dl', 'dt',
+    'fieldset', 'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'img', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table',
+    'td', 'th', 'tr', 'ul',
+))
+
+# Tags which don't contain text.
+_SKIP_TAGS = frozenset(('script', 'style', 'template'))
+
+# Regular expressions to remove the tags, which is faster than tokenizing the HTML.
+# Scripts and styles end at the first closing tag, only templates need the tokenizer.
+_RE_ATTRS = r'(?:[^>"\']|"[^"]*"|\'[^\']*\')*'
+_RE_TAG = re.compile(r'<(/?)([a-zA-Z][^\s/>]*)' + _RE_ATTRS + r'>|<!--.*?-->', re.DOTALL)
+_RE_RAW_TEXT = re.compile(r'<(script|style)\b' + _RE_ATTRS + r'>.*?</\1\s*>', re.DOTALL | re.IGNORECASE)
+_RE_SKIP_TAGS = re.compile(r'<(?:script|style|template)\b', re.IGNORECASE)
+
 
 def get_search_field_values(contentitem):
     """
@@ -33,8 +59,35 @@ def get_search_text(contentitem):
 def get_cleaned_string(data):
     """
     Cleanup a string/HTML output to consist of words only.
+
+    .. versionchanged:: 1.3
+       The tags are removed in a single pass. Entities are decoded, whitespace is collapsed
+       and the contents of ``<script>`` and ``<style>`` tags are removed.
+       Note the result is plain text, which should be escaped before it's used as HTML again.
     """
-    return strip_tags(force_text(data))
+    data = force_text(data)
+    if '<' not in data:
+        return u' '.join(unescape(data).split())
+
+    text = _RE_RAW_TEXT.sub(u'', data)
+    if not _RE_SKIP_TAGS.search(text):
+        return u' '.join(unescape(_RE_TAG.sub(_replace_tag, text)).split())
+
+    extractor = _TextExtractor()
+    try:
+        extractor.feed(data)
+        extractor.close()
+    except Exception:  # HTMLParseError in Python 2
+        return u' '.join(strip_tags(data).split())
+
+    # Entities are decoded at once, instead of for each text node.
+    return u' '.join(unescape(u''.join(extractor.bits)).split())
+
+
+def _replace_tag(match):
+    # Block tags separate words, other tags and comments are removed.
+    tag = match.group(2)
+    return u' ' if tag and tag.lower() in _BLOCK_TAGS else u''
 
 
 def clean_join(separator, iterable):
@@ -44,5 +97,46 @@ def clean_join(separator, iterable):
     return separator.join(filter(None, iterable))
 
 
+class _TextExtractor(html_parser.HTMLParser):
+    """
+    Collect the text while tokenizing the HTML.
+    """
+
+    def __init__(self):
+        if six.PY3:
+            html_parser.HTMLParser.__init__(self, convert_charrefs=False)
+        else:
+            html_parser.HTMLParser.__init__(self)
+        self.bits = []
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self.bits.append(u' ')
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in _BLOCK_TAGS:
+            self.bits.append(u' ')
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in _BLOCK_TAGS:
+            self.bits.append(u' ')
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.bits.append(data)
+
+    # The entities are kept as-is, and decoded afterwards.
+    def handle_entityref(self, name):
+        self.handle_data(u'&{0};'.format(name))
+
+    def handle_charref(self, name):
+        self.handle_data(u'&#{0};'.format(name))
+
+
 #def get_cleaned_bits(data):
 #    return smart_split(get_cleaned_bits(data))
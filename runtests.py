@@ -77,6 +77,7 @@ if not settings.configured:
             'fluent_contents.plugins.sharedcontent',
             'fluent_contents.plugins.text',
             #'fluent_contents.plugins.twitterfeed',
+            'fluent_contents.searchindex',
             #'disqus',
             'django_wysiwyg',
             #'form_designer',
@@ -94,6 +95,7 @@ if not settings.configured:
         SITE_ID = 3,
         FLUENT_CONTENTS_CACHE_OUTPUT = True,
         FLUENT_CONTENTS_CACHE_PLACEHOLDER_OUTPUT = True,
+        FLUENT_CONTENTS_CACHE_CLEAR_ON_COMMIT = False,  # TestCase never commits
         #DISQUS_API_KEY = 'test',
         #DISQUS_WEBSITE_SHORTNAME = 'test',
         STATIC_URL = '/static/',